@@ -0,0 +1,53 @@
+"""Measures the startup cost of the package, as paid by every worker process of a batch job.
+
+Each measurement runs in a fresh interpreter. pandas and numpy are imported first and timed separately, so the
+figure for scripts is what the package itself adds.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_import_time
+"""
+import subprocess
+import sys
+
+REPEATS = 5
+
+TARGETS = {
+    "flutter + parachute": "from scripts import howard_cfv, sahr_cfv, bennet_cfv, calc_chute_diameter, parachute_sweep",
+    "DataHandler": "from scripts import DataHandler",
+    "everything": "from scripts import *",
+}
+
+PROBE = """
+import time
+start = time.perf_counter()
+import numpy, pandas
+dependencies = time.perf_counter()
+{statement}
+end = time.perf_counter()
+print(dependencies - start, end - dependencies)
+"""
+
+
+def measure(statement: str) -> tuple:
+    runs = []
+    for _ in range(REPEATS):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement)],
+                                capture_output=True, text=True, check=True).stdout
+        runs.append(tuple(float(value) for value in output.split()))
+    return min(run[0] for run in runs), min(run[1] for run in runs)
+
+
+def main():
+    for name, statement in TARGETS.items():
+        dependencies, package = measure(statement)
+        print(f"{name:>20}: {package * 1000:7.1f} ms  (numpy + pandas: {dependencies * 1000:.0f} ms)")
+    try:
+        _, sympy_seconds = measure("import sympy")
+        print(f"{'sympy (for reference)':>20}: {sympy_seconds * 1000:7.1f} ms")
+    except subprocess.CalledProcessError:
+        pass
+
+
+if __name__ == "__main__":
+    main()
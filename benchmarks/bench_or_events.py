@@ -0,0 +1,43 @@
+"""Compares the single-pass OpenRocket reader with the previous comment filtering path.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_or_events [path/to/export.csv]
+"""
+import re
+import sys
+import timeit
+
+import pandas as pd
+
+from scripts.or_export import read_or_export
+
+DEFAULT_FILEPATH = "data/OR_data.csv"
+REPEATS = 20
+
+
+def legacy_load(filepath: str):
+    # The path DataHandler used before the single-pass reader: parse everything,
+    # then find comment rows with two string scans and row-wise regex calls.
+    df = pd.read_csv(filepath, delimiter=",", skiprows=6)
+    comments_df = df[df["# Time (s)"].astype(str).str.contains("#")].copy()
+    comments_df["Time (s)"] = comments_df["# Time (s)"].apply(
+        lambda text: float(match.group(1)) if (match := re.search(r"t=([\d\.]+)", text)) else None)
+    comments_df["Event"] = comments_df["# Time (s)"].apply(
+        lambda text: text.replace("#", "").strip())
+    comments_df["Event"] = comments_df["Event"].apply(
+        lambda text: " ".join(word for word in text.split() if word.isupper()))
+    data_df = df[~df["# Time (s)"].astype(str).str.contains("#")].copy()
+    data_df["# Time (s)"] = pd.to_numeric(data_df["# Time (s)"], errors="coerce")
+    return data_df, comments_df[["Time (s)", "Event"]]
+
+
+def main():
+    filepath = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_FILEPATH
+    for name, load in (("legacy", legacy_load), ("single-pass", read_or_export)):
+        seconds = min(timeit.repeat(lambda: load(filepath), number=1, repeat=REPEATS))
+        print(f"{name:>12}: {seconds * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compares the typed RASAero readers with the plain pd.read_csv that DataHandler used before.
+
+"typed" is the default ("auto") engine: pyarrow's CSV reader when pyarrow is installed, which spreads the parsing over
+every core, so its lead grows with the core count; "typed, c" is the fallback without pyarrow. Timings are the best of
+REPEATS runs, with the variants taking turns so changes in machine load hit them all alike.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ras_reader [path/to/aero_plot.csv path/to/flight.csv]
+"""
+import sys
+import timeit
+
+import pandas as pd
+
+from scripts.rasaero_reader import read_ras_aero_plot, read_ras_flight
+
+DEFAULT_FILEPATHS = ("data/CD Test.CSV", "data/RAS_Flight_Data.CSV")
+REPEATS = 50
+
+
+def variants(reader):
+    yield "plain read_csv", pd.read_csv
+    yield "typed", reader
+    yield "typed, c", lambda filepath: reader(filepath, engine="c")
+    yield "typed, c, round_trip", lambda filepath: reader(filepath, engine="c", float_precision="round_trip")
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return
+    yield "pd.read_csv, pyarrow", lambda filepath: pd.read_csv(filepath, engine="pyarrow")
+
+
+def main():
+    filepaths = sys.argv[1:3] if len(sys.argv) > 2 else DEFAULT_FILEPATHS
+    for filepath, reader in zip(filepaths, (read_ras_aero_plot, read_ras_flight)):
+        print(filepath)
+        loads = dict(variants(reader))
+        best = dict.fromkeys(loads, float("inf"))
+        for _ in range(REPEATS):
+            for name, load in loads.items():
+                best[name] = min(best[name], timeit.timeit(lambda: load(filepath), number=1))
+        baseline = best["plain read_csv"]
+        for name, seconds in best.items():
+            print(f"{name:>22}: {seconds * 1000:7.2f} ms  ({baseline / seconds:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Times the vectorized trajectory integrator for growing numbers of designs, then checks that steep and
+near-horizontal launches without recovery devices finish (these once looped forever at apogee).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_trajectory
+"""
+import time
+
+import numpy as np
+
+from scripts.trajectory import simulate
+
+MOTOR = "RocketPy/data/motors/Cesaroni_M1670.eng"
+DRAG_POWER_ON = "RocketPy/data/calisto/powerOnDragCurve.csv"
+DRAG_POWER_OFF = "RocketPy/data/calisto/powerOffDragCurve.csv"
+DESIGNS = (1, 10, 100, 1000)
+# Rail angles from vertical for the termination check, flown with no drogue or main
+CHECK_LAUNCH_ANGLES = (0.0, 60.0, 85.0, 89.0)
+
+
+def main():
+    for count in DESIGNS:
+        start = time.perf_counter()
+        simulate(MOTOR, DRAG_POWER_ON, drag_power_off=DRAG_POWER_OFF, mass=np.linspace(12.0, 16.0, count),
+                 diameter=0.127, rail_length=5.2, drogue_area_cd=1.0, main_area_cd=10.0, main_altitude=800.0,
+                 output="frames")
+        seconds = time.perf_counter() - start
+        print(f"{count:>5} designs: {seconds:7.2f} s ({seconds / count * 1000:8.2f} ms per design)")
+
+    start = time.perf_counter()
+    frames = simulate(MOTOR, DRAG_POWER_ON, drag_power_off=DRAG_POWER_OFF, mass=14.426, diameter=0.127,
+                      rail_length=5.2, launch_angle=np.array(CHECK_LAUNCH_ANGLES), output="frames")
+    seconds = time.perf_counter() - start
+    for angle, (data, events) in zip(CHECK_LAUNCH_ANGLES, frames):
+        names = events["Event"].tolist()
+        if names.count("APOGEE") != 1 or names[-1] != "SIMULATION_END":
+            raise RuntimeError(f"Launch at {angle}° without recovery ended with events {names}")
+        print(f"  {angle:4.0f}° no recovery: {data['Time (s)'].iloc[-1]:7.2f} s of flight, {len(data)} samples")
+    print(f"Launch angle check: {seconds:7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
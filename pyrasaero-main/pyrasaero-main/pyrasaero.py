@@ -1,9 +1,13 @@
 import cv2
 import keyboard
-from time import sleep
+from time import sleep, monotonic
 from gui_automation import GuiAuto
 from pywinauto.application import Application
 
+# Raised when RASAero can't be driven through a run, so a caller can retry or skip the run rather than the whole program exiting
+class RASAeroError(Exception):
+    pass
+
 class RASAero():
     # Change this as appropriate (notice use of double "\")
     RasaeroPath = "C:\\Program Files (x86)\\RASAero II\\RASAero II.exe"
@@ -17,6 +21,10 @@ class RASAero():
     BaselineFullFilePath = ""
     ExportGUIImages = []
     
+    # Seconds to keep looking for each of the export buttons while the "Aero Plots" window opens
+    ButtonTimeout = 10
+    
+    Application = None
     Window = None
     GUIAuto = None
     
@@ -88,20 +96,16 @@ class RASAero():
         # Open the "Aero Plots" window
         self.Window.child_window(title_re="Aero Plots", control_type="Button").wrapper_object().click_input()
         
-        # Give the "Aero Plots" window time to open before we look for buttons
-        sleep(2)
-        
         # Looking for "File --> Export --> To CSV File
         for filename in self.ExportGUIImages:
-            spot = self.GUIAuto.detect(cv2.imread(filename), 0.95)
+            spot = self.waitForButton(cv2.imread(filename))
 
             if spot:
                 x, y = spot.custom_position(1, 9, 1, 3)
                 self.GUIAuto.click(coords=(x, y), clicks=1)
             
             else:
-                print("UNABLE TO FIND ONE OF THE BUTTONS REQUIRED FOR CSV EXPORT")
-                exit()
+                raise RASAeroError("UNABLE TO FIND ONE OF THE BUTTONS REQUIRED FOR CSV EXPORT (%s)" % filename)
         
         # Export the "Aero Plots" data
         keyboard.write(exportFilepath)
@@ -110,6 +114,18 @@ class RASAero():
         # Close "Aero Plots" window
         keyboard.send("alt + f4")
 
+    # Poll for a button rather than sleeping a fixed time, so a window that opens quickly isn't waited on and a slow one isn't missed
+    def waitForButton(self, image):
+        deadline = monotonic() + self.ButtonTimeout
+        
+        while True:
+            spot = self.GUIAuto.detect(image, 0.95)
+            
+            if spot or monotonic() > deadline:
+                return spot
+            
+            sleep(0.25)
+    
     def close(self):
         # Close main window
         keyboard.send("alt + f4")
@@ -121,8 +137,8 @@ class RASAero():
     def run(self, RunName, aeroplotDirectory, parameters):
         aeroplotFullFilePath = aeroplotDirectory + "\\" + RunName + ".csv"
         
-        rasaero = Application(backend="uia").start(self.RasaeroPath).connect(title="RASAero II ", timeout=10)
-        self.Window = rasaero.top_window()
+        self.Application = Application(backend="uia").start(self.RasaeroPath).connect(title="RASAero II ", timeout=10)
+        self.Window = self.Application.top_window()
         
         self.openFile(self.baselineFileFullPath)
         
@@ -160,6 +176,9 @@ class Simulation():
     def __init__(self, exportImages, baselineFilePath, baselineFilename, bodytubeDiameter__mm=0, bodytubeLength__mm=0, noseconeLength__mm=0, noseconeTipRadius__mm=0, finspan__mm=0, finRootChord__mm=0):        
         self.Rasaero = RASAero(exportImages, baselineFilePath, (baselineFilename + ".CDX1"))
         
+        # One dictionary per simulation; a class-level one would be shared by every simulation created
+        self.Parameters = {}
+        
         # nosecone diameter == body tube diameter. RASAero requires us to set the body diameter in the nosecone section
         self.Parameters["noseconeDiameter__in"] = self.mmtoin(bodytubeDiameter__mm)
         self.Parameters["bodytubeLength__in"] = self.mmtoin(bodytubeLength__mm)
@@ -0,0 +1,246 @@
+import os
+import csv
+import json
+import itertools
+import threading
+from time import sleep, monotonic
+from concurrent.futures import ThreadPoolExecutor
+
+# Geometry inputs of a run, as taken by pyrasaero.Simulation (all in mm, "0" leaves the baseline value)
+GeometryNames = ["bodytubeDiameter__mm", "bodytubeLength__mm", "noseconeLength__mm", "noseconeTipRadius__mm", "finspan__mm", "finRootChord__mm"]
+
+ManifestFilename = "sweep-manifest.jsonl"
+
+def mmtoin(mm):
+    return (mm / 25.4)
+
+# Same name as pyrasaero.Simulation.RunName, so results from either can be found by the other
+def runName(baselineFilename, geometry):
+    values = tuple(geometry.get(name, 0) for name in GeometryNames)
+    return f"%s_BD[%f]-BL[%f]-NL[%f]-NTR[%f]-FS[%f]-FRC[%f]" % ((baselineFilename,) + values)
+
+# Same RASAero inputs (in inches) as pyrasaero.Simulation.Parameters
+def simulationParameters(geometry):
+    # nosecone diameter == body tube diameter. RASAero requires us to set the body diameter in the nosecone section
+    return {    "noseconeDiameter__in" : mmtoin(geometry.get("bodytubeDiameter__mm", 0)),
+                "bodytubeLength__in" : mmtoin(geometry.get("bodytubeLength__mm", 0)),
+                "noseconeLength__in" : mmtoin(geometry.get("noseconeLength__mm", 0)),
+                "noseconeTipRadius__in" : mmtoin(geometry.get("noseconeTipRadius__mm", 0)),
+                "finspan__in" : mmtoin(geometry.get("finspan__mm", 0)),
+                "finRootChord__in" : mmtoin(geometry.get("finRootChord__mm", 0))    }
+
+# A backend turns one run into an aero plot CSV (RASAero's "Aero Plots" export format) at the given path
+# Raise an exception if the run fails; the sweep retries it
+class Backend():
+    # Most runs that can be in progress at once
+    MaxWorkers = 1
+
+    def run(self, runName, geometry, aeroplotFullFilePath):
+        raise NotImplementedError
+
+# Drives the RASAero II GUI through pyrasaero. Only one run at a time, as it takes over the mouse and keyboard
+class GUIBackend(Backend):
+    MaxWorkers = 1
+
+    # Seconds to wait for RASAero to finish writing the exported CSV
+    ExportTimeout = 30
+
+    def __init__(self, exportGUIImages, baselineFilePath, baselineFilename):
+        self.ExportGUIImages = exportGUIImages
+        self.BaselineFilePath = baselineFilePath
+        self.BaselineFilename = baselineFilename
+
+    def run(self, runName, geometry, aeroplotFullFilePath):
+        # Imported here so the other backends work without the Windows-only GUI dependencies
+        import pyrasaero
+
+        rasaero = pyrasaero.RASAero(self.ExportGUIImages, self.BaselineFilePath, (self.BaselineFilename + ".CDX1"))
+        aeroplotDirectory, filename = os.path.split(aeroplotFullFilePath)
+
+        try:
+            exportedFullFilePath = rasaero.run(os.path.splitext(filename)[0], aeroplotDirectory, simulationParameters(geometry))
+            self.waitForFile(exportedFullFilePath)
+
+        except Exception:
+            # Don't leave a half-driven RASAero window open for the next attempt
+            if rasaero.Application is not None:
+                rasaero.Application.kill()
+
+            raise
+
+        if os.path.abspath(exportedFullFilePath) != os.path.abspath(aeroplotFullFilePath):
+            os.replace(exportedFullFilePath, aeroplotFullFilePath)
+
+    # RASAero writes the CSV after the export dialog closes; wait until it exists and has stopped growing
+    def waitForFile(self, filePath):
+        deadline = monotonic() + self.ExportTimeout
+        size = -1
+
+        while monotonic() < deadline:
+            if os.path.exists(filePath):
+                newSize = os.path.getsize(filePath)
+
+                if newSize > 0 and newSize == size:
+                    return
+
+                size = newSize
+
+            sleep(0.25)
+
+        raise TimeoutError("RASAero DID NOT WRITE %s" % filePath)
+
+# Stand-in for RASAero that writes aero plots from our own aero model, e.g. scripts.aero_table.AeroTable
+# The model is either one table used for every run, or a function of the run geometry (in mm) returning a table
+# Tables only need a to_dataframe() returning Mach, Alpha and coefficient columns, as AeroTable.to_dataframe does
+class LocalBackend(Backend):
+    MaxWorkers = None
+
+    def __init__(self, model):
+        self.Model = model
+
+    def run(self, runName, geometry, aeroplotFullFilePath):
+        table = self.Model(geometry) if callable(self.Model) else self.Model
+
+        aeroplot = table.to_dataframe()
+        columns = [aeroplot[name].tolist() for name in aeroplot.columns]
+
+        # Write next to the target then rename, so an interrupted run never leaves a partial CSV behind
+        # The csv module writes floats with repr, faster than DataFrame.to_csv for tables this size
+        temporaryFullFilePath = aeroplotFullFilePath + ".tmp"
+
+        with open(temporaryFullFilePath, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(aeroplot.columns)
+            writer.writerows(zip(*columns))
+
+        os.replace(temporaryFullFilePath, aeroplotFullFilePath)
+
+# Runs a set of geometries through a backend, keeping one aero plot CSV per run named by its RunName
+# Progress is kept in a manifest in the output directory, so an interrupted sweep picks up where it left off and
+# re-running a sweep skips every run already computed
+class Sweep():
+    def __init__(self, backend, baselineFilename, outputDirectory, retries=2, retryDelay=5):
+        self.Backend = backend
+        self.BaselineFilename = baselineFilename
+        self.OutputDirectory = outputDirectory
+        self.Retries = retries
+        self.RetryDelay = retryDelay
+
+        # RunName -> geometry, in the order added
+        self.Runs = {}
+
+        self.ManifestFullFilePath = os.path.join(outputDirectory, ManifestFilename)
+        self.Manifest = {}
+        self.ManifestLock = threading.Lock()
+
+        os.makedirs(outputDirectory, exist_ok=True)
+
+        # The manifest is a log of JSON lines, one per change of a run; replaying it in order gives each run's latest state
+        if os.path.exists(self.ManifestFullFilePath):
+            with open(self.ManifestFullFilePath) as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+
+                    except ValueError:
+                        # A line cut short by a crash mid-write
+                        continue
+
+                    name = entry.pop("run")
+                    self.Manifest[name] = dict(self.Manifest.get(name, {}), **entry)
+
+    # Adds one run. Geometry names are those of GeometryNames; any left out keep the baseline value
+    def add(self, **geometry):
+        unknown = [name for name in geometry if name not in GeometryNames]
+
+        if unknown:
+            raise ValueError("UNKNOWN GEOMETRY %s, EXPECTED SOME OF %s" % (unknown, GeometryNames))
+
+        name = runName(self.BaselineFilename, geometry)
+        self.Runs[name] = geometry
+
+        return name
+
+    # Adds a run for every combination of the given values, e.g. addGrid(bodytubeDiameter__mm=[120, 125], finspan__mm=[100, 110])
+    def addGrid(self, **values):
+        names = list(values.keys())
+
+        return [self.add(**dict(zip(names, combination))) for combination in itertools.product(*values.values())]
+
+    def aeroplotFullFilePath(self, name):
+        return os.path.join(self.OutputDirectory, name + ".csv")
+
+    # A run is cached once its CSV exists and it finished, or its CSV predates the manifest (e.g. from example.py)
+    def isCached(self, name):
+        if not os.path.exists(self.aeroplotFullFilePath(name)):
+            return False
+
+        entry = self.Manifest.get(name)
+
+        return entry is None or entry["status"] == "done"
+
+    def record(self, name, **entry):
+        with self.ManifestLock:
+            self.Manifest[name] = dict(self.Manifest.get(name, {}), **entry)
+
+            # Appended rather than rewritten, so each record costs the same however large the sweep
+            with open(self.ManifestFullFilePath, "a") as file:
+                file.write(json.dumps(dict(run=name, **entry)) + "\n")
+
+    # Runs one job, retrying failures. A run that still fails is recorded as failed and the sweep carries on
+    def runJob(self, name):
+        geometry = self.Runs[name]
+        error = None
+
+        for attempt in range(1, self.Retries + 2):
+            self.record(name, status="running", geometry=geometry, attempts=attempt)
+
+            try:
+                self.Backend.run(name, geometry, self.aeroplotFullFilePath(name))
+                self.record(name, status="done", file=self.aeroplotFullFilePath(name), error=None)
+
+                return "done"
+
+            except Exception as e:
+                error = "%s: %s" % (type(e).__name__, e)
+                print("RUN %s FAILED ON ATTEMPT %i: %s" % (name, attempt, error))
+
+                if attempt <= self.Retries:
+                    sleep(self.RetryDelay)
+
+        self.record(name, status="failed", error=error)
+
+        return "failed"
+
+    # Runs every run not already cached and returns RunName -> "cached", "done" or "failed"
+    def run(self, workers=1):
+        statuses = {}
+        pending = []
+
+        for name in self.Runs:
+            if self.isCached(name):
+                statuses[name] = "cached"
+
+                if name not in self.Manifest:
+                    self.record(name, status="done", geometry=self.Runs[name], attempts=0, file=self.aeroplotFullFilePath(name), error=None)
+
+            else:
+                pending.append(name)
+
+        if self.Backend.MaxWorkers is not None:
+            workers = min(workers, self.Backend.MaxWorkers)
+
+        if workers > 1 and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for name, status in zip(pending, executor.map(self.runJob, pending)):
+                    statuses[name] = status
+
+        else:
+            for name in pending:
+                statuses[name] = self.runJob(name)
+
+        return statuses
+
+    # RunName -> aero plot CSV path of every finished run
+    def results(self):
+        return {name: self.aeroplotFullFilePath(name) for name in self.Runs if self.isCached(name)}
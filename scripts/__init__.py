@@ -1,8 +1,75 @@
-# Contents of scripts/__init__.py
-from .howard_fin_flutter import calculate_flutter_velocity as howard_cfv
-from .bennet_fin_flutter_refactored import compute_and_print_flutter_velocity as bennet_cfv
-from .sahr_fin_flutter import calculate_flutter_velocity as sahr_cfv, list_of_flutter_velocities
-from .data_handler import *
-from .recovery import RocketParachuteCalculator
-from .parachute import calc_chute_diameter, list_of_chute_diameters, list_of_velocities
-from .or_xml import create_dataframe_and_drop_duplicates, find_and_extract_elements,get_root
+import importlib
+
+# Public name -> (submodule, attribute). Submodules are imported on first access, so "from scripts import howard_cfv"
+# does not load the data handling modules and "from scripts import DataHandler" does not load the flutter modules.
+_EXPORTS = {
+    "howard_cfv": ("howard_fin_flutter", "calculate_flutter_velocity"),
+    "howard_cfv_SI": ("howard_fin_flutter", "calculate_flutter_velocity_SI"),
+    "bennet_cfv": ("bennet_fin_flutter_refactored", "compute_and_print_flutter_velocity"),
+    "bennet_flutter_velocity": ("bennet_fin_flutter_refactored", "calculate_flutter_velocity"),
+    "flutter_margin": ("flutter_margin", "flutter_margin"),
+    "monte_carlo": ("monte_carlo", "monte_carlo"),
+    "flutter_outputs": ("monte_carlo", "flutter_outputs"),
+    "landing_outputs": ("monte_carlo", "landing_outputs"),
+    "StreamingStatistics": ("monte_carlo", "StreamingStatistics"),
+    "sahr_cfv": ("sahr_fin_flutter", "calculate_flutter_velocity"),
+    "list_of_flutter_velocities": ("sahr_fin_flutter", "list_of_flutter_velocities"),
+    "sahr_thickness": ("sahr_fin_flutter", "calculate_thickness"),
+    "minimum_thickness": ("fin_thickness", "minimum_thickness"),
+    "solve_thickness": ("fin_thickness", "solve_thickness"),
+    "DataHandler": ("data_handler", "DataHandler"),
+    "compact_dataframe": ("data_handler", "compact_dataframe"),
+    "COMPACT_FLOAT64_COLUMNS": ("data_handler", "COMPACT_FLOAT64_COLUMNS"),
+    "OR_COLUMN_NAMES": ("data_handler", "OR_COLUMN_NAMES"),
+    "RAS_COLUMN_NAMES": ("data_handler", "RAS_COLUMN_NAMES"),
+    "RAS_MACH_COLUMN_NAMES": ("data_handler", "RAS_MACH_COLUMN_NAMES"),
+    "read_or_export": ("or_export", "read_or_export"),
+    "read_ras_aero_plot": ("rasaero_reader", "read_ras_aero_plot"),
+    "read_ras_aero_plot_filtered": ("rasaero_reader", "read_ras_aero_plot_filtered"),
+    "read_ras_flight": ("rasaero_reader", "read_ras_flight"),
+    "CSVCache": ("csv_cache", "CSVCache"),
+    "Atmosphere": ("atmosphere", "Atmosphere"),
+    "standard_atmosphere": ("atmosphere", "standard_atmosphere"),
+    "AeroTable": ("aero_table", "AeroTable"),
+    "read_drag_curve": ("aero_table", "read_drag_curve"),
+    "read_thrust_curve": ("motor", "read_thrust_curve"),
+    "Motor": ("motor", "Motor"),
+    "load_motors": ("motor", "load_motors"),
+    "motor_table": ("motor", "motor_table"),
+    "simulate_trajectory": ("trajectory", "simulate"),
+    "trajectory_summary": ("trajectory", "trajectory_summary"),
+    "convert": ("units", "convert"),
+    "convert_columns": ("units", "convert_columns"),
+    "OR_UNITS": ("units", "OR_UNITS"),
+    "RAS_SI_CONVERSIONS": ("units", "RAS_SI_CONVERSIONS"),
+    "UNITS_SI": ("units", "UNITS_SI"),
+    "fin_properties": ("fin_geometry", "fin_properties"),
+    "read_fin_vertices": ("fin_geometry", "read_fin_vertices"),
+    "trapezoid_outlines": ("fin_geometry", "trapezoid_outlines"),
+    "RocketParachuteCalculator": ("recovery", "RocketParachuteCalculator"),
+    "calc_chute_diameter": ("parachute", "calc_chute_diameter"),
+    "list_of_chute_diameters": ("parachute", "list_of_chute_diameters"),
+    "list_of_velocities": ("parachute", "list_of_velocities"),
+    "parachute_sweep": ("parachute", "sweep"),
+    "create_dataframe_and_drop_duplicates": ("or_xml", "create_dataframe_and_drop_duplicates"),
+    "find_and_extract_elements": ("or_xml", "find_and_extract_elements"),
+    "get_root": ("or_xml", "get_root"),
+    "extract_components": ("or_xml", "extract_components"),
+    "iter_components": ("or_xml", "iter_components"),
+    "DesignIndex": ("design_index", "DesignIndex"),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _EXPORTS[name]
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
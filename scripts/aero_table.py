@@ -0,0 +1,229 @@
+import numpy as np
+import pandas as pd
+
+
+# RASAero aero-plot coefficients tabulated by default, by raw header name
+AERO_COEFFICIENTS = ("CD", "CD Power-Off", "CD Power-On", "CA Power-Off", "CA Power-On", "CN", "CP")
+
+# Renamed (snake_case) form of the headers, as written by DataHandler.rename_ras_mach_cd_df_columns
+_RENAMED = {
+    "Mach": "mach_number",
+    "Alpha": "alpha",
+    "CD": "drag_coefficient",
+    "CD Power-Off": "drag_coefficient_power_off",
+    "CD Power-On": "drag_coefficient_power_on",
+    "CA Power-Off": "axial_force_coefficient_power_off",
+    "CA Power-On": "axial_force_coefficient_power_on",
+    "CN": "normal_force_coefficient",
+    "CP": "cp_location",
+}
+
+
+class AeroTable:
+    """Mach x alpha lookup table of aerodynamic coefficients.
+
+    Each coefficient is held as a contiguous ``(n_mach, n_alpha)`` float64 grid. Queries are
+    arrays of (Mach, alpha) points, interpolated bilinearly in one vectorized pass. Points
+    outside the grid are clamped to its edges, as np.interp does.
+    """
+
+    def __init__(self, mach, alpha, coefficients: dict):
+        """
+        __init__  Initializes the table from its axes and coefficient grids.
+
+        :param mach:  Strictly increasing Mach numbers
+        :type mach: np.ndarray
+        :param alpha:  Strictly increasing angles of attack in degrees
+        :type alpha: np.ndarray
+        :param coefficients:  Coefficient name -> grid of shape (len(mach), len(alpha))
+        :type coefficients: dict
+        """
+        self.mach = np.ascontiguousarray(mach, dtype=np.float64)
+        self.alpha = np.ascontiguousarray(alpha, dtype=np.float64)
+        for name, axis in (("Mach", self.mach), ("alpha", self.alpha)):
+            if axis.ndim != 1 or axis.size == 0 or np.any(np.diff(axis) <= 0):
+                raise ValueError(f"The {name} axis must be a non-empty, strictly increasing 1-D array")
+
+        shape = (self.mach.size, self.alpha.size)
+        self.coefficients = {}
+        for name, grid in coefficients.items():
+            grid = np.ascontiguousarray(grid, dtype=np.float64)
+            if grid.shape != shape:
+                raise ValueError(f"Grid {name!r} has shape {grid.shape}, expected {shape}")
+            self.coefficients[name] = grid
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, coefficients: list = None, max_mach: float = None) -> "AeroTable":
+        """
+        from_dataframe  Builds the table from a RASAero aero-plot DataFrame with raw or renamed column names.
+
+        Rows repeated for a (Mach, alpha) pair keep their first value. A Mach number missing for one angle of attack
+        (RASAero drops the last row of some blocks) is filled by linear interpolation along Mach at that angle; a
+        coefficient with no values at all at some angle raises a ValueError.
+
+        :param df:  RASAero aero-plot data, e.g. DataHandler.ras_mach_df
+        :type df: pd.DataFrame
+        :param coefficients:  Coefficient columns to tabulate, defaults to None for those of AERO_COEFFICIENTS present
+        :type coefficients: list, optional
+        :param max_mach:  Highest Mach number kept, defaults to None to keep every row
+        :type max_mach: float, optional
+        :return:  Lookup table keyed by the column names used in df
+        :rtype: AeroTable
+        """
+        renamed = "Mach" not in df.columns
+        mach_column, alpha_column = ("mach_number", "alpha") if renamed else ("Mach", "Alpha")
+        if coefficients is None:
+            names = [_RENAMED[name] if renamed else name for name in AERO_COEFFICIENTS]
+            coefficients = [name for name in names if name in df.columns]
+        if not coefficients:
+            raise ValueError("No coefficient columns to tabulate")
+        missing = [name for name in (mach_column, *coefficients) if name not in df.columns]
+        if missing:
+            raise KeyError(f"Columns {missing} are not in the DataFrame")
+
+        if max_mach is not None:
+            df = df[df[mach_column] <= max_mach]
+        if alpha_column not in df.columns:
+            # A single-alpha export (or one already filtered to one angle) tabulates at alpha 0
+            df = df.assign(**{alpha_column: 0.0})
+        df = df.drop_duplicates(subset=[mach_column, alpha_column])
+        if df.empty:
+            raise ValueError("No rows to build the table from")
+
+        grids = df.pivot(index=mach_column, columns=alpha_column, values=list(coefficients)).sort_index().sort_index(axis=1)
+        mach = grids.index.to_numpy(dtype=np.float64)
+        alpha = grids[coefficients[0]].columns.to_numpy(dtype=np.float64)
+        tables = {}
+        for name in coefficients:
+            grid = grids[name].to_numpy(dtype=np.float64, copy=True)
+            holes = np.isnan(grid)
+            for j in np.flatnonzero(holes.any(axis=0)):
+                known = ~holes[:, j]
+                if not known.any():
+                    raise ValueError(f"Coefficient {name!r} has no values at alpha {alpha[j]:g} to fill its missing Mach "
+                                     f"numbers from")
+                grid[holes[:, j], j] = np.interp(mach[holes[:, j]], mach[known], grid[known, j])
+            tables[name] = grid
+        return cls(mach, alpha, tables)
+
+    @classmethod
+    def from_curve(cls, mach, values, name: str = "CD") -> "AeroTable":
+        """
+        from_curve  Builds a table of one coefficient against Mach only, such as a Mach-CD curve.
+
+        :param mach:  Mach numbers, in any order; repeated Mach numbers keep their first value
+        :type mach: np.ndarray
+        :param values:  Coefficient at each Mach number
+        :type values: np.ndarray
+        :param name:  Coefficient name, defaults to "CD"
+        :type name: str, optional
+        :return:  Lookup table with a single alpha of 0
+        :rtype: AeroTable
+        """
+        mach, first = np.unique(np.asarray(mach, dtype=np.float64), return_index=True)
+        values = np.asarray(values, dtype=np.float64)[first]
+        return cls(mach, [0.0], {name: values[:, None]})
+
+    @property
+    def names(self) -> list:
+        return list(self.coefficients)
+
+    def _weights(self, mach, alpha) -> tuple:
+        """
+        _weights  Finds the grid cell and interpolation weights of each query point.
+        """
+        mach, alpha = np.broadcast_arrays(np.asarray(mach, dtype=np.float64), np.asarray(alpha, dtype=np.float64))
+        cells = []
+        for axis, values in ((self.mach, mach), (self.alpha, alpha)):
+            if axis.size == 1:
+                lower = np.zeros(values.shape, dtype=np.intp)
+                cells.append((lower, lower, np.zeros(values.shape)))
+                continue
+            values = np.clip(values, axis[0], axis[-1])
+            lower = np.clip(np.searchsorted(axis, values, side="right") - 1, 0, axis.size - 2)
+            weight = (values - axis[lower]) / (axis[lower + 1] - axis[lower])
+            cells.append((lower, lower + 1, weight))
+        (i0, i1, tm), (j0, j1, ta) = cells
+        n_alpha = self.alpha.size
+        corners = (i0 * n_alpha + j0, i1 * n_alpha + j0, i0 * n_alpha + j1, i1 * n_alpha + j1)
+        weights = ((1 - tm) * (1 - ta), tm * (1 - ta), (1 - tm) * ta, tm * ta)
+        return corners, weights
+
+    def interpolate(self, name: str, mach, alpha=0.0) -> np.ndarray:
+        """
+        interpolate  Interpolates one coefficient at arrays of Mach numbers and angles of attack.
+
+        :param name:  Coefficient name
+        :type name: str
+        :param mach:  Mach number(s)
+        :type mach: float or np.ndarray
+        :param alpha:  Angle(s) of attack in degrees, broadcast against mach, defaults to 0.0
+        :type alpha: float or np.ndarray, optional
+        :return:  Interpolated values with the broadcast shape of mach and alpha
+        :rtype: np.ndarray
+        """
+        return self.lookup(mach, alpha, names=[name])[name]
+
+    def lookup(self, mach, alpha=0.0, names: list = None) -> dict:
+        """
+        lookup  Interpolates several coefficients at once, sharing the cell search between them.
+
+        :param mach:  Mach number(s)
+        :type mach: float or np.ndarray
+        :param alpha:  Angle(s) of attack in degrees, broadcast against mach, defaults to 0.0
+        :type alpha: float or np.ndarray, optional
+        :param names:  Coefficients to interpolate, defaults to None for all of them
+        :type names: list, optional
+        :return:  Coefficient name -> interpolated values
+        :rtype: dict
+        """
+        names = self.names if names is None else names
+        unknown = [name for name in names if name not in self.coefficients]
+        if unknown:
+            raise KeyError(f"Coefficients {unknown} are not in the table, expected some of {self.names}")
+        if self.alpha.size == 1:
+            # Curves against Mach only: a single np.interp per coefficient, clamped the same way
+            mach = np.broadcast_to(np.asarray(mach, dtype=np.float64), np.broadcast_shapes(np.shape(mach), np.shape(alpha)))
+            return {name: np.interp(mach, self.mach, self.coefficients[name][:, 0]) for name in names}
+        corners, weights = self._weights(mach, alpha)
+        values = {}
+        for name in names:
+            flat = self.coefficients[name].ravel()
+            values[name] = (flat[corners[0]] * weights[0] + flat[corners[1]] * weights[1]
+                            + flat[corners[2]] * weights[2] + flat[corners[3]] * weights[3])
+        return values
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        to_dataframe  Returns the grids in long form, one row per (Mach, alpha) point.
+
+        :return:  DataFrame with Mach, Alpha and one column per coefficient
+        :rtype: pd.DataFrame
+        """
+        mach, alpha = np.meshgrid(self.mach, self.alpha, indexing="ij")
+        return pd.DataFrame({"Mach": mach.ravel(), "Alpha": alpha.ravel(),
+                             **{name: grid.ravel() for name, grid in self.coefficients.items()}})
+
+
+def read_drag_curve(filepath: str, name: str = "CD") -> AeroTable:
+    """
+    read_drag_curve  Reads a two-column Mach-CD curve, either headerless and comma-delimited (as RocketPy's
+    powerOnDragCurve.csv) or tab-delimited with a header (as written by DataHandler.export_mach_cd_df_to_txt).
+
+    :param filepath:  Path to the curve file
+    :type filepath: str
+    :param name:  Coefficient name in the returned table, defaults to "CD"
+    :type name: str, optional
+    :return:  Lookup table of the curve
+    :rtype: AeroTable
+    """
+    with open(filepath, encoding="utf-8") as file:
+        first_line = file.readline()
+    delimiter = "\t" if "\t" in first_line else ","
+    try:
+        float(first_line.split(delimiter)[0])
+        header = None
+    except ValueError:
+        header = 0
+    df = pd.read_csv(filepath, sep=delimiter, header=header, usecols=[0, 1], dtype="float64")
+    return AeroTable.from_curve(df.iloc[:, 0].to_numpy(), df.iloc[:, 1].to_numpy(), name=name)
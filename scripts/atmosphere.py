@@ -0,0 +1,241 @@
+import functools
+
+import numpy as np
+import pandas as pd
+
+
+# Sea level conditions and constants of the 1976 US Standard Atmosphere (identical to the ISA below 86 km)
+SEA_LEVEL_TEMPERATURE = 288.15  # K
+SEA_LEVEL_PRESSURE = 101325.0  # Pa
+GAS_CONSTANT = 287.05287  # J/(kg K), specific gas constant of dry air
+GRAVITY = 9.80665  # m/s^2
+EARTH_RADIUS = 6356766.0  # m, radius used for geopotential altitude
+SPECIFIC_HEAT_RATIO = 1.4
+
+# Layer base geopotential altitude (m) -> temperature lapse rate (K/m), up to 86 km geometric (84.852 km geopotential)
+ISA_LAYERS = (
+    (0.0, -0.0065),
+    (11000.0, 0.0),
+    (20000.0, 0.001),
+    (32000.0, 0.0028),
+    (47000.0, 0.0),
+    (51000.0, -0.0028),
+    (71000.0, -0.002),
+)
+MIN_ALTITUDE = -1000.0  # m
+MAX_ALTITUDE = 86000.0  # m
+
+# Column names and SI scale factors of data/air_values.csv, in file order
+AIR_PROPERTY_COLUMNS = {
+    "temperature": 1.0,  # K
+    "specific_heat_cp": 1e3,  # kJ/(kg K) -> J/(kg K)
+    "specific_heat_cv": 1e3,
+    "ratio_of_specific_heats": 1.0,
+    "dynamic_viscosity": 1e-5,  # 1e-5 kg/(m s) -> Pa s
+    "thermal_conductivity": 1e-2,  # 1e-5 kW/(m K) -> W/(m K)
+    "prandtl_number": 1.0,
+    "kinematic_viscosity": 1e-5,  # 1e-5 m^2/s -> m^2/s
+    "density": 1.0,  # kg/m^3, at 1 atm
+    "diffusivity": 1e-6,  # 1e-6 m^2/s -> m^2/s
+}
+
+
+def _layer_bases():
+    """
+    _layer_bases  Temperature and pressure at the base of each ISA layer.
+    """
+    temperatures = [SEA_LEVEL_TEMPERATURE]
+    pressures = [SEA_LEVEL_PRESSURE]
+    for (base, lapse), (top, _) in zip(ISA_LAYERS, ISA_LAYERS[1:]):
+        temperature, pressure = temperatures[-1], pressures[-1]
+        height = top - base
+        if lapse == 0.0:
+            pressure = pressure * np.exp(-GRAVITY * height / (GAS_CONSTANT * temperature))
+        else:
+            pressure = pressure * (1 + lapse * height / temperature) ** (-GRAVITY / (GAS_CONSTANT * lapse))
+        temperatures.append(temperature + lapse * height)
+        pressures.append(pressure)
+    return np.array(temperatures), np.array(pressures)
+
+
+_BASE_TEMPERATURES, _BASE_PRESSURES = _layer_bases()
+_BASE_ALTITUDES = np.array([base for base, _ in ISA_LAYERS])
+_LAPSE_RATES = np.array([lapse for _, lapse in ISA_LAYERS])
+
+
+def geopotential_altitude(altitude):
+    """
+    geopotential_altitude  Converts geometric altitudes to geopotential altitudes.
+
+    :param altitude:  Geometric altitude(s) in m
+    :type altitude: float or np.ndarray
+    :return:  Geopotential altitude(s) in m
+    :rtype: float or np.ndarray
+    """
+    return EARTH_RADIUS * altitude / (EARTH_RADIUS + altitude)
+
+
+def isa(altitude) -> tuple:
+    """
+    isa  Evaluates the ISA temperature and pressure directly from the layer equations.
+
+    :param altitude:  Geometric altitude(s) in m, between MIN_ALTITUDE and MAX_ALTITUDE
+    :type altitude: float or np.ndarray
+    :return:  Temperature(s) in K and pressure(s) in Pa
+    :rtype: tuple
+    """
+    h = geopotential_altitude(np.asarray(altitude, dtype=np.float64))
+    layer = np.clip(np.searchsorted(_BASE_ALTITUDES, h, side="right") - 1, 0, len(ISA_LAYERS) - 1)
+    height = h - _BASE_ALTITUDES[layer]
+    lapse = _LAPSE_RATES[layer]
+    base_temperature = _BASE_TEMPERATURES[layer]
+    temperature = base_temperature + lapse * height
+
+    isothermal = lapse == 0.0
+    # Evaluate both forms with a safe lapse rate, then pick per point
+    safe_lapse = np.where(isothermal, 1.0, lapse)
+    with np.errstate(invalid="ignore"):
+        gradient = (temperature / base_temperature) ** (-GRAVITY / (GAS_CONSTANT * safe_lapse))
+    constant = np.exp(-GRAVITY * height / (GAS_CONSTANT * base_temperature))
+    pressure = _BASE_PRESSURES[layer] * np.where(isothermal, constant, gradient)
+    return temperature, pressure
+
+
+def read_air_properties(filepath: str) -> pd.DataFrame:
+    """
+    read_air_properties  Reads a table of air properties against temperature, such as data/air_values.csv, in SI units.
+
+    :param filepath:  Path to the CSV file, with the columns of AIR_PROPERTY_COLUMNS in order under a free-form header
+    :type filepath: str
+    :return:  Air properties with the AIR_PROPERTY_COLUMNS names, sorted by temperature
+    :rtype: pd.DataFrame
+    """
+    df = pd.read_csv(filepath, header=None, skip_blank_lines=True)
+    # The header spans several quoted, multi-line rows; the data rows are those starting with a number
+    df = df[pd.to_numeric(df[0], errors="coerce").notna()].iloc[:, :len(AIR_PROPERTY_COLUMNS)]
+    df.columns = list(AIR_PROPERTY_COLUMNS)[:df.shape[1]]
+    df = df.apply(pd.to_numeric, errors="coerce").astype("float64")
+    for column in df.columns:
+        df[column] *= AIR_PROPERTY_COLUMNS[column]
+    return df.sort_values("temperature").reset_index(drop=True)
+
+
+class Atmosphere:
+    """Standard atmosphere evaluated from precomputed lookup tables.
+
+    Temperature and log-pressure are tabulated once on a uniform altitude grid from the
+    ISA layer equations, so each query is an index computation and a linear interpolation
+    over whole arrays of altitudes. Altitudes outside the table are clamped to its ends.
+    The ratio of specific heats and the viscosity follow a temperature table such as
+    data/air_values.csv when one is given, and constant gamma / Sutherland's law otherwise.
+    """
+
+    def __init__(self, resolution: float = 10.0, air_properties=None):
+        """
+        __init__  Builds the lookup tables.
+
+        :param resolution:  Altitude step of the tables in m, defaults to 10.0
+        :type resolution: float, optional
+        :param air_properties:  Path to an air properties CSV, or a DataFrame from read_air_properties, used for the ratio
+            of specific heats and dynamic viscosity, defaults to None
+        :type air_properties: str or pd.DataFrame, optional
+        """
+        self.resolution = resolution
+        self.altitudes = np.arange(MIN_ALTITUDE, MAX_ALTITUDE + resolution, resolution)
+        temperature, pressure = isa(self.altitudes)
+        self._temperature = np.ascontiguousarray(temperature)
+        self._log_pressure = np.ascontiguousarray(np.log(pressure))
+
+        if isinstance(air_properties, str):
+            air_properties = read_air_properties(air_properties)
+        self.air_properties = air_properties
+
+    def _weights(self, altitude) -> tuple:
+        position = (np.clip(np.asarray(altitude, dtype=np.float64), MIN_ALTITUDE, MAX_ALTITUDE) - MIN_ALTITUDE) / self.resolution
+        # NaN altitudes index the first row and get a NaN weight, so every property comes out NaN for them
+        finite = np.isfinite(position)
+        lower = np.minimum(np.where(finite, position, 0.0).astype(np.intp), self.altitudes.size - 2)
+        return lower, np.where(finite, position - lower, np.nan)
+
+    def _interpolate(self, table: np.ndarray, altitude, weights: tuple = None) -> np.ndarray:
+        lower, weight = self._weights(altitude) if weights is None else weights
+        return table[lower] * (1 - weight) + table[lower + 1] * weight
+
+    def temperature(self, altitude) -> np.ndarray:
+        """
+        temperature  Air temperature in K at geometric altitude(s) in m.
+        """
+        return self._interpolate(self._temperature, altitude)
+
+    def pressure(self, altitude) -> np.ndarray:
+        """
+        pressure  Air pressure in Pa at geometric altitude(s) in m.
+        """
+        return np.exp(self._interpolate(self._log_pressure, altitude))
+
+    def density(self, altitude) -> np.ndarray:
+        """
+        density  Air density in kg/m^3 at geometric altitude(s) in m.
+        """
+        weights = self._weights(altitude)
+        temperature = self._interpolate(self._temperature, altitude, weights)
+        return np.exp(self._interpolate(self._log_pressure, altitude, weights)) / (GAS_CONSTANT * temperature)
+
+    def speed_of_sound(self, altitude) -> np.ndarray:
+        """
+        speed_of_sound  Speed of sound in m/s at geometric altitude(s) in m.
+        """
+        temperature = self.temperature(altitude)
+        return np.sqrt(self._specific_heat_ratio(temperature) * GAS_CONSTANT * temperature)
+
+    def _specific_heat_ratio(self, temperature: np.ndarray) -> np.ndarray:
+        if self.air_properties is None:
+            return np.where(np.isnan(temperature), np.nan, SPECIFIC_HEAT_RATIO)
+        table = self.air_properties
+        return np.interp(temperature, table["temperature"].to_numpy(), table["ratio_of_specific_heats"].to_numpy())
+
+    def _dynamic_viscosity(self, temperature: np.ndarray) -> np.ndarray:
+        if self.air_properties is None:
+            # Sutherland's law
+            return 1.458e-6 * temperature ** 1.5 / (temperature + 110.4)
+        table = self.air_properties
+        return np.interp(temperature, table["temperature"].to_numpy(), table["dynamic_viscosity"].to_numpy())
+
+    def properties(self, altitude) -> dict:
+        """
+        properties  Evaluates every property at once, sharing the table lookups.
+
+        :param altitude:  Geometric altitude(s) in m
+        :type altitude: float or np.ndarray
+        :return:  temperature (K), pressure (Pa), density (kg/m^3), speed_of_sound (m/s), specific_heat_ratio,
+            dynamic_viscosity (Pa s) and kinematic_viscosity (m^2/s)
+        :rtype: dict
+        """
+        weights = self._weights(altitude)
+        temperature = self._interpolate(self._temperature, altitude, weights)
+        pressure = np.exp(self._interpolate(self._log_pressure, altitude, weights))
+        density = pressure / (GAS_CONSTANT * temperature)
+        specific_heat_ratio = self._specific_heat_ratio(temperature)
+        dynamic_viscosity = self._dynamic_viscosity(temperature)
+        return {
+            "temperature": temperature,
+            "pressure": pressure,
+            "density": density,
+            "speed_of_sound": np.sqrt(specific_heat_ratio * GAS_CONSTANT * temperature),
+            "specific_heat_ratio": specific_heat_ratio,
+            "dynamic_viscosity": dynamic_viscosity,
+            "kinematic_viscosity": dynamic_viscosity / density,
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def standard_atmosphere(resolution: float = 10.0) -> Atmosphere:
+    """
+    standard_atmosphere  Returns a shared Atmosphere, so its tables are built once per process.
+
+    :param resolution:  Altitude step of the tables in m, defaults to 10.0
+    :type resolution: float, optional
+    :return:  Shared standard atmosphere
+    :rtype: Atmosphere
+    """
+    return Atmosphere(resolution=resolution)
@@ -1,120 +1,148 @@
-from sympy import symbols, lambdify, exp, pi, N
 import numpy as np
-import math
-import triangle as tr
 
-# Define symbols in one central place
-cr, ct, b, h, T, G, t, P, a, AR, lambda_ratio, epsilon, cx, K, m, P0, T1, T2, T3 = symbols(
-    'c_r c_t b h T G t P a AR lambda_ratio epsilon cx K m P0 T1 T2 T3')
+# NumPy kernels of the expressions in derivations/bennet_fin_flutter_refactored.py, where they are derived with SymPy
 
-# cx for trapezoidal fins
-cx_expr = ((2*ct*m)+ct**2+(m*cr)+(ct*cr)+cr**2)/(3*(ct+cr))
 
-# Expressions for wing area, aspect ratio, and taper ratio
-S_expr = 1/2 * (cr + ct) * b
-AR_expr = b**2 / S_expr
-lambda_expr = ct / cr
+def temperature_function_SI(h):
+    return 15-0.0065*h
 
-thickness_ratio_expr = t/cr
 
-# Temperature
-T_expr_SI = 15-0.0065*h
-T_expr_Imperial = 59 - 0.00356 * h
+def temperature_function_Imperial(h):
+    return 59 - 0.00356 * h
 
-# Pressure
-P_expr_SI = 101.325 * ((T + 273.16) / 288.16) ** 5.256
-P_expr_Imperial = 14.696 * ((T + 459.7) / 518.7) ** 5.256
 
+def pressure_function_SI(T):
+    return 101.325 * ((T + 273.16) / 288.16) ** 5.256
 
-# speed of sound = a
-a_expr_SI = 20.05*(273.16+T)**0.5
-a_expr_Imperial = 49.03*(459.7+T)**0.5
 
-# Epsilon
-epsilon_expr = (cx_expr/cr)-0.25
+def pressure_function_Imperial(T):
+    return 14.696 * ((T + 459.7) / 518.7) ** 5.256
 
-# Denominator Constant
-DN_expr = (24*epsilon*K*P0)/np.pi
 
-# First Term
-Term1_expr = (DN_expr*AR_expr**3)/((thickness_ratio_expr**3)*(AR_expr+2))
-Term2_expr = (lambda_expr+1)/2
-Term3_expr_SI = P_expr_SI/101.325
-Term3_expr_Imperial = P_expr_Imperial/14.696
+def speed_of_sound_function_SI(T):
+    return 20.05*(273.16+T)**0.5
 
-Vf_expr = a*(G/(T1 * T2 * T3))**0.5
 
-# Corrected lambdify functions
-temperature_function_SI = lambdify(h, T_expr_SI, modules='numpy')
-temperature_function_Imperial = lambdify(h, T_expr_Imperial, modules='numpy')
+def speed_of_sound_function_Imperial(T):
+    return 49.03*(459.7+T)**0.5
 
-pressure_function_SI = lambdify(T, P_expr_SI, modules='numpy')
-pressure_function_Imperial = lambdify(T, P_expr_Imperial, modules='numpy')
 
-speed_of_sound_function_SI = lambdify(T, a_expr_SI, modules='numpy')
-speed_of_sound_function_Imperial = lambdify(
-    T, a_expr_Imperial, modules='numpy')
+def aspect_ratio_function(c_r, c_t, b):
+    return b**2 / (1/2 * (c_r + c_t) * b)
 
-aspect_ratio_function = lambdify((cr, ct, b), AR_expr, modules='numpy')
-taper_ratio_function = lambdify((cr, ct), lambda_expr, modules='numpy')
 
-cx_function = lambdify((cr, ct, m), cx_expr, modules='numpy')
-epsilon_function = lambdify((cr, ct, m), epsilon_expr, modules='numpy')
+def taper_ratio_function(c_r, c_t):
+    return c_t / c_r
 
-# flutter_velocity_function_SI = lambdify(
-#     (G, cr, ct, b, t, m, P, K), Vf_expr_SI, modules='numpy')
-flutter_velocity_function_Imperial = lambdify(
-    (G, cr, ct, b, t, m, P, K), Vf_expr, modules='numpy')
 
-# Define a function to substitute and evaluate expressions
+def cx_function(c_r, c_t, m):
+    # cx for trapezoidal fins
+    return ((2*c_t*m)+c_t**2+(m*c_r)+(c_t*c_r)+c_r**2)/(3*(c_t+c_r))
 
 
-def evaluate_flutter_velocity(G_val, cr_val, ct_val, b_val, t_val, m_val, P_val, K_val, P0_val, a_val, T_val):
-    # First, calculate any dependent expressions
-    # Assuming cx_function is correctly defined
-    cx_val = cx_function(cr_val, ct_val, m_val)
-    # Assuming epsilon_function is correctly defined
-    epsilon_val = epsilon_function(cr_val, ct_val, m_val)
+def epsilon_function(c_r, c_t, m):
+    return (cx_function(c_r, c_t, m)/c_r)-0.25
 
-    # Now substitute all terms in Term1
-    term1 = Term1_expr.subs({
-        G: G_val,
-        cr: cr_val,
-        ct: ct_val,
-        b: b_val,
-        t: t_val,
-        m: m_val,
-        P: P_val,
-        K: K_val,
-        P0: P0_val,
-        epsilon: epsilon_val
-    })
-    term2 = Term2_expr.subs({cr: cr_val, ct: ct_val})
-    
-    # term3 = Term3_expr_Imperial.subs({T: T_val, P: P_val})
-    term3 = Term3_expr_SI.subs({T: T_val, P: P_val})
-    
-    vf_expr_evaluated = Vf_expr.subs(
-        {a: a_val, G: G_val, T1: term1, T2: term2, T3: term3})
-    # Numerical evaluation
-    vf_numerical = N(vf_expr_evaluated)
 
-    return vf_numerical
+def term1_function(c_r, c_t, b, t, m, K, P0):
+    aspect_ratio = aspect_ratio_function(c_r, c_t, b)
+    return (24 * epsilon_function(c_r, c_t, m) * K * P0 / np.pi) * aspect_ratio**3 / ((t / c_r)**3 * (aspect_ratio + 2))
+
+
+def term2_function(c_r, c_t):
+    return (taper_ratio_function(c_r, c_t) + 1) / 2
+
+
+# Sea level pressure each unit system's Term3 is normalised by (kPa and psi)
+SEA_LEVEL_PRESSURE = {"si": 101.325, "imperial": 14.696}
+
+
+def term3_function_SI(P):
+    return P / SEA_LEVEL_PRESSURE["si"]
+
+
+def term3_function_Imperial(P):
+    return P / SEA_LEVEL_PRESSURE["imperial"]
+
+
+def evaluate_flutter_velocity(G_val, cr_val, ct_val, b_val, t_val, m_val, P_val, K_val, P0_val, a_val, T_val, unit_system="si"):
+    """
+    evaluate_flutter_velocity  Evaluate the Bennett flutter velocity from the atmospheric state; every argument may be an array
+
+    Args:
+        G_val (float or np.ndarray): Shear modulus of the fin material
+        cr_val (float or np.ndarray): Root chord
+        ct_val (float or np.ndarray): Tip chord
+        b_val (float or np.ndarray): Semispan
+        t_val (float or np.ndarray): Fin thickness
+        m_val (float or np.ndarray): Sweep length of the leading edge
+        P_val (float or np.ndarray): Air pressure (kPa for "si", psi for "imperial")
+        K_val (float or np.ndarray): Ratio of specific heats of air
+        P0_val (float or np.ndarray): Sea level pressure, in the units of G_val
+        a_val (float or np.ndarray): Speed of sound
+        T_val (float or np.ndarray): Air temperature, unused; kept for the existing call signature
+        unit_system (str): "si" or "imperial", the units of P_val. Defaults to "si".
+
+    Returns:
+        np.ndarray: Flutter velocity, in the units of a_val, with the broadcast shape of the arguments
+    """
+    term1 = term1_function(cr_val, ct_val, b_val, t_val, m_val, K_val, P0_val)
+    term2 = term2_function(cr_val, ct_val)
+    term3 = term3_function_SI(P_val) if unit_system == "si" else term3_function_Imperial(P_val)
+
+    return a_val * np.sqrt(G_val / (term1 * term2 * term3))
+
+
+def calculate_flutter_velocity(altitude, thickness, root_chord, tip_chord, semispan, sweep_length, shear_modulus,
+                               specific_heat_ratio=1.4, sea_level_pressure=101325, unit_system="si"):
+    """
+    calculate_flutter_velocity  Calculate the Bennett flutter velocity over arrays of altitudes, geometries and materials
+
+    Every argument may be a scalar or an array; the arguments are broadcast together, so a trajectory of altitudes
+    against a column of thicknesses gives one flutter velocity per (thickness, altitude) pair.
+
+    Args:
+        altitude (float or np.ndarray): Altitude (m for "si", ft for "imperial")
+        thickness (float or np.ndarray): Fin thickness
+        root_chord (float or np.ndarray): Root chord
+        tip_chord (float or np.ndarray): Tip chord
+        semispan (float or np.ndarray): Semispan
+        sweep_length (float or np.ndarray): Sweep length of the leading edge
+        shear_modulus (float or np.ndarray): Shear modulus of the fin material (Pa for "si", psi for "imperial")
+        specific_heat_ratio (float or np.ndarray): Ratio of specific heats of air. Defaults to 1.4.
+        sea_level_pressure (float or np.ndarray): Sea level pressure, in the units of shear_modulus. Defaults to 101325.
+        unit_system (str): "si" or "imperial". Defaults to "si".
+
+    Returns:
+        np.ndarray: Flutter velocity (m/s for "si", ft/s for "imperial")
+    """
+    if unit_system not in SEA_LEVEL_PRESSURE:
+        raise ValueError(f"Unknown unit system {unit_system!r}, expected one of {list(SEA_LEVEL_PRESSURE)}")
+    si = unit_system == "si"
+    altitude = np.asarray(altitude, dtype=np.float64)
+    temperature = temperature_function_SI(altitude) if si else temperature_function_Imperial(altitude)
+    pressure = pressure_function_SI(temperature) if si else pressure_function_Imperial(temperature)
+    speed_of_sound = speed_of_sound_function_SI(temperature) if si else speed_of_sound_function_Imperial(temperature)
+    return evaluate_flutter_velocity(shear_modulus, root_chord, tip_chord, semispan, thickness, sweep_length, pressure,
+                                     specific_heat_ratio, sea_level_pressure, speed_of_sound, temperature,
+                                     unit_system=unit_system)
+
+
+def flutter_velocity_function_SI(h, t, c_r, c_t, b, m, G, K, P0):
+    return calculate_flutter_velocity(h, t, c_r, c_t, b, m, G, specific_heat_ratio=K, sea_level_pressure=P0,
+                                      unit_system="si")
+
+
+def flutter_velocity_function_Imperial(h, t, c_r, c_t, b, m, G, K, P0):
+    return calculate_flutter_velocity(h, t, c_r, c_t, b, m, G, specific_heat_ratio=K, sea_level_pressure=P0,
+                                      unit_system="imperial")
 
 
 def compute_and_print_flutter_velocity(unit_system, cr_val, ct_val, b_val, h_val, t_val, m_val, G_val, K_val, P0_val):
-    # Choose the correct functions based on the unit system
-    temperature_function = temperature_function_SI if unit_system == "si" else temperature_function_Imperial
-    pressure_function = pressure_function_SI if unit_system == "si" else pressure_function_Imperial
-    speed_of_sound_function = speed_of_sound_function_SI if unit_system == "si" else speed_of_sound_function_Imperial
-
-    # Compute temperature, pressure, and speed of sound
-    temperature = temperature_function(h_val)
-    pressure = pressure_function(temperature)
-    speed_of_sound = speed_of_sound_function(temperature)
-    # Evaluate and compute flutter velocity
-    flutter_velocity = evaluate_flutter_velocity(
-        G_val, cr_val, ct_val, b_val, t_val, m_val, pressure, K_val, P0_val, speed_of_sound, temperature)
+    # Any unit system other than "si" is treated as imperial
+    unit_system = "si" if unit_system == "si" else "imperial"
+    flutter_velocity = calculate_flutter_velocity(
+        h_val, t_val, cr_val, ct_val, b_val, m_val, G_val, specific_heat_ratio=K_val, sea_level_pressure=P0_val,
+        unit_system=unit_system)
 
     return flutter_velocity
-
@@ -0,0 +1,243 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "uwa_aerospace", "csv")
+
+# Part of every entry key. Bump it whenever a reader used through the cache (or_export.read_or_export, the
+# rasaero_reader readers) or the entry layout changes, so entries parsed by the old code are no longer served.
+# 2: OR export header found from the "# Time (s)," line; RAS files read through pyarrow
+CACHE_VERSION = 2
+
+# Digest sizes, in bytes, of the content and options hashes naming the entry directories
+CONTENT_HASH_SIZE = 16
+OPTIONS_HASH_SIZE = 8
+
+
+def _is_hash(name: str, size: int) -> bool:
+    """
+    _is_hash  Checks whether a directory name is a hex digest of the given size, as written by the cache.
+    """
+    return len(name) == 2 * size and all(character in "0123456789abcdef" for character in name)
+
+
+class CSVCache:
+    """On-disk columnar cache for parsed CSV exports.
+
+    Each parsed DataFrame is stored as one ``.npy`` file per column plus a small JSON
+    manifest, keyed by a hash of the source file contents, CACHE_VERSION and the reader
+    options. A second load of an unchanged file is a memory-mapped read of the column files.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """
+        __init__  Initializes the cache in the given directory.
+
+        :param cache_dir:  Directory the cache entries are written to
+        :type cache_dir: str
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._hash_memo = {}
+
+    def read_csv(self, filepath: str, **read_kwargs) -> pd.DataFrame:
+        """
+        read_csv  Reads a CSV file through the cache, parsing it with pd.read_csv on a miss.
+
+        :param filepath:  Path to the CSV file
+        :type filepath: str
+        :return:  Parsed DataFrame
+        :rtype: pd.DataFrame
+        """
+        return self.read(filepath, pd.read_csv, **read_kwargs)
+
+    def read(self, filepath: str, reader, **read_kwargs):
+        """
+        read  Returns the cached result of ``reader(filepath, **read_kwargs)``, parsing and storing it on a miss.
+
+        :param filepath:  Path to the source file
+        :type filepath: str
+        :param reader:  Callable that parses the file into a DataFrame or a tuple of DataFrames
+        :type reader: callable
+        :return:  Parsed DataFrame, or tuple of DataFrames when the reader returns one
+        :rtype: pd.DataFrame or tuple
+        """
+        entry_dir = self._entry_dir(filepath, reader, read_kwargs)
+        result = self._load_entry(entry_dir)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = reader(filepath, **read_kwargs)
+        self._store_entry(entry_dir, filepath, result)
+        return result
+
+    def invalidate(self, filepath: str = None) -> int:
+        """
+        invalidate  Removes cache entries for a file, or every entry when no file is given.
+
+        Entries are matched on both the current contents of the file and the path they were
+        created from, so stale entries for a file that has since changed are removed too. Only the
+        entry directories the cache wrote are removed; other files in cache_dir are left alone.
+
+        :param filepath:  Path to the source file, defaults to None
+        :type filepath: str, optional
+        :return:  Number of entries removed
+        :rtype: int
+        """
+        if not os.path.isdir(self.cache_dir):
+            return 0
+
+        source = None if filepath is None else os.path.abspath(filepath)
+        content_hash = self._file_hash(filepath) if filepath is not None and os.path.isfile(filepath) else None
+        removed = 0
+        for entry_dir, manifest in self._iter_entries():
+            content_dir = os.path.dirname(entry_dir)
+            if filepath is None or manifest.get("source") == source or os.path.basename(content_dir) == content_hash:
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                removed += 1
+                if not os.listdir(content_dir):
+                    os.rmdir(content_dir)
+        if filepath is None:
+            self._hash_memo.clear()
+        else:
+            self._hash_memo = {key: value for key, value in self._hash_memo.items() if key[0] != source}
+        return removed
+
+    def stats(self) -> dict:
+        """
+        stats  Returns the hit and miss counters for this cache instance.
+
+        :return:  Dictionary with ``hits``, ``misses`` and ``hit_rate``
+        :rtype: dict
+        """
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0}
+
+    def _file_hash(self, filepath: str) -> str:
+        """
+        _file_hash  Hashes the file contents, reusing the digest while size and mtime are unchanged.
+        """
+        source = os.path.abspath(filepath)
+        stat = os.stat(source)
+        memo_key = (source, stat.st_size, stat.st_mtime_ns)
+        if memo_key not in self._hash_memo:
+            digest = hashlib.blake2b(digest_size=CONTENT_HASH_SIZE)
+            with open(source, "rb") as file:
+                for block in iter(lambda: file.read(1 << 20), b""):
+                    digest.update(block)
+            self._hash_memo[memo_key] = digest.hexdigest()
+        return self._hash_memo[memo_key]
+
+    def _entry_dir(self, filepath: str, reader, read_kwargs: dict) -> str:
+        """
+        _entry_dir  Builds the entry directory from the content hash, the cache version and the reader options.
+        """
+        options = json.dumps({"version": CACHE_VERSION, "reader": f"{reader.__module__}.{reader.__qualname__}",
+                              "kwargs": read_kwargs}, sort_keys=True, default=repr)
+        options_hash = hashlib.blake2b(options.encode(), digest_size=OPTIONS_HASH_SIZE).hexdigest()
+        return os.path.join(self.cache_dir, self._file_hash(filepath), options_hash)
+
+    def _iter_entries(self):
+        """
+        _iter_entries  Yields the entry directories written by the cache, with their manifests ({} when unreadable).
+
+        Only directories named like the content and options hashes and holding a manifest are entries, so other files
+        that share cache_dir are left alone.
+        """
+        for content_hash in os.listdir(self.cache_dir):
+            content_dir = os.path.join(self.cache_dir, content_hash)
+            if not _is_hash(content_hash, CONTENT_HASH_SIZE) or not os.path.isdir(content_dir):
+                continue
+            for options_hash in os.listdir(content_dir):
+                entry_dir = os.path.join(content_dir, options_hash)
+                manifest_path = os.path.join(entry_dir, self.MANIFEST_NAME)
+                if not _is_hash(options_hash, OPTIONS_HASH_SIZE) or not os.path.isfile(manifest_path):
+                    continue
+                try:
+                    with open(manifest_path, encoding="utf-8") as file:
+                        yield entry_dir, json.load(file)
+                except (OSError, ValueError):
+                    yield entry_dir, {}
+
+    def _load_entry(self, entry_dir: str):
+        """
+        _load_entry  Loads a stored entry as DataFrames of memory-mapped columns, or None on a miss.
+        """
+        manifest_path = os.path.join(entry_dir, self.MANIFEST_NAME)
+        if not os.path.isfile(manifest_path):
+            return None
+        try:
+            with open(manifest_path, encoding="utf-8") as file:
+                manifest = json.load(file)
+            frames = tuple(self._load_frame(entry_dir, f, frame_columns)
+                           for f, frame_columns in enumerate(manifest["frames"]))
+            return frames if manifest["is_tuple"] else frames[0]
+        except (OSError, ValueError, KeyError):
+            # A partial or corrupt entry is treated as a miss and rewritten
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+
+    def _load_frame(self, entry_dir: str, f: int, frame_columns: list) -> pd.DataFrame:
+        columns = {}
+        for i, column in enumerate(frame_columns):
+            # Copy-on-write mapping so callers can modify the frame without touching the cache
+            values = np.load(os.path.join(entry_dir, f"{f}_{i}.npy"), mmap_mode="c").view(np.ndarray)
+            if column["kind"] == "text":
+                values = values.astype(object)
+                if column["has_nulls"]:
+                    values[np.load(os.path.join(entry_dir, f"{f}_{i}.mask.npy"))] = np.nan
+                columns[i] = pd.array(values, dtype=column["dtype"])
+            else:
+                columns[i] = values
+        # Built without copying, so numeric columns stay backed by the mapped files (concat would copy them into one block)
+        df = pd.DataFrame(columns, copy=False) if columns else pd.DataFrame()
+        df.columns = [column["name"] for column in frame_columns]
+        return df
+
+    def _store_entry(self, entry_dir: str, filepath: str, result) -> None:
+        """
+        _store_entry  Writes DataFrames as one .npy file per column, atomically replacing any existing entry.
+        """
+        is_tuple = isinstance(result, tuple)
+        frames = result if is_tuple else (result,)
+        os.makedirs(os.path.dirname(entry_dir), exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(entry_dir))
+        try:
+            manifest = {"source": os.path.abspath(filepath), "is_tuple": is_tuple,
+                        "frames": [self._store_frame(tmp_dir, f, df) for f, df in enumerate(frames)]}
+            with open(os.path.join(tmp_dir, self.MANIFEST_NAME), "w", encoding="utf-8") as file:
+                json.dump(manifest, file)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+        except OSError as e:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            print(f"Error writing the CSV cache entry: {e}")
+
+    def _store_frame(self, tmp_dir: str, f: int, df: pd.DataFrame) -> list:
+        columns = []
+        for i, name in enumerate(df.columns):
+            series = df.iloc[:, i]
+            if series.dtype.kind in "biuf":
+                np.save(os.path.join(tmp_dir, f"{f}_{i}.npy"), series.to_numpy())
+                columns.append({"name": name, "kind": "numeric", "dtype": str(series.dtype)})
+            else:
+                nulls = series.isna().to_numpy()
+                np.save(os.path.join(tmp_dir, f"{f}_{i}.npy"),
+                        series.astype(object).where(~nulls, "").to_numpy().astype(str))
+                if nulls.any():
+                    np.save(os.path.join(tmp_dir, f"{f}_{i}.mask.npy"), nulls)
+                columns.append({"name": name, "kind": "text", "dtype": str(series.dtype),
+                                "has_nulls": bool(nulls.any())})
+        return columns
@@ -1,31 +1,387 @@
+import numpy as np
 import pandas as pd
+import os
 import re
 import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .aero_table import AeroTable
+from .csv_cache import CSVCache
+from .or_export import read_or_export
+from .rasaero_reader import read_ras_aero_plot, read_ras_aero_plot_filtered, read_ras_flight
+from .units import OR_UNITS, RAS_SI_CONVERSIONS, UNITS_SI, convert, convert_columns
+
+
+OR_COLUMN_NAMES = {
+    "Time (s)": "time",
+    "Altitude (ft)": "altitude",
+    "Vertical velocity (m/s)": "vertical_velocity",
+    "Vertical acceleration (m/s²)": "vertical_acceleration",
+    "Total velocity (m/s)": "total_velocity",
+    "Total acceleration (m/s²)": "total_acceleration",
+    "Position East of launch (ft)": "position_east_of_launch",
+    "Position North of launch (ft)": "position_north_of_launch",
+    "Lateral distance (ft)": "lateral_distance",
+    "Lateral direction (°)": "lateral_direction",
+    "Lateral velocity (m/s)": "lateral_velocity",
+    "Lateral acceleration (m/s²)": "lateral_acceleration",
+    "Latitude (°)": "latitude",
+    "Longitude (°)": "longitudinal",
+    "Gravitational acceleration (m/s²)": "gravitation_acceleration",
+    "Angle of attack (°)": "angle_of_attack",
+    "Roll rate (r/s)": "roll_rate",
+    "Pitch rate (r/s)": "pitch_rate",
+    "Yaw rate (r/s)": "yaw_rate",
+    "Mass (g)": "mass",
+    "Motor mass (g)": "motor_mass",
+    "Longitudinal moment of inertia (kg·m²)": "longitudinal_moment_of_inertia",
+    "Rotational moment of inertia (kg·m²)": "rotational_moment_of_inertia",
+    "CP location (mm)": "cp_location",
+    "CG location (mm)": "cg_location",
+    "Stability margin calibers ()": "stability_margin_calibers",
+    "Mach number ()": "mach_number",
+    "Reynolds number ()": "reynolds_number",
+    "Thrust (N)": "thrust",
+    "Drag force (N)": "drag_force",
+    "Drag coefficient ()": "drag_coefficient",
+    "Axial drag coefficient ()": "axial_drag_coefficient",
+    "Friction drag coefficient ()": "friction_drag_coefficient",
+    "Pressure drag coefficient ()": "pressure_drag_coefficient",
+    "Base drag coefficient ()": "base_drag_coefficient",
+    "Normal force coefficient ()": "normal_force_coefficient",
+    "Pitch moment coefficient ()": "pitch_moment_coefficient",
+    "Yaw moment coefficient ()": "yaw_moment_coefficient",
+    "Side force coefficient ()": "side_force_coefficient",
+    "Roll moment coefficient ()": "roll_moment_coefficient",
+    "Roll forcing coefficient ()": "roll_forcing_coefficient",
+    "Roll damping coefficient ()": "roll_damping_coefficient",
+    "Pitch damping coefficient ()": "pitch_damping_coefficient",
+    "Coriolis acceleration (m/s²)": "coriolis_acceleration",
+    "Reference length (mm)": "reference_length",
+    "Reference area (cm²)": "reference_area",
+    "Vertical orientation (zenith) (°)": "vertical_orientation_zenith",
+    "Lateral orientation (azimuth) (°)": "lateral_orientation_azimuth",
+    "Wind velocity (m/s)": "wind_velocity",
+    "Air temperature (°C)": "air_temperature",
+    "Air pressure (mbar)": "air_pressure",
+    "Speed of sound (m/s)": "speed_of_sound",
+    "Simulation time step (s)": "simulation_time_step",
+    "Computation time (s)": "computation_time",
+    "Event": "event"
+}
+
+RAS_COLUMN_NAMES = {
+    "Time (sec)": "time",
+    "Altitude (ft)": "altitude",
+    "Stage": "stage",
+    "Stage Time (sec)": "stage_time",
+    "Distance (ft)": "distance",
+    "Mach Number": "mach_number",
+    "Angle of Attack (deg)": "angle_of_attack",
+    "CL":"lift_coefficient",
+    "CD": "drag_coefficient",
+    "Weight (lb)": "weight_imperial",
+    "Thrust (lb)": "thrust_imperial",
+    "Drag (lb)": "drag_force_imperial",
+    "Lift (lb)": "lift_force_imperial",
+    "CG (in)": "cg_location_imperial",
+    "CP (in)": "cp_location_imperial",
+    "Stability Margin (cal)": "stability_margin_calibers",
+    "Accel (ft/sec^2)": "total_acceleration_imperial",
+    "Accel-V (ft/sec^2)": "vertical_acceleration_imperial",
+    "Accel-H (ft/sec^2)": "horizontal_acceleration_imperial",
+    "Velocity (ft/sec)": "total_velocity_imperial",
+    "Vel-V (ft/sec)": "vertical_velocity_imperial",
+    "Vel-H (ft/sec)": "horizontal_velocity_imperial",
+    "Pitch Attitude (deg)": "pitch_attitude",
+    "Flight Path Angle (deg)": "flight_path_angle",
+}
+
+RAS_MACH_COLUMN_NAMES = {
+    "Mach": "mach_number",
+    "Alpha": "alpha",
+    "Stage": "stage",
+    "Stage Time (sec)": "stage_time",
+    "Mach Number": "mach_number",
+    "Angle of Attack (deg)": "angle_of_attack",
+    "CL":"lift_coefficient",
+    "CD": "drag_coefficient",
+    "CD Power-Off":"drag_coefficient_power_off",
+    "CD Power-On":"drag_coefficient_power_on",
+    "Reynolds Number": "reynolds_number",
+    "CP": "cp_location",
+    "CN":"normal_force_coefficient",
+    "CN Potential": "normal_force_coefficient_potential",
+    "CN Viscous": "normal_force_coefficient_viscous",
+    "CNalpha (0 to 4 deg) (per rad)": "normal_force_slope_angle_of_attack",
+    "CP (0 to 4 deg)": "cp_location_4_deg",
+    "CA Power-On":"axial_force_coefficient_power_on",
+    "CA Power-Off": "axial_force_coefficient_power_off"
+}
+
+# Columns kept in float64 by compact mode: the time grid and geodetic coordinates need the full precision
+COMPACT_FLOAT64_COLUMNS = ["Time (s)", "Latitude (°)", "Longitude (°)"]
+
+
+def compact_dataframe(df: pd.DataFrame, rtol: float = 1e-6, keep_float64: list = None, keep_columns: list = None) -> tuple:
+    """
+    compact_dataframe  Shrinks a DataFrame by downcasting float64 columns to float32 where the values survive the round trip
+    within ``rtol``, and by moving constant columns out of the frame.
+
+    :param df:  DataFrame to compact
+    :type df: pd.DataFrame
+    :param rtol:  Relative tolerance a float32 column must meet, defaults to 1e-6
+    :type rtol: float, optional
+    :param keep_float64:  Columns that are never downcast, defaults to None
+    :type keep_float64: list, optional
+    :param keep_columns:  Columns that are never moved out as constants, defaults to None
+    :type keep_columns: list, optional
+    :return:  Compacted DataFrame, dictionary of constant column values, and a report of the bytes saved
+    :rtype: tuple
+    """
+    keep_float64 = set(keep_float64 or [])
+    keep_columns = set(keep_columns or [])
+    bytes_before = int(df.memory_usage(deep=True).sum())
+
+    constants = {}
+    for column in df.columns:
+        if column not in keep_columns and len(df) > 0 and df[column].nunique(dropna=False) == 1:
+            value = df[column].iat[0]
+            constants[column] = value.item() if isinstance(value, np.generic) else value
+    df = df.drop(columns=list(constants))
+
+    float32_columns = []
+    for column in df.columns:
+        if df[column].dtype != np.float64 or column in keep_float64:
+            continue
+        values = df[column].to_numpy()
+        with np.errstate(over="ignore"):
+            downcast = values.astype(np.float32)
+        if np.allclose(downcast, values, rtol=rtol, atol=0, equal_nan=True):
+            float32_columns.append(column)
+    df = df.astype({column: np.float32 for column in float32_columns})
+
+    bytes_after = int(df.memory_usage(deep=True).sum())
+    report = {
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_saved": bytes_before - bytes_after,
+        "float32_columns": float32_columns,
+        "constant_columns": list(constants),
+    }
+    return df, constants, report
+
+
+def _is_or_export(filepath: str) -> bool:
+    """
+    _is_or_export  Tells OpenRocket exports (which start with '#' comment lines) apart from RASAero flight exports.
+    """
+    with open(filepath, "rb") as file:
+        return file.read(1) == b"#"
+
+
+def _split_projection(columns: list) -> tuple:
+    """
+    _split_projection  Splits a column projection into the columns that apply to OR exports and to RAS flight exports.
+
+    :param columns:  Column names, raw or snake_case; a snake_case name shared by both sources goes to both
+    :type columns: list
+    :return:  OR columns and RAS columns, both None when columns is None
+    :rtype: tuple
+    """
+    if columns is None:
+        return None, None
+    or_columns = [column for column in columns
+                  if any(column in (raw, snake) for raw, snake in OR_COLUMN_NAMES.items() if raw != "Event")]
+    ras_columns = [column for column in columns if any(column in (raw, snake) for raw, snake in RAS_COLUMN_NAMES.items())]
+    unknown = [column for column in columns if column not in or_columns and column not in ras_columns]
+    if unknown:
+        raise KeyError(f"Columns {unknown} are not OR or RAS flight columns")
+    return or_columns, ras_columns
+
+
+def _load_flight(filepath: str, columns: tuple = (None, None), compact: bool = False, cache: CSVCache = None) -> tuple:
+    """
+    _load_flight  Loads one OR or RASAero flight export. Module level so it can run in worker processes.
+
+    :param columns:  Column projections for OR and for RAS files, from _split_projection
+    :type columns: tuple, optional
+    :return:  Source name ("OR" or "RAS") and the flight DataFrame
+    :rtype: tuple
+    """
+    or_columns, ras_columns = columns
+    if _is_or_export(filepath):
+        dh = DataHandler(or_filepath=filepath, cache=cache, compact=compact, columns=or_columns)
+        return "OR", dh.merged_df
+    dh = DataHandler(ras_file_path=filepath, cache=cache, columns=ras_columns)
+    return "RAS", dh.ras_df
 
 
 class DataHandler:
     """Handles data operations for rocket analysis."""
 
-    def __init__(self, or_filepath: str = "", ras_cd_filepath: str = "", ras_file_path: str = ""):
+    def __init__(self, or_filepath: str = "", ras_cd_filepath: str = "", ras_file_path: str = "", cache: CSVCache = None, compact: bool = False, columns: list = None,
+                 max_ras_mach: float = 2.0, ras_alpha=None, ras_chunksize: int = None, ras_engine: str = "auto",
+                 float_precision: str = None):
         """
         __init__  Initializes the DataHandler class with a given file path.
 
         :param or_filepath:  Filepath to the OR rocket exported CSV file
         :type or_filepath: str 
-        """
+        :param cache:  Optional on-disk cache used for the CSV reads, defaults to None
+        :type cache: CSVCache, optional
+        :param compact:  Stores the OR data in a memory-compact form (float32 columns, constant columns in ``constants``,
+            categorical events, no intermediate frames), defaults to False
+        :type compact: bool, optional
+        :param columns:  Columns to load, as raw headers or the snake_case names used by the rename methods. Only these
+            (plus time) are parsed; others are loaded on first access through get_column. Defaults to None for every column
+        :type columns: list, optional
+        :param max_ras_mach:  Maximum Mach number kept from the RAS Aero Mach CSV file, defaults to 2.0
+        :type max_ras_mach: float, optional
+        :param ras_alpha:  Angle of attack, or list of angles, kept from the RAS Aero Mach CSV file, defaults to None for every angle
+        :type ras_alpha: float or list, optional
+        :param ras_chunksize:  Streams the RAS Aero Mach CSV file in chunks of this many rows, filtering while parsing so only
+            the kept rows are held in ras_mach_df. Defaults to None to read the whole file
+        :type ras_chunksize: int, optional
+        :param ras_engine:  CSV engine for the RAS Aero files, "auto", "c" or "pyarrow" (optional dependency). Streaming
+            always uses "c". Defaults to "auto" for pyarrow when it is installed, else "c"
+        :type ras_engine: str, optional
+        :param float_precision:  Float converter of the C engine for the RAS Aero files (None, "high", "legacy" or
+            "round_trip"), defaults to None
+        :type float_precision: str, optional
+        """
+        self.cache = cache
+        self.compact = compact
+        self.constants = {}
+        self.compact_report = None
         self.or_filepath = or_filepath
         self.ras_cd_filepath = ras_cd_filepath
         self.ras_file_path = ras_file_path
         self.df = None
+        self.events_df = None
         self.comments_df = None
+        self.event_rows = None
+        self.event_index = {}
         self.merged_df = None
         self.filtered_or_df = None
         self.ras_df = None
         self.ras_mach_df = None
         self.filtered_ras_df = None
-        self.max_RAS_mach = 2.0
+        self.max_RAS_mach = max_ras_mach
+        self.ras_alpha = ras_alpha
+        self.ras_chunksize = ras_chunksize
+        self._ras_streamed_mach = None
+        self._ras_streamed_alpha = None
+        self.ras_engine = ras_engine
+        self.float_precision = float_precision
+        self.or_usecols = None
+        self.ras_usecols = None
+        self.or_units_SI = False
+        if columns is not None:
+            self.or_usecols, self.ras_usecols = self._split_columns(columns)
+            self.or_usecols.insert(0, "Time (s)")
+            self.ras_usecols.insert(0, "Time (sec)")
         self._prepare_dataframes()
 
+    @classmethod
+    def load_many(cls, filepaths: list, workers: int = None, columns: list = None, compact: bool = False,
+                  cache: CSVCache = None, progress=True) -> pd.DataFrame:
+        """
+        load_many  Loads many OR and RASAero flight exports in a process pool into one long-format DataFrame.
+
+        Each file becomes a run, identified by its file name without extension in the ``run_id`` column, with the
+        ``source`` column telling OR and RAS runs apart. Files that fail to load are reported and skipped.
+
+        :param filepaths:  Paths to the exported CSV files
+        :type filepaths: list
+        :param workers:  Number of worker processes, defaults to None for one per CPU. 1 loads in this process
+        :type workers: int, optional
+        :param columns:  Column projection, as raw headers or snake_case names. Each file only loads the columns of its
+            own source (plus time); a name that is neither an OR nor a RAS flight column raises a KeyError before
+            anything is loaded. Defaults to None for every column
+        :type columns: list, optional
+        :param compact:  Loads OR files in compact mode, defaults to False
+        :type compact: bool, optional
+        :param cache:  On-disk cache shared by the workers, defaults to None. Hit/miss counters stay in the workers
+        :type cache: CSVCache, optional
+        :param progress:  True to print progress, or a callable taking (completed, total, filepath), defaults to True
+        :type progress: bool or callable, optional
+        :return:  Long-format DataFrame of every run
+        :rtype: pd.DataFrame
+        """
+        filepaths = list(filepaths)
+        columns = _split_projection(columns)
+        run_ids = [os.path.splitext(os.path.basename(filepath))[0] for filepath in filepaths]
+        duplicated = {run_id for run_id in run_ids if run_ids.count(run_id) > 1}
+        run_ids = [filepath if run_id in duplicated else run_id for run_id, filepath in zip(run_ids, filepaths)]
+
+        if progress is True:
+            def progress(completed, total, filepath):
+                print(f"Loaded {completed}/{total}: {filepath}")
+
+        results = [None] * len(filepaths)
+
+        def collect(i, load):
+            try:
+                results[i] = load()
+            except Exception as e:
+                print(f"Error loading {filepaths[i]}: {e}")
+            if progress:
+                progress(completed, len(filepaths), filepaths[i])
+
+        completed = 0
+        if workers == 1:
+            for i, filepath in enumerate(filepaths):
+                completed += 1
+                collect(i, lambda: _load_flight(filepath, columns, compact, cache))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_load_flight, filepath, columns, compact, cache): i
+                           for i, filepath in enumerate(filepaths)}
+                for future in as_completed(futures):
+                    completed += 1
+                    collect(futures[future], future.result)
+
+        frames = []
+        for run_id, result in zip(run_ids, results):
+            if result is None:
+                continue
+            source, df = result
+            df = df.assign(run_id=run_id, source=source)
+            frames.append(df[["run_id", "source"] + [column for column in df.columns if column not in ("run_id", "source")]])
+        if not frames:
+            return pd.DataFrame(columns=["run_id", "source"])
+        flights = pd.concat(frames, ignore_index=True)
+        flights["run_id"] = pd.Categorical(flights["run_id"], categories=[run_id for run_id, result in zip(run_ids, results)
+                                                                         if result is not None])
+        flights["source"] = flights["source"].astype("category")
+        return flights
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, events_df: pd.DataFrame = None, compact: bool = False) -> "DataHandler":
+        """
+        from_dataframe  Creates a DataHandler from OR-format data held in memory, such as a simulated trajectory, as if it
+        had been read from an OR export.
+
+        :param df:  Data with raw OR headers, "Time (s)" first, in the units OpenRocket exports
+        :type df: pd.DataFrame
+        :param events_df:  Events with "Time (s)" and "Event" columns, using OpenRocket's event names (LAUNCH, BURNOUT,
+            APOGEE, ...), defaults to None for no events
+        :type events_df: pd.DataFrame, optional
+        :param compact:  Stores the data in compact form, defaults to False
+        :type compact: bool, optional
+        :return:  DataHandler with merged_df and the event lookups set up
+        :rtype: DataHandler
+        """
+        handler = cls(compact=compact)
+        # A shallow copy, so the Event column and later conversions land on the handler's frame, not the caller's
+        handler.df = df.copy(deep=False)
+        if events_df is None:
+            events_df = pd.DataFrame({"Time (s)": pd.Series(dtype="float64"), "Event": pd.Series(dtype="str")})
+        handler.events_df = events_df
+        handler._prepare_or_dataframes()
+        return handler
+
     def set_max_RAS_mach(self, max_mach: float) -> None:
         """
         set_max_RAS_mach   Sets the maximum Mach number for the RAS Aero CSV file.
@@ -35,33 +391,189 @@ class DataHandler:
         """
         self.max_RAS_mach = max_mach
 
+    def set_RAS_alpha(self, alpha) -> None:
+        """
+        set_RAS_alpha   Sets the angle of attack, or list of angles, kept from the RAS Aero CSV file.
+
+        :param alpha:  Angle of attack, or list of angles, None for every angle
+        :type alpha: float or list
+        """
+        self.ras_alpha = alpha
+
+    def _read_csv(self, filepath: str, **read_kwargs) -> pd.DataFrame:
+        """
+        _read_csv  Reads a CSV file, going through the on-disk cache when one is configured.
+
+        :param filepath:  Path to the CSV file
+        :type filepath: str
+        :return:  Parsed DataFrame
+        :rtype: pd.DataFrame
+        """
+        return self._read(filepath, pd.read_csv, **read_kwargs)
+
+    def _read(self, filepath: str, reader, **read_kwargs):
+        """
+        _read  Parses a file with the given reader, going through the on-disk cache when one is configured.
+
+        :param filepath:  Path to the file
+        :type filepath: str
+        :param reader:  Callable returning a DataFrame or a tuple of DataFrames
+        :type reader: callable
+        :return:  Result of the reader
+        :rtype: pd.DataFrame or tuple
+        """
+        if self.cache is None:
+            return reader(filepath, **read_kwargs)
+        return self.cache.read(filepath, reader, **read_kwargs)
+
     def _read_OR_csv(self) -> None:
         """
-        _read_OR_csv  Reads the Open Rocket CSV file and stores it in a DataFrame.
+        _read_OR_csv  Reads the Open Rocket CSV file in a single pass, storing the data rows and the raw events separately.
         """
         try:
-            self.df = pd.read_csv(self.or_filepath, delimiter=",", skiprows=6)
+            usecols = tuple(dict.fromkeys(self.or_usecols)) if self.or_usecols is not None else None
+            self.df, self.events_df = self._read(self.or_filepath, read_or_export, usecols=usecols)
         except Exception as e:
             print(f"Error reading the OR CSV file: {e}")
 
     def _read_RASAero_Mach_csv(self) -> None:
         """
-        _read_RASAero_Mach_csv  Reads the RAS Aero Mach CSV file and stores it in a Dataframe.
+        _read_RASAero_Mach_csv  Reads the RAS Aero Mach CSV file and stores it in a Dataframe. When streaming, only the rows
+        under the Mach ceiling at the selected angles of attack are kept.
         """
         try:
-            self.ras_mach_df = pd.read_csv(self.ras_cd_filepath)
+            if self.ras_chunksize is None:
+                self.ras_mach_df = self._read(self.ras_cd_filepath, read_ras_aero_plot, engine=self.ras_engine,
+                                              float_precision=self.float_precision)
+            else:
+                alpha = self._ras_alpha_selection()
+                self.ras_mach_df = self._read(self.ras_cd_filepath, read_ras_aero_plot_filtered, max_mach=self.max_RAS_mach,
+                                              alpha=alpha, chunksize=self.ras_chunksize, float_precision=self.float_precision)
+                self._ras_streamed_mach = self.max_RAS_mach
+                self._ras_streamed_alpha = alpha
         except Exception as e:
             print(f"Error reading the RAS CSV file: {e}")
 
+    def _ras_alpha_selection(self) -> list:
+        """
+        _ras_alpha_selection  Returns the alpha selection as a list, as passed to the streaming reader.
+
+        :return:  Selected angles of attack, None for every angle
+        :rtype: list
+        """
+        return None if self.ras_alpha is None else np.atleast_1d(self.ras_alpha).tolist()
+
+    def _ras_stream_is_stale(self) -> bool:
+        """
+        _ras_stream_is_stale  Checks whether the streamed RAS Aero Mach rows miss rows now asked for: they stop at the
+        Mach ceiling and only hold the alpha selection they were streamed with.
+
+        :return:  True when streaming and the file must be streamed again
+        :rtype: bool
+        """
+        if self.ras_chunksize is None:
+            return False
+        return self.max_RAS_mach > self._ras_streamed_mach or self._ras_alpha_selection() != self._ras_streamed_alpha
+
     def _read_RASAero_csv(self) -> None:
         """
         _read_RASAero_csv  Reads the RasAero CSV file and stores it in a Dataframe.
         """
         try:
-            self.ras_df = pd.read_csv(self.ras_file_path)
+            usecols = list(dict.fromkeys(self.ras_usecols)) if self.ras_usecols is not None else None
+            self.ras_df = self._read(self.ras_file_path, read_ras_flight, engine=self.ras_engine,
+                                     float_precision=self.float_precision, usecols=usecols)
         except Exception as e:
             print(f"Error reading the RAS CSV file: {e}")
 
+    def _split_columns(self, columns: list) -> tuple:
+        """
+        _split_columns  Resolves requested column names to the raw OR and RAS headers they refer to.
+
+        :param columns:  Column names, raw or snake_case
+        :type columns: list
+        :return:  Raw OR header names and raw RAS header names
+        :rtype: tuple
+        """
+        or_columns = []
+        ras_columns = []
+        unknown = []
+        for column in columns:
+            or_matches = [raw for raw, snake in OR_COLUMN_NAMES.items() if column in (raw, snake) and raw != "Event"]
+            ras_matches = [raw for raw, snake in RAS_COLUMN_NAMES.items() if column in (raw, snake)]
+            if self.or_filepath == "" and self.merged_df is None:
+                or_matches = []
+            if self.ras_file_path == "":
+                ras_matches = []
+            if not or_matches and not ras_matches:
+                unknown.append(column)
+            or_columns += or_matches
+            ras_columns += ras_matches
+        if unknown:
+            raise KeyError(f"Columns {unknown} are not in the loaded OR or RAS flight data")
+        return or_columns, ras_columns
+
+    def load_columns(self, columns: list) -> None:
+        """
+        load_columns  Loads columns that were left out by the ``columns`` projection into merged_df and ras_df.
+        Columns already loaded are skipped, and loaded columns follow the current (raw or renamed) naming of each frame,
+        and its units once convert_or_units_to_SI has run.
+
+        :param columns:  Column names, raw or snake_case
+        :type columns: list
+        """
+        or_columns, ras_columns = self._split_columns(columns)
+
+        if self.merged_df is not None:
+            renamed = "time" in self.merged_df.columns
+            missing = [raw for raw in dict.fromkeys(or_columns)
+                       if raw not in self.merged_df.columns and OR_COLUMN_NAMES[raw] not in self.merged_df.columns
+                       and raw not in self.constants and OR_COLUMN_NAMES[raw] not in self.constants]
+            if missing and self.or_filepath == "":
+                # Data built in memory (from_dataframe) has no file to load further columns from
+                raise KeyError(f"Columns {missing} are not in the OR data")
+            if missing:
+                data_df, _ = self._read(self.or_filepath, read_or_export, usecols=tuple(missing))
+                for raw in missing:
+                    values = data_df[raw].to_numpy()
+                    unit = OR_UNITS.get(OR_COLUMN_NAMES[raw])
+                    if self.or_units_SI and unit is not None:
+                        # The rest of merged_df is already in SI units
+                        values = convert(values, unit, UNITS_SI[unit])
+                    self.merged_df[OR_COLUMN_NAMES[raw] if renamed else raw] = values
+                self.or_usecols += missing
+
+        if self.ras_df is not None:
+            renamed = "time" in self.ras_df.columns
+            missing = [raw for raw in dict.fromkeys(ras_columns)
+                       if raw not in self.ras_df.columns and RAS_COLUMN_NAMES[raw] not in self.ras_df.columns]
+            if missing:
+                data_df = self._read(self.ras_file_path, read_ras_flight, engine=self.ras_engine,
+                                     float_precision=self.float_precision, usecols=missing)
+                for raw in missing:
+                    self.ras_df[RAS_COLUMN_NAMES[raw] if renamed else raw] = data_df[raw].to_numpy()
+                self.ras_usecols += missing
+
+    def get_column(self, column: str) -> pd.Series:
+        """
+        get_column  Returns a column of the OR data, or of the RAS flight data when there is no OR file, loading it on first access.
+
+        :param column:  Column name, raw or snake_case
+        :type column: str
+        :return:  Column values
+        :rtype: pd.Series
+        """
+        self.load_columns([column])
+        df = self.merged_df if self.merged_df is not None else self.ras_df
+        for raw, snake in {**RAS_COLUMN_NAMES, **OR_COLUMN_NAMES}.items():
+            if column in (raw, snake):
+                for name in (raw, snake):
+                    if name in df.columns:
+                        return df[name]
+                    if name in self.constants:
+                        return pd.Series(self.constants[name], index=df.index, name=name)
+        return df[column]
+
     def export_mach_cd_df_to_txt(self, OUTPUT_FILE_PATH: str):
         """
         export_mach_cd_df_to_txt  Exports the Mach and CD DataFrame to a tab-delimited text file.
@@ -81,9 +593,7 @@ class DataHandler:
         """
         if self.or_filepath != "":
             self._read_OR_csv()
-            self._filter_comments()
-            self.filtered_or_df = self._filter_data()
-            self.merged_df = self._merge_dataframes()
+            self._prepare_or_dataframes()
 
         if self.ras_cd_filepath != "":
             self._read_RASAero_Mach_csv()
@@ -92,89 +602,96 @@ class DataHandler:
         if self.ras_file_path != "":
             self._read_RASAero_csv()
 
+    def _prepare_or_dataframes(self) -> None:
+        """
+        _prepare_or_dataframes  Builds the filtered and merged OR dataframes and the event index from df and events_df.
+        """
+        self._filter_comments()
+        self.filtered_or_df = self._filter_data()
+        self.merged_df = self._merge_dataframes()
+        self._build_event_index()
+        if self.compact:
+            self._compact_or_data()
+
     def filter_mach_from_ras_csv(self) -> None:
         """
-        filter_mach_from_ras_csv  Filters the RAS Aero CSV file by Mach number.
+        filter_mach_from_ras_csv  Filters the RAS Aero CSV file by Mach number, and by angle of attack when one is set.
         """
+        if self._ras_stream_is_stale():
+            self._read_RASAero_Mach_csv()
         filtered_RAS_df = self.ras_mach_df[self.ras_mach_df["Mach"]
                                            <= self.max_RAS_mach]
-        filtered_RAS_df = filtered_RAS_df.drop_duplicates(subset=['Mach'])
+        if self.ras_alpha is None:
+            filtered_RAS_df = filtered_RAS_df.drop_duplicates(subset=['Mach'])
+        else:
+            filtered_RAS_df = filtered_RAS_df[filtered_RAS_df["Alpha"].isin(np.atleast_1d(self.ras_alpha))]
+            filtered_RAS_df = filtered_RAS_df.drop_duplicates(subset=['Mach', 'Alpha'])
         self.filtered_ras_df = filtered_RAS_df
 
+    def aero_table(self, coefficients: list = None) -> AeroTable:
+        """
+        aero_table  Builds a Mach x alpha lookup table from the RAS Aero Mach data, up to the maximum Mach number.
+
+        Every angle of attack in the export is tabulated (filtered_ras_df keeps only the first alpha per Mach), unless an
+        alpha selection is set. When streaming without an alpha selection, ras_mach_df only holds the first alpha per
+        Mach, so the file is streamed again keeping every angle.
+
+        :param coefficients:  Coefficient columns to tabulate, defaults to None for AERO_COEFFICIENTS
+        :type coefficients: list, optional
+        :return:  Lookup table
+        :rtype: AeroTable
+        """
+        if self.ras_mach_df is None:
+            raise ValueError("No RAS Aero Mach data loaded")
+        if self.ras_chunksize is not None and self.ras_alpha is None:
+            return AeroTable.from_dataframe(
+                self._read(self.ras_cd_filepath, read_ras_aero_plot_filtered, max_mach=self.max_RAS_mach,
+                           chunksize=self.ras_chunksize, float_precision=self.float_precision, every_alpha=True),
+                coefficients=coefficients, max_mach=self.max_RAS_mach)
+        if self._ras_stream_is_stale():
+            self._read_RASAero_Mach_csv()
+        df = self.ras_mach_df
+        if self.ras_alpha is not None:
+            df = df[df["Alpha"].isin(np.atleast_1d(self.ras_alpha))]
+        return AeroTable.from_dataframe(df, coefficients=coefficients, max_mach=self.max_RAS_mach)
+
     def _filter_comments(self) -> None:
         """
-        _filter_comments  Filters comments from the main DataFrame and stores them separately.
+        _filter_comments  Processes the events parsed from the comment lines and stores them separately.
         """
-        comments_mask = self.df["# Time (s)"].astype(str).str.contains("#")
-        comments_df = self.df[comments_mask].copy()
-        comments_df["Time (s)"] = comments_df["# Time (s)"].apply(
-            self._extract_time)
-        comments_df["Event"] = comments_df["# Time (s)"].apply(
-            self._extract_event)
-        self.comments_df = self._process_comment_events(comments_df)
+        self.comments_df = self._process_comment_events(self.events_df.copy())
 
     def _filter_data(self) -> pd.DataFrame:
         """
-        _filter_data  Filters out comment rows from the main DataFrame.
+        _filter_data  Returns the data rows of the OR export. Comment rows are already split off by the reader.
 
         :return:  Filtered DataFrame
         :rtype: pd.DataFrame
         """
-        filtered_or_df = self.df[~self.df["# Time (s)"].astype(
-            str).str.contains("#")].copy()
-        filtered_or_df.rename(columns={"# Time (s)": "Time (s)"}, inplace=True)
-        return filtered_or_df
+        return self.df
 
     def _merge_dataframes(self) -> pd.DataFrame:
         """
-        _merge_dataframes  Merges the filtered data with the comments data. As well as cleans U+200B characters.
+        _merge_dataframes  Attaches the events to the filtered data. Each event is matched to the sample nearest to its time
+        with an as-of join, and kept in a sparse side-table (``event_rows``) keyed by row position. The Event column is
+        added to the filtered DataFrame in place rather than building a merged copy.
 
         :return:  Merged DataFrame
         :rtype: pd.DataFrame
         """
-        # Convert 'Time (s)' in both dataframes to float
-        self.filtered_or_df["Time (s)"] = pd.to_numeric(
-            self.filtered_or_df["Time (s)"], errors='coerce')
-        if self.comments_df is not None:
-            self.comments_df["Time (s)"] = pd.to_numeric(
-                self.comments_df["Time (s)"], errors='coerce')
-
-        # Perform the merge
-        merged = self.filtered_or_df.merge(
-            self.comments_df, on="Time (s)", how="left")
-
-        # Clean U+200B characters from data
-        for column in merged.columns:
-            if merged[column].dtype == object:
-                merged[column] = merged[column].str.replace('\u200b', '')
-
-        # Clean U+200B characters from column names
-        merged.columns = [col.replace('\u200b', '') for col in merged.columns]
+        merged = self.filtered_or_df
+        sample_times = pd.DataFrame({"Time (s)": merged["Time (s)"].to_numpy(), "Row": np.arange(len(merged))})
+        events = self.comments_df.sort_values("Time (s)", kind="stable")
+        events = pd.merge_asof(events, sample_times.dropna(), on="Time (s)", direction="nearest")
+        self.event_rows = events.set_index("Row")[["Time (s)", "Event"]]
+
+        # Events landing on the same sample share the row, joined the way OpenRocket's combined events are
+        row_events = self.event_rows["Event"].groupby(level=0, sort=False).agg("/".join)
+        event_column = pd.Series(np.nan, index=merged.index, dtype=self.event_rows["Event"].dtype)
+        event_column.iloc[row_events.index.to_numpy()] = row_events.to_numpy()
+        merged["Event"] = event_column
         return merged
 
-    def _extract_time(self, text: str) -> float:
-        """
-        _extract_time  Extracts time from a comment string. The string must be in the format: "occurred at t=0.000 seconds"
-
-        :param text:  Comment string
-        :type text: str
-        :return:  Time in seconds
-        :rtype: float
-        """
-        match = re.search(r"t=([\d\.]+)", text)
-        return float(match.group(1)) if match else None
-
-    def _extract_event(self, text: str) -> str:
-        """
-        _extract_event  Extracts event name from a comment string. The string must be in the format: "occurred at t=0.000 seconds"
-
-        :param text:  Comment string
-        :type text: str
-        :return:  Event name
-        :rtype: str
-        """
-        return text.replace(r"occurred at t=[\d\.]+ seconds", "").replace("#", "").strip()
-
     def _process_comment_events(self, comments_df: pd.DataFrame) -> pd.DataFrame:
         """
         _process_comment_events  Processes events in the comments dataframe. This includes removing non-caps words, replacing events, and removing events.
@@ -185,7 +702,9 @@ class DataHandler:
         :rtype: pd.DataFrame
         """
 
-        comments_df["Event"] = comments_df["Event"].apply(self.remove_non_caps)
+        # Keep only the all-caps words, as remove_non_caps does, without a per-row Python call
+        comments_df["Event"] = comments_df["Event"].str.findall(
+            r"(?<!\S)(?=\S*[A-Z])[^\sa-z]+(?!\S)").str.join(" ").astype(comments_df["Event"].dtype)
         events_to_replace = {
             "LAUNCH": "LAUNCH/IGNITION",
             "BURNOUT": "BURNOUT/EJECTION_CHARGE",
@@ -196,6 +715,90 @@ class DataHandler:
         comments_df = comments_df[~comments_df["Event"].isin(events_to_remove)]
         return comments_df[["Time (s)", "Event"]]
 
+    def _compact_or_data(self) -> None:
+        """
+        _compact_or_data  Replaces merged_df with its compacted form and drops the intermediate OR frames.
+        The number of bytes saved is stored in ``compact_report``.
+        """
+        merged_df, self.constants, self.compact_report = compact_dataframe(
+            self.merged_df, keep_float64=COMPACT_FLOAT64_COLUMNS, keep_columns=["Time (s)", "Event"])
+        merged_df["Event"] = merged_df["Event"].astype("category")
+        self.compact_report["bytes_after"] = int(merged_df.memory_usage(deep=True).sum())
+        self.compact_report["bytes_saved"] = self.compact_report["bytes_before"] - self.compact_report["bytes_after"]
+        self.merged_df = merged_df
+        self.df = None
+        self.filtered_or_df = None
+
+    def _build_event_index(self) -> None:
+        """
+        _build_event_index  Builds the event name -> (row position, time) index from the event side-table.
+        Combined events such as "BURNOUT/EJECTION_CHARGE" are also reachable by each of their parts.
+        The first occurrence of a name wins, as with the previous scans of the Event column.
+        """
+        self.event_index = {}
+        for row, time, event in zip(self.event_rows.index, self.event_rows["Time (s)"], self.event_rows["Event"]):
+            self.event_index.setdefault(event, (int(row), float(time)))
+        for event, entry in list(self.event_index.items()):
+            for part in event.split("/"):
+                self.event_index.setdefault(part, entry)
+
+    def _resolve_or_column(self, column: str) -> str:
+        """
+        _resolve_or_column  Maps a raw OR header or its snake_case name to the name currently used in merged_df.
+
+        :param column:  Column name, raw or renamed
+        :type column: str
+        :return:  Column name present in merged_df, or in constants for a compacted constant column
+        :rtype: str
+        """
+        if column in self.merged_df.columns or column in self.constants:
+            return column
+        for raw_name, snake_name in OR_COLUMN_NAMES.items():
+            if column in (raw_name, snake_name):
+                for name in (raw_name, snake_name):
+                    if name in self.merged_df.columns or name in self.constants:
+                        return name
+        raise KeyError(f"Column {column!r} is not in the OR data")
+
+    def find_event_value(self, event_name: str, column: str):
+        """
+        find_event_value  Finds the value of a column at the sample where a specific event occurred.
+
+        :param event_name:  Event name
+        :type event_name: str
+        :param column:  Column name, either the raw OR header or its renamed snake_case form
+        :type column: str
+        :return:  Value at the event, or None when the event did not occur
+        """
+        entry = self.event_index.get(event_name)
+        if entry is None:
+            return None
+        column = self._resolve_or_column(column)
+        if column in self.constants:
+            return self.constants[column]
+        value = self.merged_df[column].iat[entry[0]]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def event_table(self, columns: list = None) -> pd.DataFrame:
+        """
+        event_table  Returns every event with its time and the values of the requested columns at the event sample.
+
+        :param columns:  Column names, raw or renamed, defaults to None
+        :type columns: list, optional
+        :return:  DataFrame indexed by event name
+        :rtype: pd.DataFrame
+        """
+        columns = [self._resolve_or_column(column) for column in (columns or [])]
+        table = self.event_rows.reset_index()
+        values = self.merged_df[[column for column in columns if column not in self.constants]].take(
+            table["Row"].to_numpy())
+        values.index = table.index
+        table = pd.concat([table, values], axis=1).set_index("Event")
+        for column in columns:
+            if column in self.constants:
+                table[column] = self.constants[column]
+        return table[["Row", "Time (s)"] + columns]
+
     def find_event_time(self, event_name: str) -> float:
         """
         find_event_time  Finds the time when a specific event occurred.
@@ -205,9 +808,8 @@ class DataHandler:
         :return:  Time in seconds
         :rtype: float
         """
-        event_time = self.merged_df.loc[self.merged_df["Event"]
-                                        == event_name, "Time (s)"]
-        return float(event_time.iloc[0]) if not event_time.empty else None
+        entry = self.event_index.get(event_name)
+        return entry[1] if entry is not None else None
 
     def find_event_mach(self, event_name: str) -> float:
         """
@@ -218,10 +820,7 @@ class DataHandler:
         :return:  Mach number
         :rtype: float
         """
-
-        event_mach = self.merged_df.loc[self.merged_df["Event"]
-                                        == event_name, "Mach number ()"]
-        return float(event_mach.iloc[0]) if not event_mach.empty else None
+        return self.find_event_value(event_name, "Mach number ()")
 
     def remove_non_caps(self, text: str) -> str:
         """
@@ -235,135 +834,34 @@ class DataHandler:
         return " ".join(word for word in text.split() if word.isupper())
 
     def rename_or_df_columns(self):
-        rename_cols = {
-            "Time (s)": "time",
-            "Altitude (ft)": "altitude",
-            "Vertical velocity (m/s)": "vertical_velocity",
-            "Vertical acceleration (m/s²)": "vertical_acceleration",
-            "Total velocity (m/s)": "total_velocity",
-            "Total acceleration (m/s²)": "total_acceleration",
-            "Position East of launch (ft)": "position_east_of_launch",
-            "Position North of launch (ft)": "position_north_of_launch",
-            "Lateral distance (ft)": "lateral_distance",
-            "Lateral direction (°)": "lateral_direction",
-            "Lateral velocity (m/s)": "lateral_velocity",
-            "Lateral acceleration (m/s²)": "lateral_acceleration",
-            "Latitude (°)": "latitude",
-            "Longitude (°)": "longitudinal",
-            "Gravitational acceleration (m/s²)": "gravitation_acceleration",
-            "Angle of attack (°)": "angle_of_attack",
-            "Roll rate (r/s)": "roll_rate",
-            "Pitch rate (r/s)": "pitch_rate",
-            "Yaw rate (r/s)": "yaw_rate",
-            "Mass (g)": "mass",
-            "Motor mass (g)": "motor_mass",
-            "Longitudinal moment of inertia (kg·m²)": "longitudinal_moment_of_inertia",
-            "Rotational moment of inertia (kg·m²)": "rotational_moment_of_inertia",
-            "CP location (mm)": "cp_location",
-            "CG location (mm)": "cg_location",
-            "Stability margin calibers ()": "stability_margin_calibers",
-            "Mach number ()": "mach_number",
-            "Reynolds number ()": "reynolds_number",
-            "Thrust (N)": "thrust",
-            "Drag force (N)": "drag_force",
-            "Drag coefficient ()": "drag_coefficient",
-            "Axial drag coefficient ()": "axial_drag_coefficient",
-            "Friction drag coefficient ()": "friction_drag_coefficient",
-            "Pressure drag coefficient ()": "pressure_drag_coefficient",
-            "Base drag coefficient ()": "base_drag_coefficient",
-            "Normal force coefficient ()": "normal_force_coefficient",
-            "Pitch moment coefficient ()": "pitch_moment_coefficient",
-            "Yaw moment coefficient ()": "yaw_moment_coefficient",
-            "Side force coefficient ()": "side_force_coefficient",
-            "Roll moment coefficient ()": "roll_moment_coefficient",
-            "Roll forcing coefficient ()": "roll_forcing_coefficient",
-            "Roll damping coefficient ()": "roll_damping_coefficient",
-            "Pitch damping coefficient ()": "pitch_damping_coefficient",
-            "Coriolis acceleration (m/s²)": "coriolis_acceleration",
-            "Reference length (mm)": "reference_length",
-            "Reference area (cm²)": "reference_area",
-            "Vertical orientation (zenith) (°)": "vertical_orientation_zenith",
-            "Lateral orientation (azimuth) (°)": "lateral_orientation_azimuth",
-            "Wind velocity (m/s)": "wind_velocity",
-            "Air temperature (°C)": "air_temperature",
-            "Air pressure (mbar)": "air_pressure",
-            "Speed of sound (m/s)": "speed_of_sound",
-            "Simulation time step (s)": "simulation_time_step",
-            "Computation time (s)": "computation_time",
-            "Event": "event"
-        }
-        self.merged_df.rename(columns=rename_cols, inplace=True)
+        self.merged_df.rename(columns=OR_COLUMN_NAMES, inplace=True)
+        self.constants = {OR_COLUMN_NAMES.get(column, column): value for column, value in self.constants.items()}
 
     def rename_ras_df_columns(self):
-        rename_cols = {
-            "Time (sec)": "time",
-            "Altitude (ft)": "altitude",
-            "Stage": "stage",
-            "Stage Time (sec)": "stage_time",
-            "Distance (ft)": "distance",
-            "Mach Number": "mach_number",
-            "Angle of Attack (deg)": "angle_of_attack",
-            "CL":"lift_coefficient",
-            "CD": "drag_coefficient",
-            "Weight (lb)": "weight_imperial",
-            "Thrust (lb)": "thrust_imperial",
-            "Drag (lb)": "drag_force_imperial",
-            "Lift (lb)": "lift_force_imperial",
-            "CG (in)": "cg_location_imperial",
-            "CP (in)": "cp_location_imperial",
-            "Stability Margin (cal)": "stability_margin_calibers",
-            "Accel (ft/sec^2)": "total_acceleration_imperial",
-            "Accel-V (ft/sec^2)": "vertical_acceleration_imperial",
-            "Accel-H (ft/sec^2)": "horizontal_acceleration_imperial",
-            "Velocity (ft/sec)": "total_velocity_imperial",
-            "Vel-V (ft/sec)": "vertical_velocity_imperial",
-            "Vel-H (ft/sec)": "horizontal_velocity_imperial",
-            "Pitch Attitude (deg)": "pitch_attitude",
-            "Flight Path Angle (deg)": "flight_path_angle",
-        }
-        self.ras_df.rename(columns=rename_cols, inplace=True)
+        self.ras_df.rename(columns=RAS_COLUMN_NAMES, inplace=True)
 
     def rename_ras_mach_cd_df_columns(self):
-            rename_cols = {
-                "Mach": "mach_number",
-                "Alpha": "alpha",
-                "Stage": "stage",
-                "Stage Time (sec)": "stage_time",
-                "Mach Number": "mach_number",
-                "Angle of Attack (deg)": "angle_of_attack",
-                "CL":"lift_coefficient",
-                "CD": "drag_coefficient",
-                "CD Power-Off":"drag_coefficient_power_off",
-                "CD Power-On":"drag_coefficient_power_on",
-                "Reynolds Number": "reynolds_number",
-                "CP": "cp_location",
-                "CN":"normal_force_coefficient",
-                "CN Potential": "normal_force_coefficient_potential",
-                "CN Viscous": "normal_force_coefficient_viscous",
-                "CNalpha (0 to 4 deg) (per rad)": "normal_force_slope_angle_of_attack",
-                "CP (0 to 4 deg)": "cp_location_4_deg",
-                "CA Power-On":"axial_force_coefficient_power_on",
-                "CA Power-Off": "axial_force_coefficient_power_off"
-            }
-            self.filtered_ras_df.rename(columns=rename_cols, inplace=True)
+        self.filtered_ras_df.rename(columns=RAS_MACH_COLUMN_NAMES, inplace=True)
 
     def convert_ras_units_to_SI(self) -> None:
         """
         Converts measurement units from imperial to SI units within the `ras_df` DataFrame.
 
         This method updates the `ras_df` DataFrame in place, converting various imperial unit measurements
-        to their corresponding SI units. The conversions include weights from pounds to grams, lengths from
-        inches to millimeters and feet to meters, and velocities and accelerations from feet per unit time
-        to meters per unit time. The conversion factors are defined within the method for each measurement type.
+        to their corresponding SI units. The conversions include weights from pounds to grams, forces from
+        pounds-force to newtons, lengths from inches to millimeters, and velocities and accelerations from
+        feet per unit time to meters per unit time. The conversions are declared in `units.RAS_SI_CONVERSIONS`
+        and applied to all columns in a single vectorized pass.
 
         The method assumes that the original measurements are stored in columns with '_imperial' suffixes
         and updates the corresponding columns without the suffix to reflect the converted SI unit values.
+        Imperial columns left out by a column projection are skipped.
 
         Attributes updated:
         - weight: Converts pounds to grams.
-        - thrust: Converts pounds to grams.
-        - drag_force: Converts pounds to grams.
-        - lift_force: Converts pounds to grams.
+        - thrust: Converts pounds-force to newtons.
+        - drag_force: Converts pounds-force to newtons.
+        - lift_force: Converts pounds-force to newtons.
         - cg_location: Converts inches to millimeters.
         - cp_location: Converts inches to millimeters.
         - total_acceleration, vertical_acceleration, horizontal_acceleration: Converts feet per second squared to meters per second squared.
@@ -371,32 +869,38 @@ class DataHandler:
 
         Note: This method modifies the `ras_df` DataFrame in place and does not return any value.
         """
-        pounds_to_grams = 453.6
-        inch_to_mm = 25.4
-        feet_to_meter = 0.3048
-        self.ras_df["weight"] = self.ras_df["weight_imperial"]*pounds_to_grams
-        self.ras_df["thrust"] = self.ras_df["thrust_imperial"]*pounds_to_grams
-        self.ras_df["drag_force"] = self.ras_df["drag_force_imperial"] * \
-            pounds_to_grams
-        self.ras_df["lift_force"] = self.ras_df["lift_force_imperial"] * \
-            pounds_to_grams
-        self.ras_df["cg_location"] = self.ras_df["cg_location_imperial"] * \
-            inch_to_mm
-        self.ras_df["cp_location"] = self.ras_df["cp_location_imperial"] * \
-            inch_to_mm
-        self.ras_df["total_acceleration"] = self.ras_df["total_acceleration_imperial"] * \
-            feet_to_meter
-        self.ras_df["vertical_acceleration"] = self.ras_df["vertical_acceleration_imperial"] * \
-            feet_to_meter
-        self.ras_df["horizontal_acceleration"] = self.ras_df["horizontal_acceleration_imperial"] * \
-            feet_to_meter
-        self.ras_df["total_velocity"] = self.ras_df["total_velocity_imperial"] * \
-            feet_to_meter
-        self.ras_df["vertical_velocity"] = self.ras_df["vertical_velocity_imperial"] * \
-            feet_to_meter
-        self.ras_df["horizontal_velocity"] = self.ras_df["horizontal_velocity_imperial"] * \
-            feet_to_meter
-    
+        conversions = {column: spec for column, spec in RAS_SI_CONVERSIONS.items() if column in self.ras_df.columns}
+        convert_columns(self.ras_df, conversions, inplace=True)
+
+    def convert_or_units_to_SI(self) -> None:
+        """
+        Converts the non-SI columns of the renamed `merged_df` DataFrame to SI units in place.
+
+        The units of the OpenRocket export are declared in `units.OR_UNITS` (feet, grams, millimetres,
+        square centimetres, degrees Celsius and millibar), and every listed column present in `merged_df`
+        is converted in a single vectorized pass, along with any matching compacted constants. Call
+        `rename_or_df_columns` first, as the snake_case names carry no unit in their name.
+
+        Calling it again once the data is in SI units does nothing, and `or_units_SI` is only set when a
+        column or constant was converted.
+
+        Note: This method modifies the `merged_df` DataFrame in place and does not return any value.
+        """
+        if self.or_units_SI:
+            return
+        conversions = {column: (unit, UNITS_SI[unit]) for column, unit in OR_UNITS.items()
+                       if column in self.merged_df.columns}
+        if conversions:
+            dtypes = self.merged_df[list(conversions)].dtypes
+            convert_columns(self.merged_df, conversions, inplace=True)
+            # Keep compact mode's float32 columns at float32
+            self.merged_df[list(conversions)] = self.merged_df[list(conversions)].astype(dtypes)
+        constants = [column for column in OR_UNITS if column in self.constants]
+        for column in constants:
+            unit = OR_UNITS[column]
+            self.constants[column] = convert(self.constants[column], unit, UNITS_SI[unit])
+        self.or_units_SI = bool(conversions or constants)
+
     def calculate_stability_percentage(self,rocket_length:float,)->None:
         """
         Calculates the stability margin as a percentage of the rocket length for each entry in the DataFrame.
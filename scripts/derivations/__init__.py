@@ -0,0 +1,83 @@
+"""SymPy derivations of the closed-form models in this package.
+
+The modules under scripts/ evaluate these expressions with hand-written NumPy kernels so that importing them does
+not pull in SymPy. The derivations here are the reference for those kernels: after editing either side, run
+
+    python -c "from scripts.derivations import check_kernels; print(check_kernels())"
+
+and confirm every error is at rounding level. Importing this package imports SymPy.
+"""
+import importlib
+
+import numpy as np
+
+# Kernel name -> sampling range of each argument, per module. Each kernel is compared with the lambdified SymPy
+# expression of the same name in the derivation module.
+KERNELS = {
+    "howard_fin_flutter": {
+        "temperature_function": [(0, 30000)],
+        "pressure_function": [(-40, 60)],
+        "speed_of_sound_function": [(-40, 60)],
+        "aspect_ratio_function": [(2, 10), (0.5, 5), (2, 8)],
+        "taper_ratio_function": [(2, 10), (0.5, 5)],
+        "flutter_velocity_lambdified": [(900, 1200), (1e5, 6e5), (0.5, 3), (3, 15), (0.1, 1), (0.05, 0.3), (2, 10)],
+    },
+    "sahr_fin_flutter": {
+        "normalised_thickness_function": [(0.001, 0.01), (0.05, 0.3)],
+        "aspect_ratio_function": [(0.05, 0.3), (0.02, 0.1), (0.05, 0.2)],
+        "taper_ratio_function": [(0.05, 0.3), (0.02, 0.1)],
+        "flutter_velocity_lambdified": [(330, 345), (0, 10000), (7000, 9000), (1e9, 3e10), (9e4, 1.1e5), (0.5, 3),
+                                        (0.1, 1), (0.005, 0.05)],
+        "thickness_function": [(0.05, 0.3), (200, 1000), (330, 345), (0, 10000), (7000, 9000), (1e9, 3e10),
+                               (9e4, 1.1e5), (0.5, 3), (0.1, 1)],
+    },
+    "bennet_fin_flutter_refactored": {
+        "temperature_function_SI": [(0, 10000)],
+        "temperature_function_Imperial": [(0, 30000)],
+        "pressure_function_SI": [(-40, 30)],
+        "pressure_function_Imperial": [(-40, 90)],
+        "speed_of_sound_function_SI": [(-40, 30)],
+        "speed_of_sound_function_Imperial": [(-40, 90)],
+        "aspect_ratio_function": [(0.05, 0.3), (0.02, 0.1), (0.05, 0.2)],
+        "taper_ratio_function": [(0.05, 0.3), (0.02, 0.1)],
+        "cx_function": [(0.05, 0.3), (0.02, 0.1), (0, 0.2)],
+        "epsilon_function": [(0.05, 0.3), (0.02, 0.1), (0, 0.2)],
+        "term1_function": [(0.05, 0.3), (0.02, 0.1), (0.05, 0.2), (0.002, 0.01), (0, 0.2), (1.3, 1.45), (1e5, 1.02e5)],
+        "term2_function": [(0.05, 0.3), (0.02, 0.1)],
+        "term3_function_SI": [(20, 110)],
+        "term3_function_Imperial": [(3, 16)],
+        "flutter_velocity_function_SI": [(0, 10000), (0.002, 0.01), (0.1, 0.3), (0.03, 0.1), (0.05, 0.2), (0, 0.2),
+                                         (1e9, 3e10), (1.3, 1.45), (1e5, 1.02e5)],
+        "flutter_velocity_function_Imperial": [(0, 30000), (0.08, 0.4), (4, 12), (1, 4), (2, 8), (0, 8), (1.5e5, 4.5e6),
+                                               (1.3, 1.45), (14.6, 14.8)],
+    },
+    "parachute": {
+        "chute_diameter_function": [(1, 50), (9.7, 9.9), (0.8, 1.3), (0.5, 2.2), (3, 30)],
+        "velocity_function": [(1, 50), (9.7, 9.9), (0.8, 1.3), (0.5, 2.2), (0.3, 4)],
+        "drag_coefficient_function": [(1, 50), (9.7, 9.9), (0.8, 1.3), (0.3, 4), (3, 30)],
+    },
+}
+
+
+def check_kernels(samples: int = 1000, seed: int = 0) -> dict:
+    """
+    check_kernels  Compares every NumPy kernel with its SymPy derivation on random arguments.
+
+    :param samples:  Number of random argument sets per kernel, defaults to 1000
+    :type samples: int, optional
+    :param seed:  Seed of the random arguments, defaults to 0
+    :type seed: int, optional
+    :return:  "module.kernel" -> largest relative difference
+    :rtype: dict
+    """
+    rng = np.random.default_rng(seed)
+    errors = {}
+    for module_name, kernels in KERNELS.items():
+        module = importlib.import_module(f"scripts.{module_name}")
+        derivation = importlib.import_module(f"scripts.derivations.{module_name}")
+        for name, ranges in kernels.items():
+            args = [rng.uniform(low, high, samples) for low, high in ranges]
+            expected = np.asarray(getattr(derivation, name)(*args), dtype=np.float64)
+            actual = np.asarray(getattr(module, name)(*args), dtype=np.float64)
+            errors[f"{module_name}.{name}"] = float(np.max(np.abs(actual - expected) / np.maximum(np.abs(expected), 1e-300)))
+    return errors
@@ -0,0 +1,77 @@
+"""Bennett fin flutter terms as SymPy expressions, in SI and imperial forms."""
+from sympy import symbols, lambdify, exp, pi, N
+import numpy as np
+
+# Define symbols in one central place
+cr, ct, b, h, T, G, t, P, a, AR, lambda_ratio, epsilon, cx, K, m, P0, T1, T2, T3 = symbols(
+    'c_r c_t b h T G t P a AR lambda_ratio epsilon cx K m P0 T1 T2 T3')
+
+# cx for trapezoidal fins
+cx_expr = ((2*ct*m)+ct**2+(m*cr)+(ct*cr)+cr**2)/(3*(ct+cr))
+
+# Expressions for wing area, aspect ratio, and taper ratio
+S_expr = 1/2 * (cr + ct) * b
+AR_expr = b**2 / S_expr
+lambda_expr = ct / cr
+
+thickness_ratio_expr = t/cr
+
+# Temperature
+T_expr_SI = 15-0.0065*h
+T_expr_Imperial = 59 - 0.00356 * h
+
+# Pressure
+P_expr_SI = 101.325 * ((T + 273.16) / 288.16) ** 5.256
+P_expr_Imperial = 14.696 * ((T + 459.7) / 518.7) ** 5.256
+
+
+# speed of sound = a
+a_expr_SI = 20.05*(273.16+T)**0.5
+a_expr_Imperial = 49.03*(459.7+T)**0.5
+
+# Epsilon
+epsilon_expr = (cx_expr/cr)-0.25
+
+# Denominator Constant
+DN_expr = (24*epsilon*K*P0)/np.pi
+
+# First Term
+Term1_expr = (DN_expr*AR_expr**3)/((thickness_ratio_expr**3)*(AR_expr+2))
+Term2_expr = (lambda_expr+1)/2
+Term3_expr_SI = P_expr_SI/101.325
+Term3_expr_Imperial = P_expr_Imperial/14.696
+
+Vf_expr = a*(G/(T1 * T2 * T3))**0.5
+
+# Corrected lambdify functions
+temperature_function_SI = lambdify(h, T_expr_SI, modules='numpy')
+temperature_function_Imperial = lambdify(h, T_expr_Imperial, modules='numpy')
+
+pressure_function_SI = lambdify(T, P_expr_SI, modules='numpy')
+pressure_function_Imperial = lambdify(T, P_expr_Imperial, modules='numpy')
+
+speed_of_sound_function_SI = lambdify(T, a_expr_SI, modules='numpy')
+speed_of_sound_function_Imperial = lambdify(
+    T, a_expr_Imperial, modules='numpy')
+
+aspect_ratio_function = lambdify((cr, ct, b), AR_expr, modules='numpy')
+taper_ratio_function = lambdify((cr, ct), lambda_expr, modules='numpy')
+
+cx_function = lambdify((cr, ct, m), cx_expr, modules='numpy')
+epsilon_function = lambdify((cr, ct, m), epsilon_expr, modules='numpy')
+
+term1_function = lambdify((cr, ct, b, t, m, K, P0), Term1_expr.subs(epsilon, epsilon_expr), modules='numpy')
+term2_function = lambdify((cr, ct), Term2_expr, modules='numpy')
+term3_function_SI = lambdify(P, P/101.325, modules='numpy')
+term3_function_Imperial = lambdify(P, P/14.696, modules='numpy')
+
+# Flutter velocity from the altitude, with Vf_expr's terms and the atmosphere substituted in
+Vf_expr_SI = (Vf_expr.subs({a: a_expr_SI, T1: Term1_expr.subs(epsilon, epsilon_expr), T2: Term2_expr,
+                            T3: Term3_expr_SI})).subs(T, T_expr_SI)
+Vf_expr_Imperial = (Vf_expr.subs({a: a_expr_Imperial, T1: Term1_expr.subs(epsilon, epsilon_expr), T2: Term2_expr,
+                                  T3: Term3_expr_Imperial})).subs(T, T_expr_Imperial)
+
+flutter_velocity_function_SI = lambdify(
+    (h, t, cr, ct, b, m, G, K, P0), Vf_expr_SI, modules='numpy')
+flutter_velocity_function_Imperial = lambdify(
+    (h, t, cr, ct, b, m, G, K, P0), Vf_expr_Imperial, modules='numpy')
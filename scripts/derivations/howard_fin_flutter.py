@@ -0,0 +1,29 @@
+"""Howard fin flutter equations, in imperial units, as SymPy expressions."""
+from sympy import symbols, lambdify, sqrt
+
+# Define symbols in one central place
+cr, ct, b, h, T, G, t, P, a, AR, lambda_ratio = symbols(
+    'c_r c_t b h T G t P a AR lambda_ratio')
+
+# Expressions for wing area, aspect ratio, and taper ratio
+S_expr = 1/2 * (cr + ct) * b
+AR_expr = b**2 / S_expr
+lambda_expr = ct / cr
+
+# Expressions for atmospheric properties
+T_expr = 59 - 0.00356 * h
+P_expr = 2116/144 * ((T + 459.7) / 518.6) ** 5.256
+a_expr = (1.4 * 1716.59 * (T + 460))**0.5
+
+# Fin flutter velocity expression
+Vf_expr = a * sqrt(G / (1.337 * AR**3 * P *
+                   (lambda_ratio + 1) / (2 * (AR + 2) * (t / cr)**3)))
+
+# Lambdify expressions for numerical calculations
+temperature_function = lambdify(h, T_expr, modules='numpy')
+pressure_function = lambdify(T, P_expr, modules='numpy')
+speed_of_sound_function = lambdify(T, a_expr, modules='numpy')
+aspect_ratio_function = lambdify((cr, ct, b), AR_expr, modules='numpy')
+taper_ratio_function = lambdify((cr, ct), lambda_expr, modules='numpy')
+flutter_velocity_lambdified = lambdify(
+        (a, G, AR, P, lambda_ratio, t, cr), Vf_expr, modules='numpy')
@@ -0,0 +1,21 @@
+"""Parachute sizing relations (drag equals weight at terminal velocity) as SymPy expressions."""
+from sympy import symbols, lambdify, sqrt, exp, pi
+import numpy as np
+
+# Define symbols
+Fd, rho, Cd, A, v, Fg, m, g, D = symbols('F_d rho C_d A v F_g m g D')
+
+# Expression for parachute diameter
+chute_diameter_expr = sqrt((8*m*g)/(pi*rho*Cd*v**2))
+velocity_expr = sqrt((8 * m * g) / (pi * rho * Cd * D**2))
+drag_coefficient_expr = (8 * m * g) / (pi * rho * D**2 * v**2)
+
+# Lambdify expressions for numerical calculations
+velocity_function = lambdify(
+    (m, g, rho, Cd, D), velocity_expr, modules='numpy')
+drag_coefficient_function = lambdify(
+    (m, g, rho, D, v), drag_coefficient_expr, modules='numpy')
+
+# Lambdify the expression for numerical calculations
+chute_diameter_function = lambdify(
+    (m, g, rho, Cd, v), chute_diameter_expr, modules='numpy')
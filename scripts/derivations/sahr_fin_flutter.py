@@ -0,0 +1,29 @@
+"""Sahr fin flutter equations as SymPy expressions, including the thickness inversion."""
+from sympy import symbols, lambdify, sqrt, exp
+import numpy as np
+
+# Define symbols in one central place
+cr, ct, b, h, H, T, G, t, P0, Cs0, B, lambda_ratio, Vf = symbols(
+    'c_r c_t b h H T G t P_0 C_s0 B lambda_ratio Vf')
+
+# Expressions for wing area, aspect ratio, and taper ratio
+S_expr = 1/2 * (cr + ct) * b
+B_expr = b**2 / S_expr
+lambda_expr = ct / cr
+T_expr = t/cr
+
+# Fin flutter velocity expression
+Vf_expr = 1.223 * Cs0 * exp(0.4*h/H)*sqrt(G/P0) * \
+    sqrt((2+B)/(1+lambda_ratio))*(T/B)**(3/2)
+
+t_expr = (cr*B)*(Vf/(1.223 * Cs0 * exp(0.4*h/H)*sqrt(G/P0) *
+                sqrt((2+B)/(1+lambda_ratio))))**(2/3)
+
+# Lambdify expressions for numerical calculations
+normalised_thickness_function = lambdify((t, cr), T_expr, modules='numpy')
+aspect_ratio_function = lambdify((cr, ct, b), B_expr, modules='numpy')
+taper_ratio_function = lambdify((cr, ct), lambda_expr, modules='numpy')
+flutter_velocity_lambdified = lambdify(
+    (Cs0, h, H, G, P0, B, lambda_ratio, T), Vf_expr, modules='numpy')
+thickness_function = lambdify(
+    (cr, Vf, Cs0, h, H, G, P0, B, lambda_ratio), t_expr, modules='numpy')
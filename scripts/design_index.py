@@ -0,0 +1,333 @@
+import concurrent.futures
+import glob
+import hashlib
+import os
+import sqlite3
+
+import pandas as pd
+
+from .or_xml import LOCATION_COLUMNS, extract_records, typed_columns
+
+DESIGN_PATTERNS = ("*.ork",)
+
+# Comparison operators accepted in find_designs conditions
+OPERATORS = ("=", "!=", "<", "<=", ">", ">=", "between", "like")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS designs (
+    design_id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER,
+    mtime_ns INTEGER,
+    hash TEXT,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS components (
+    component_id INTEGER PRIMARY KEY,
+    design_id INTEGER NOT NULL REFERENCES designs ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    name TEXT,
+    parent TEXT,
+    stage TEXT,
+    stage_number INTEGER,
+    depth INTEGER
+);
+CREATE TABLE IF NOT EXISTS properties (
+    component_id INTEGER NOT NULL REFERENCES components ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value REAL,
+    text TEXT
+);
+CREATE INDEX IF NOT EXISTS components_design ON components (design_id, kind);
+CREATE INDEX IF NOT EXISTS components_kind ON components (kind);
+CREATE INDEX IF NOT EXISTS properties_key ON properties (key, value, component_id);
+CREATE INDEX IF NOT EXISTS properties_component ON properties (component_id);
+"""
+
+
+def _file_hash(filepath: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _cells(values) -> list:
+    """
+    _cells  Splits a typed column into (value, text) cells, None where the property is missing.
+    """
+    if isinstance(values, list):
+        return [None if value is None else (None, value) for value in values]
+    values = values.to_numpy(dtype=object, na_value=None) if isinstance(values, pd.api.extensions.ExtensionArray) \
+        else values.tolist()
+    return [None if value is None or value != value else (float(value), None) for value in values]
+
+
+def _component_rows(filepath: str) -> list:
+    """
+    _component_rows  Extracts the components of a design as plain tuples, ready to insert and cheap to send between
+    processes. Properties are typed as in or_xml.extract_components.
+
+    :param filepath:  Path to the design
+    :type filepath: str
+    :return:  (kind, name, parent, stage, stage_number, depth, properties) per component, where properties is a list
+        of (key, value, text); numbers and booleans go in value, text in text, and missing properties are left out
+    :rtype: list
+    """
+    rows = []
+    for kind, records in extract_records(filepath).items():
+        cells = {name: _cells(values) for name, values in typed_columns(records).items()
+                 if name not in LOCATION_COLUMNS}
+        for row, record in enumerate(records):
+            properties = [(name, *column[row]) for name, column in cells.items() if column[row] is not None]
+            rows.append((kind, *(record[column] for column in LOCATION_COLUMNS), properties))
+    return rows
+
+
+def _index_file(filepath: str, known_hash: str = None) -> tuple:
+    """
+    _index_file  Hashes a design and, unless the hash is already indexed, extracts its components. Runs in the worker
+    processes of DesignIndex.update.
+
+    :param filepath:  Path to the design
+    :type filepath: str
+    :param known_hash:  Hash stored for this path, defaults to None
+    :type known_hash: str, optional
+    :return:  (path, size, mtime_ns, hash, rows, error), with rows None when the contents are unchanged
+    :rtype: tuple
+    """
+    stat = os.stat(filepath)
+    content_hash = _file_hash(filepath)
+    if content_hash == known_hash:
+        return filepath, stat.st_size, stat.st_mtime_ns, content_hash, None, None
+    try:
+        return filepath, stat.st_size, stat.st_mtime_ns, content_hash, _component_rows(filepath), None
+    except Exception as e:
+        return filepath, stat.st_size, stat.st_mtime_ns, content_hash, [], str(e)
+
+
+def _condition_sql(condition) -> tuple:
+    """
+    _condition_sql  Translates one property condition into SQL on the properties table.
+
+    :param condition:  A number or string to match exactly, or a tuple (operator, operand[, upper]) with an
+        operator from OPERATORS
+    :type condition: object
+    :return:  SQL fragment and its parameters
+    :rtype: tuple
+    """
+    if not isinstance(condition, tuple):
+        condition = ("=", condition)
+    operator, *operands = condition
+    if operator not in OPERATORS:
+        raise ValueError(f"Unknown operator {operator!r}, expected one of {OPERATORS}")
+    if operator == "between":
+        return "p.value BETWEEN ? AND ?", list(operands)
+    if operator == "like":
+        return "p.text LIKE ?", list(operands)
+    column = "p.text" if isinstance(operands[0], str) else "p.value"
+    return f"{column} {operator} ?", [operands[0]]
+
+
+class DesignIndex:
+    """SQLite index of the components of a directory of OpenRocket designs.
+
+    Each component row holds its kind (bodytube, trapezoidfinset, ...) and location, and its properties are stored
+    one per row (key, value, text), so any property of any kind can be queried through one indexed table. Re-indexing
+    only parses files whose size or modification time changed and whose contents hash differently.
+    """
+
+    def __init__(self, database: str = ":memory:"):
+        """
+        __init__  Opens (or creates) the index database.
+
+        :param database:  Path to the SQLite file, defaults to ":memory:" for an index that is not kept
+        :type database: str, optional
+        """
+        self.database = database
+        self.connection = sqlite3.connect(database)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def update(self, directory: str, patterns: tuple = DESIGN_PATTERNS, workers: int = 1) -> dict:
+        """
+        update  Indexes the designs of a directory (and its subdirectories), re-parsing only new and changed files and
+        dropping files that no longer exist. Files that cannot be parsed are reported, recorded with their error and
+        retried only once they change.
+
+        :param directory:  Directory of designs
+        :type directory: str
+        :param patterns:  File name patterns, defaults to DESIGN_PATTERNS
+        :type patterns: tuple, optional
+        :param workers:  Number of processes parsing designs, defaults to 1 to parse in this process
+        :type workers: int, optional
+        :return:  Counts of indexed, unchanged, removed and failed designs
+        :rtype: dict
+        """
+        directory = os.path.abspath(directory)
+        filepaths = sorted({filepath for pattern in patterns
+                            for filepath in glob.glob(os.path.join(directory, "**", pattern), recursive=True)})
+        known = {path: (size, mtime_ns, content_hash) for path, size, mtime_ns, content_hash in
+                 self.connection.execute("SELECT path, size, mtime_ns, hash FROM designs")}
+
+        stats = {"indexed": 0, "unchanged": 0, "removed": 0, "failed": 0}
+        pending = []
+        for filepath in filepaths:
+            stat = os.stat(filepath)
+            size, mtime_ns, content_hash = known.get(filepath, (None, None, None))
+            if (size, mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                stats["unchanged"] += 1
+            else:
+                pending.append((filepath, content_hash))
+
+        with self.connection:
+            if workers > 1 and len(pending) > 1:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = executor.map(_index_file, *zip(*pending), chunksize=max(1, len(pending) // (4 * workers)))
+                    for result in results:
+                        self._store(result, stats)
+            else:
+                for filepath, content_hash in pending:
+                    self._store(_index_file(filepath, content_hash), stats)
+
+            existing = set(filepaths)
+            prefix = os.path.join(directory, "")
+            removed = [(path,) for path in known if path.startswith(prefix) and path not in existing]
+            self.connection.executemany("DELETE FROM designs WHERE path = ?", removed)
+            stats["removed"] = len(removed)
+        return stats
+
+    def _store(self, result: tuple, stats: dict):
+        """
+        _store  Writes the result of _index_file, replacing what was indexed for the path before.
+        """
+        filepath, size, mtime_ns, content_hash, rows, error = result
+        if rows is None:
+            # Touched but identical contents, only the file state changes
+            self.connection.execute("UPDATE designs SET size = ?, mtime_ns = ? WHERE path = ?",
+                                    (size, mtime_ns, filepath))
+            stats["unchanged"] += 1
+            return
+        if error is not None:
+            print(f"Error indexing design {filepath}: {error}")
+            stats["failed"] += 1
+        else:
+            stats["indexed"] += 1
+
+        self.connection.execute("DELETE FROM designs WHERE path = ?", (filepath,))
+        design_id = self.connection.execute(
+            "INSERT INTO designs (path, size, mtime_ns, hash, error) VALUES (?, ?, ?, ?, ?)",
+            (filepath, size, mtime_ns, content_hash, error)).lastrowid
+        for *component, properties in rows:
+            component_id = self.connection.execute(
+                "INSERT INTO components (design_id, kind, name, parent, stage, stage_number, depth) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", (design_id, *component)).lastrowid
+            self.connection.executemany("INSERT INTO properties (component_id, key, value, text) VALUES (?, ?, ?, ?)",
+                                        [(component_id, *values) for values in properties])
+
+    def query(self, sql: str, params=()) -> pd.DataFrame:
+        """
+        query  Runs an SQL query on the index tables (designs, components, properties).
+
+        :param sql:  SQL query
+        :type sql: str
+        :param params:  Query parameters, defaults to ()
+        :type params: tuple or dict, optional
+        :return:  Query result
+        :rtype: pd.DataFrame
+        """
+        return pd.read_sql_query(sql, self.connection, params=params)
+
+    def designs(self) -> pd.DataFrame:
+        """
+        designs  Lists the indexed designs with their component counts.
+
+        :return:  path, hash, error and components per design
+        :rtype: pd.DataFrame
+        """
+        return self.query("SELECT d.design_id, d.path, d.hash, d.error, COUNT(c.component_id) AS components "
+                          "FROM designs d LEFT JOIN components c USING (design_id) "
+                          "GROUP BY d.design_id ORDER BY d.path")
+
+    def find_designs(self, **criteria) -> pd.DataFrame:
+        """
+        find_designs  Finds the designs having, for every kind given, at least one component of that kind meeting all
+        of its conditions.
+
+        For example, designs with a 75 mm body tube and fins thinner than 3 mm::
+
+            index.find_designs(bodytube={"radius": ("between", 0.0374, 0.0376)},
+                               trapezoidfinset={"thickness": ("<", 0.003)})
+
+        :param criteria:  Component kind -> {property: condition}; a condition is a value to match exactly or a tuple
+            (operator, operand[, upper]) with an operator from OPERATORS. The location columns (name, parent, stage,
+            stage_number, depth) can be matched too.
+        :return:  design_id and path of the matching designs
+        :rtype: pd.DataFrame
+        """
+        # Uncorrelated IN subqueries: each condition is one range search of the property index
+        clauses, params = [], []
+        for kind, conditions in criteria.items():
+            component_clauses = ["c.kind = ?"]
+            params.append(kind)
+            for key, condition in conditions.items():
+                sql, values = _condition_sql(condition)
+                if key in LOCATION_COLUMNS:
+                    component_clauses.append(sql.replace("p.value", f"c.{key}").replace("p.text", f"c.{key}"))
+                else:
+                    component_clauses.append(
+                        f"c.component_id IN (SELECT p.component_id FROM properties p WHERE p.key = ? AND {sql})")
+                    params.append(key)
+                params.extend(values)
+            clauses.append(f"d.design_id IN (SELECT c.design_id FROM components c "
+                           f"WHERE {' AND '.join(component_clauses)})")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self.query(f"SELECT d.design_id, d.path FROM designs d {where} ORDER BY d.path", params)
+
+    def components(self, kind: str = None, design: str = None) -> pd.DataFrame:
+        """
+        components  Tabulates the indexed components with their properties as columns, like
+        or_xml.extract_components but across designs.
+
+        :param kind:  Component kind to keep, defaults to None for every kind
+        :type kind: str, optional
+        :param design:  Design path to keep, defaults to None for every design
+        :type design: str, optional
+        :return:  One row per component: path, kind, the location columns, then one column per property
+        :rtype: pd.DataFrame
+        """
+        filters, params = [], []
+        if kind is not None:
+            filters.append("c.kind = ?")
+            params.append(kind)
+        if design is not None:
+            filters.append("d.path = ?")
+            params.append(os.path.abspath(design))
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        components = self.query(
+            f"SELECT c.component_id, d.path, c.kind, {', '.join(f'c.{column}' for column in LOCATION_COLUMNS)} "
+            f"FROM components c JOIN designs d USING (design_id) {where} ORDER BY c.component_id", params)
+        properties = self.query(
+            f"SELECT p.component_id, p.key, p.value, p.text FROM properties p "
+            f"JOIN components c USING (component_id) JOIN designs d USING (design_id) {where}", params)
+        if properties.empty:
+            return components.set_index("component_id")
+        # Numeric properties pivot to floats; the text ones stay text
+        is_text = properties["value"].isna()
+        numbers = properties[~is_text].pivot(index="component_id", columns="key", values="value")
+        texts = properties[is_text].pivot(index="component_id", columns="key", values="text")
+        for key in numbers.columns.intersection(texts.columns):
+            # A property that is numeric in some designs and text in others is kept as objects
+            texts[key] = texts[key].astype(object).combine_first(numbers.pop(key).astype(object))
+        columns = list(dict.fromkeys(properties["key"]))
+        return components.set_index("component_id").join(pd.concat([numbers, texts], axis=1)[columns])
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+
+def read_fin_vertices(filepath: str, scale: float = 1.0) -> np.ndarray:
+    """
+    read_fin_vertices  Reads a fin outline exported by OpenRocket ("X / cm, Y / cm," header, trailing commas).
+
+    :param filepath:  Path to the vertex CSV file
+    :type filepath: str
+    :param scale:  Factor applied to the coordinates, e.g. 0.01 for cm to m, defaults to 1.0
+    :type scale: float, optional
+    :return:  Vertices as an (n, 2) array of x (chordwise, from the root leading edge) and y (spanwise)
+    :rtype: np.ndarray
+    """
+    vertices = np.genfromtxt(filepath, delimiter=",", skip_header=1, usecols=(0, 1), dtype=np.float64)
+    return np.atleast_2d(vertices) * scale
+
+
+def _pack(outlines) -> tuple:
+    """
+    _pack  Flattens outlines into one vertex array plus the start offset of each outline.
+    """
+    if isinstance(outlines, np.ndarray) and outlines.ndim >= 2:
+        outlines = np.asarray(outlines, dtype=np.float64)
+        if outlines.ndim == 2:
+            outlines = outlines[None]
+        count, size = outlines.shape[0], outlines.shape[1]
+        return outlines.reshape(-1, 2), np.arange(count) * size
+    # Ragged: a list of (n_i, 2) arrays
+    arrays = [np.asarray(outline, dtype=np.float64).reshape(-1, 2) for outline in outlines]
+    sizes = np.array([len(array) for array in arrays])
+    return np.concatenate(arrays), np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+
+def fin_properties(outlines, root_chord=None) -> pd.DataFrame:
+    """
+    fin_properties  Computes area, centroid and the Bennett epsilon of one or many fin outlines in one vectorized pass.
+
+    The area and centroid come from the shoelace formula over each closed outline, which gives the same result as
+    triangulating the planform and area-weighting the triangle centroids, for any simple polygon in either winding.
+
+    :param outlines:  One outline as an (n, 2) array, many of equal size as an (m, n, 2) array, or a list of (n_i, 2)
+        arrays of any sizes. x is chordwise from the root leading edge and y spanwise from the root.
+    :type outlines: np.ndarray or list
+    :param root_chord:  Root chord(s) used for epsilon, defaults to None to take the chord along the lowest y of each outline
+    :type root_chord: float or np.ndarray, optional
+    :return:  One row per outline: area, centroid_x, centroid_y, root_chord, semispan, aspect_ratio and epsilon
+        (centroid_x / root_chord - 0.25), in the units of the vertices
+    :rtype: pd.DataFrame
+    """
+    vertices, starts = _pack(outlines)
+    x, y = vertices[:, 0], vertices[:, 1]
+
+    # Index of the next vertex, wrapping each outline back to its first vertex
+    following = np.arange(1, len(vertices) + 1)
+    ends = np.append(starts[1:], len(vertices))
+    following[ends - 1] = starts
+    x_next, y_next = x[following], y[following]
+
+    cross = x * y_next - x_next * y
+    area = np.add.reduceat(cross, starts) / 2
+    centroid_x = np.add.reduceat((x + x_next) * cross, starts) / (6 * area)
+    centroid_y = np.add.reduceat((y + y_next) * cross, starts) / (6 * area)
+
+    y_min = np.minimum.reduceat(y, starts)
+    semispan = np.maximum.reduceat(y, starts) - y_min
+    if root_chord is None:
+        outline = np.repeat(np.arange(len(starts)), ends - starts)
+        on_root = np.isclose(y, y_min[outline])
+        root_max = np.maximum.reduceat(np.where(on_root, x, -np.inf), starts)
+        root_min = np.minimum.reduceat(np.where(on_root, x, np.inf), starts)
+        root_chord = root_max - root_min
+    root_chord = np.broadcast_to(np.asarray(root_chord, dtype=np.float64), area.shape)
+
+    area = np.abs(area)
+    return pd.DataFrame({
+        "area": area,
+        "centroid_x": centroid_x,
+        "centroid_y": centroid_y,
+        "root_chord": root_chord,
+        "semispan": semispan,
+        "aspect_ratio": semispan ** 2 / area,
+        "epsilon": centroid_x / root_chord - 0.25,
+    })
+
+
+def trapezoid_outlines(root_chord, tip_chord, semispan, sweep_length) -> np.ndarray:
+    """
+    trapezoid_outlines  Builds the outlines of trapezoidal fins, e.g. for a planform sweep.
+
+    :param root_chord:  Root chord(s)
+    :type root_chord: float or np.ndarray
+    :param tip_chord:  Tip chord(s)
+    :type tip_chord: float or np.ndarray
+    :param semispan:  Semispan(s)
+    :type semispan: float or np.ndarray
+    :param sweep_length:  Sweep length(s) of the leading edge
+    :type sweep_length: float or np.ndarray
+    :return:  (m, 4, 2) array of outlines in the broadcast order of the arguments, in OpenRocket's vertex order
+    :rtype: np.ndarray
+    """
+    root_chord, tip_chord, semispan, sweep_length = (
+        np.ravel(array) for array in np.broadcast_arrays(root_chord, tip_chord, semispan, sweep_length))
+    zeros = np.zeros_like(root_chord, dtype=np.float64)
+    x = np.stack([zeros, sweep_length, sweep_length + tip_chord, root_chord], axis=1)
+    y = np.stack([zeros, semispan, semispan, zeros], axis=1)
+    return np.stack([x, y], axis=2).astype(np.float64)
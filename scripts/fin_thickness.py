@@ -0,0 +1,98 @@
+import numpy as np
+
+from .atmosphere import standard_atmosphere
+from .flutter_margin import FLUTTER_MODELS, model_flutter_velocity
+
+# Every flutter model here scales as Vf ~ thickness^(3/2) with all else fixed
+THICKNESS_EXPONENT = 1.5
+
+
+def solve_thickness(flutter_velocity, target_velocity, lower, upper, tolerance: float = 1e-9,
+                    max_iterations: int = 200) -> np.ndarray:
+    """
+    solve_thickness  Finds the thickness at which a flutter model reaches a target velocity, by bisection run on whole
+    arrays at once. The model must increase with thickness between the bounds.
+
+    :param flutter_velocity:  Callable taking an array of thicknesses and returning flutter velocities of the same shape
+    :type flutter_velocity: callable
+    :param target_velocity:  Target flutter velocity(ies)
+    :type target_velocity: float or np.ndarray
+    :param lower:  Lower bound(s) on the thickness
+    :type lower: float or np.ndarray
+    :param upper:  Upper bound(s) on the thickness
+    :type upper: float or np.ndarray
+    :param tolerance:  Width of the bracket, relative to the thickness, at which to stop, defaults to 1e-9
+    :type tolerance: float, optional
+    :param max_iterations:  Maximum number of bisections, defaults to 200
+    :type max_iterations: int, optional
+    :return:  Thicknesses, NaN where the target is not bracketed by the bounds
+    :rtype: np.ndarray
+    """
+    target_velocity, lower, upper = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64)
+                                                          for value in (target_velocity, lower, upper)))
+    lower, upper = lower.copy(), upper.copy()
+    bracketed = (flutter_velocity(lower) <= target_velocity) & (flutter_velocity(upper) >= target_velocity)
+    for _ in range(max_iterations):
+        middle = (lower + upper) / 2
+        below = flutter_velocity(middle) < target_velocity
+        lower = np.where(below, middle, lower)
+        upper = np.where(below, upper, middle)
+        if np.all(upper - lower <= tolerance * upper):
+            break
+    return np.where(bracketed, upper, np.nan)
+
+
+def minimum_thickness(target_velocity, altitude, shear_modulus, root_chord, tip_chord, semispan, sweep_length=None,
+                      model: str = "howard", specific_heat_ratio=1.4, method: str = "closed_form",
+                      atmosphere=None) -> np.ndarray:
+    """
+    minimum_thickness  Computes the minimum fin thickness whose flutter velocity reaches a target, for arrays of targets,
+    altitudes, materials and geometries broadcast together.
+
+    The target is typically the maximum flight velocity times a safety factor, at the altitude it occurs.
+    The closed form uses the thickness^(3/2) scaling shared by the Howard, Sahr and Bennett models; the bisection
+    method solves the same problem numerically and serves as a check or for models without that scaling.
+
+    :param target_velocity:  Target flutter velocity(ies) in m/s
+    :type target_velocity: float or np.ndarray
+    :param altitude:  Altitude(s) in m, where the air state is taken from the standard atmosphere
+    :type altitude: float or np.ndarray
+    :param shear_modulus:  Shear modulus(i) of the fin material in Pa
+    :type shear_modulus: float or np.ndarray
+    :param root_chord:  Root chord(s) in m
+    :type root_chord: float or np.ndarray
+    :param tip_chord:  Tip chord(s) in m
+    :type tip_chord: float or np.ndarray
+    :param semispan:  Semispan(s) in m
+    :type semispan: float or np.ndarray
+    :param sweep_length:  Sweep length(s) of the leading edge in m, needed by the Bennett model, defaults to None
+    :type sweep_length: float or np.ndarray, optional
+    :param model:  "howard", "sahr" or "bennet", defaults to "howard"
+    :type model: str, optional
+    :param specific_heat_ratio:  Ratio of specific heats of air, defaults to 1.4
+    :type specific_heat_ratio: float, optional
+    :param method:  "closed_form" or "bisect", defaults to "closed_form"
+    :type method: str, optional
+    :param atmosphere:  Atmosphere to take the air state from, defaults to None for the standard atmosphere
+    :type atmosphere: Atmosphere, optional
+    :return:  Minimum thickness(es) in m, with the broadcast shape of the arguments
+    :rtype: np.ndarray
+    """
+    if model not in FLUTTER_MODELS:
+        raise ValueError(f"Unknown flutter model {model!r}, expected one of {FLUTTER_MODELS}")
+    atmosphere = standard_atmosphere() if atmosphere is None else atmosphere
+    air = atmosphere.properties(altitude)
+
+    def flutter_velocity(thickness):
+        return model_flutter_velocity(model, air["pressure"], air["speed_of_sound"], root_chord, tip_chord, semispan,
+                                      thickness, shear_modulus, sweep_length=sweep_length,
+                                      specific_heat_ratio=specific_heat_ratio)
+
+    target_velocity = np.asarray(target_velocity, dtype=np.float64)
+    reference = np.asarray(root_chord, dtype=np.float64) * 0.01
+    if method == "closed_form":
+        return reference * (target_velocity / flutter_velocity(reference)) ** (1 / THICKNESS_EXPONENT)
+    if method == "bisect":
+        # Bracket from 1e-6 to 1x the root chord, well beyond any practical fin
+        return solve_thickness(flutter_velocity, target_velocity, reference * 1e-4, reference * 100)
+    raise ValueError(f"Unknown method {method!r}, expected 'closed_form' or 'bisect'")
@@ -0,0 +1,221 @@
+import numpy as np
+import pandas as pd
+
+from . import bennet_fin_flutter_refactored as bennet
+from . import howard_fin_flutter as howard
+from . import sahr_fin_flutter as sahr
+from .atmosphere import standard_atmosphere
+from .units import convert
+
+FLUTTER_MODELS = ("howard", "sahr", "bennet")
+
+# Sea level pressure in Pa, the reference pressure of the Bennett model
+SEA_LEVEL_PRESSURE = 101325.0
+
+# Flight state column -> (OR raw header, OR unit, RAS raw header, RAS unit). Units are those of the raw exports.
+_STATE_COLUMNS = {
+    "time": ("Time (s)", "s", "Time (sec)", "s"),
+    "altitude": ("Altitude (ft)", "ft", "Altitude (ft)", "ft"),
+    "mach_number": ("Mach number ()", None, "Mach Number", None),
+    "velocity": ("Total velocity (m/s)", "m/s", "Velocity (ft/sec)", "ft/s"),
+    "temperature": ("Air temperature (°C)", "°C", None, None),
+    "pressure": ("Air pressure (mbar)", "mbar", None, None),
+    "speed_of_sound": ("Speed of sound (m/s)", "m/s", None, None),
+}
+_SI_UNITS = {"s": "s", "ft": "m", "m/s": "m/s", "ft/s": "m/s", "°C": "K", "mbar": "Pa"}
+
+
+def flight_state(dh) -> pd.DataFrame:
+    """
+    flight_state  Extracts the trajectory state the flutter models need from a loaded DataHandler, in SI units.
+
+    OpenRocket exports carry the air temperature, pressure and speed of sound at every sample. RASAero flight exports
+    do not, so for those the state is completed from the altitude with the standard atmosphere.
+
+    :param dh:  DataHandler with OR data (merged_df) or RAS flight data (ras_df)
+    :type dh: DataHandler
+    :return:  time (s), altitude (m), mach_number, velocity (m/s), temperature (K), pressure (Pa) and speed_of_sound (m/s)
+    :rtype: pd.DataFrame
+    """
+    is_or = dh.merged_df is not None
+    if not is_or and dh.ras_df is None:
+        raise ValueError("The DataHandler holds no OR or RAS flight data")
+
+    state = {}
+    for name, (or_raw, or_unit, ras_raw, ras_unit) in _STATE_COLUMNS.items():
+        raw, unit = (or_raw, or_unit) if is_or else (ras_raw, ras_unit)
+        if raw is None:
+            continue
+        df = dh.merged_df if is_or else dh.ras_df
+        si_unit = _SI_UNITS.get(unit)
+        if not is_or and name == "velocity" and "total_velocity" in df.columns:
+            # Written by convert_ras_units_to_SI, already in m/s
+            values, unit = df["total_velocity"], si_unit
+        else:
+            values = dh.get_column(raw)
+            # Renamed OR columns hold SI values once convert_or_units_to_SI has run
+            if is_or and raw not in df.columns and dh.or_units_SI:
+                unit = si_unit
+        values = values.to_numpy(dtype=np.float64)
+        state[name] = values if unit == si_unit else convert(values, unit, si_unit)
+
+    if not is_or:
+        air = standard_atmosphere().properties(state["altitude"])
+        for name in ("temperature", "pressure", "speed_of_sound"):
+            state[name] = air[name]
+    return pd.DataFrame(state)
+
+
+def model_flutter_velocity(model: str, pressure, speed_of_sound, root_chord, tip_chord, semispan, thickness,
+                           shear_modulus, sweep_length=None, specific_heat_ratio=1.4) -> np.ndarray:
+    """
+    model_flutter_velocity  Evaluates one flutter model from the local air state. Every argument may be an array; the
+    result has their broadcast shape.
+
+    :param model:  "howard", "sahr" or "bennet"
+    :type model: str
+    :param pressure:  Air pressure in Pa
+    :type pressure: float or np.ndarray
+    :param speed_of_sound:  Speed of sound in m/s
+    :type speed_of_sound: float or np.ndarray
+    :param root_chord:  Root chord in m
+    :type root_chord: float or np.ndarray
+    :param tip_chord:  Tip chord in m
+    :type tip_chord: float or np.ndarray
+    :param semispan:  Semispan in m
+    :type semispan: float or np.ndarray
+    :param thickness:  Fin thickness in m
+    :type thickness: float or np.ndarray
+    :param shear_modulus:  Shear modulus of the fin material in Pa
+    :type shear_modulus: float or np.ndarray
+    :param sweep_length:  Sweep length of the leading edge in m, needed by the Bennett model, defaults to None
+    :type sweep_length: float or np.ndarray, optional
+    :param specific_heat_ratio:  Ratio of specific heats of air, defaults to 1.4
+    :type specific_heat_ratio: float or np.ndarray, optional
+    :return:  Flutter velocity in m/s
+    :rtype: np.ndarray
+    """
+    aspect_ratio = howard.aspect_ratio_function(root_chord, tip_chord, semispan)
+    taper_ratio = howard.taper_ratio_function(root_chord, tip_chord)
+    if model == "howard":
+        # G / P is a ratio, so the model holds in any consistent units
+        velocity = howard.flutter_velocity_lambdified(
+            speed_of_sound, shear_modulus, aspect_ratio, pressure, taper_ratio, thickness, root_chord)
+    elif model == "sahr":
+        # At h = 0 the scale-height terms reduce to the local speed of sound and pressure
+        velocity = sahr.flutter_velocity_lambdified(
+            speed_of_sound, 0.0, 1.0, shear_modulus, pressure, aspect_ratio, taper_ratio,
+            sahr.normalised_thickness_function(thickness, root_chord))
+    elif model == "bennet":
+        if sweep_length is None:
+            raise ValueError("The Bennett model needs the sweep_length of the fin")
+        velocity = bennet.evaluate_flutter_velocity(
+            shear_modulus, root_chord, tip_chord, semispan, thickness, sweep_length, convert(pressure, "Pa", "kPa"),
+            specific_heat_ratio, SEA_LEVEL_PRESSURE, speed_of_sound, None)
+    else:
+        raise ValueError(f"Unknown flutter model {model!r}, expected one of {FLUTTER_MODELS}")
+    return np.asarray(velocity)
+
+
+def flutter_velocities(state: pd.DataFrame, root_chord, tip_chord, semispan, thickness, shear_modulus,
+                       sweep_length=None, specific_heat_ratio: float = 1.4, models: tuple = None) -> pd.DataFrame:
+    """
+    flutter_velocities  Evaluates each flutter model at every sample of a flight state, using the sampled pressure and
+    speed of sound rather than each model's own atmosphere.
+
+    :param state:  Flight state from flight_state
+    :type state: pd.DataFrame
+    :param root_chord:  Root chord in m
+    :type root_chord: float
+    :param tip_chord:  Tip chord in m
+    :type tip_chord: float
+    :param semispan:  Semispan in m
+    :type semispan: float
+    :param thickness:  Fin thickness in m
+    :type thickness: float
+    :param shear_modulus:  Shear modulus of the fin material in Pa
+    :type shear_modulus: float
+    :param sweep_length:  Sweep length of the leading edge in m, needed by the Bennett model, defaults to None
+    :type sweep_length: float, optional
+    :param specific_heat_ratio:  Ratio of specific heats of air, defaults to 1.4
+    :type specific_heat_ratio: float, optional
+    :param models:  Models to evaluate, defaults to None for every model whose inputs are given
+    :type models: tuple, optional
+    :return:  Flutter velocity in m/s per model, one row per sample
+    :rtype: pd.DataFrame
+    """
+    if models is None:
+        models = FLUTTER_MODELS if sweep_length is not None else ("howard", "sahr")
+    unknown = [model for model in models if model not in FLUTTER_MODELS]
+    if unknown:
+        raise ValueError(f"Unknown flutter models {unknown}, expected some of {FLUTTER_MODELS}")
+    if "bennet" in models and sweep_length is None:
+        raise ValueError("The Bennett model needs the sweep_length of the fin")
+
+    pressure = state["pressure"].to_numpy()
+    speed_of_sound = state["speed_of_sound"].to_numpy()
+    velocities = {}
+    for model in models:
+        velocity = model_flutter_velocity(model, pressure, speed_of_sound, root_chord, tip_chord, semispan, thickness,
+                                          shear_modulus, sweep_length=sweep_length,
+                                          specific_heat_ratio=specific_heat_ratio)
+        velocities[model] = np.broadcast_to(velocity, pressure.shape)
+    return pd.DataFrame(velocities, index=state.index)
+
+
+def flutter_margin(dh, root_chord, tip_chord, semispan, thickness, shear_modulus, sweep_length=None,
+                   specific_heat_ratio: float = 1.4, models: tuple = None) -> tuple:
+    """
+    flutter_margin  Computes the flutter margin of a fin at every sample of a flight, for several flutter models at once.
+
+    The margin is flutter velocity / flight velocity - 1, so a negative margin means the fin flutters. Samples with no
+    airspeed (e.g. on the pad) have an infinite margin.
+
+    :param dh:  DataHandler with OR data or RAS flight data
+    :type dh: DataHandler
+    :param root_chord:  Root chord in m
+    :type root_chord: float
+    :param tip_chord:  Tip chord in m
+    :type tip_chord: float
+    :param semispan:  Semispan in m
+    :type semispan: float
+    :param thickness:  Fin thickness in m
+    :type thickness: float
+    :param shear_modulus:  Shear modulus of the fin material in Pa
+    :type shear_modulus: float
+    :param sweep_length:  Sweep length of the leading edge in m, needed by the Bennett model, defaults to None
+    :type sweep_length: float, optional
+    :param specific_heat_ratio:  Ratio of specific heats of air, defaults to 1.4
+    :type specific_heat_ratio: float, optional
+    :param models:  Models to evaluate, defaults to None for every model whose inputs are given
+    :type models: tuple, optional
+    :return:  Per-sample DataFrame (flight state, then flutter_velocity_<model> and margin_<model> columns) and a
+        summary DataFrame indexed by model with the minimum margin and its time, Mach number, altitude and velocities
+    :rtype: tuple
+    """
+    state = flight_state(dh)
+    velocities = flutter_velocities(state, root_chord, tip_chord, semispan, thickness, shear_modulus,
+                                    sweep_length=sweep_length, specific_heat_ratio=specific_heat_ratio, models=models)
+
+    flutter = velocities.to_numpy()
+    velocity = np.abs(state["velocity"].to_numpy())[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        margins = np.where(velocity > 0, flutter / velocity - 1, np.inf)
+
+    samples = pd.concat([state,
+                         velocities.add_prefix("flutter_velocity_"),
+                         pd.DataFrame(margins, index=state.index, columns=velocities.columns).add_prefix("margin_")],
+                        axis=1)
+
+    # The minimum over finite margins; NaN samples (missing state) are skipped
+    masked = np.where(np.isfinite(margins), margins, np.inf)
+    rows = masked.argmin(axis=0)
+    summary = pd.DataFrame({
+        "min_margin": masked[rows, np.arange(len(rows))],
+        "time": state["time"].to_numpy()[rows],
+        "mach_number": state["mach_number"].to_numpy()[rows],
+        "altitude": state["altitude"].to_numpy()[rows],
+        "velocity": velocity[rows, 0],
+        "flutter_velocity": flutter[rows, np.arange(len(rows))],
+    }, index=pd.Index(velocities.columns, name="model"))
+    return samples, summary
@@ -1,31 +1,32 @@
-from sympy import symbols, lambdify, sqrt
-
-# Define symbols in one central place
-cr, ct, b, h, T, G, t, P, a, AR, lambda_ratio = symbols(
-    'c_r c_t b h T G t P a AR lambda_ratio')
-
-# Expressions for wing area, aspect ratio, and taper ratio
-S_expr = 1/2 * (cr + ct) * b
-AR_expr = b**2 / S_expr
-lambda_expr = ct / cr
-
-# Expressions for atmospheric properties
-T_expr = 59 - 0.00356 * h
-P_expr = 2116/144 * ((T + 459.7) / 518.6) ** 5.256
-a_expr = (1.4 * 1716.59 * (T + 460))**0.5
-
-# Fin flutter velocity expression
-Vf_expr = a * sqrt(G / (1.337 * AR**3 * P *
-                   (lambda_ratio + 1) / (2 * (AR + 2) * (t / cr)**3)))
-
-# Lambdify expressions for numerical calculations
-temperature_function = lambdify(h, T_expr, modules='numpy')
-pressure_function = lambdify(T, P_expr, modules='numpy')
-speed_of_sound_function = lambdify(T, a_expr, modules='numpy')
-aspect_ratio_function = lambdify((cr, ct, b), AR_expr, modules='numpy')
-taper_ratio_function = lambdify((cr, ct), lambda_expr, modules='numpy')
-flutter_velocity_lambdified = lambdify(
-        (a, G, AR, P, lambda_ratio, t, cr), Vf_expr, modules='numpy')
+import numpy as np
+from .units import convert
+
+# NumPy kernels of the expressions in derivations/howard_fin_flutter.py, where they are derived with SymPy
+
+
+def temperature_function(h):
+    return 59 - 0.00356 * h
+
+
+def pressure_function(T):
+    return 2116/144 * ((T + 459.7) / 518.6) ** 5.256
+
+
+def speed_of_sound_function(T):
+    return (1.4 * 1716.59 * (T + 460))**0.5
+
+
+def aspect_ratio_function(c_r, c_t, b):
+    return b**2 / (1/2 * (c_r + c_t) * b)
+
+
+def taper_ratio_function(c_r, c_t):
+    return c_t / c_r
+
+
+def flutter_velocity_lambdified(a, G, AR, P, lambda_ratio, t, c_r):
+    return a * np.sqrt(G / (1.337 * AR**3 * P *
+                       (lambda_ratio + 1) / (2 * (AR + 2) * (t / c_r)**3)))
 
 # Now, you can call these lambdified functions in your main calculation functions
 def calculate_temperature(altitude:float)->float:
@@ -96,3 +97,24 @@ def calculate_flutter_velocity(altitude:float, shear_modulus:float, thickness:fl
         speed_of_sound, shear_modulus, aspect_ratio, pressure, taper_ratio, thickness, root_chord)
 
     return flutter_velocity
+
+
+def calculate_flutter_velocity_SI(altitude:float, shear_modulus:float, thickness:float, root_chord:float, tip_chord:float, semispan:float)->float:
+    """
+    calculate_flutter_velocity_SI  Calculate the flutter velocity at a given altitude in m/s from SI inputs
+
+    Args:
+        altitude (float):  The altitude in m
+        shear_modulus (float):  The shear modulus in Pa
+        thickness (float):  The thickness in m
+        root_chord (float):  The root chord in m
+        tip_chord (float):  The tip chord in m
+        semispan (float):  The semispan in m
+
+    Returns:
+        float:  The flutter velocity in m/s
+    """
+    flutter_velocity = calculate_flutter_velocity(
+        convert(altitude, "m", "ft"), convert(shear_modulus, "Pa", "psi"), convert(thickness, "m", "in"),
+        convert(root_chord, "m", "in"), convert(tip_chord, "m", "in"), convert(semispan, "m", "in"))
+    return convert(flutter_velocity, "ft/s", "m/s")
@@ -0,0 +1,317 @@
+import concurrent.futures
+import functools
+
+import numpy as np
+import pandas as pd
+
+from .atmosphere import standard_atmosphere
+from .flutter_margin import FLUTTER_MODELS, model_flutter_velocity
+from .recovery import RocketParachuteCalculator
+
+DEFAULT_PERCENTILES = (1.0, 5.0, 50.0, 95.0, 99.0)
+DEFAULT_BINS = 4096
+
+# Comparison of a limit, as given in the limits of monte_carlo -> test for a sample exceeding it
+_SIDES = {"<": np.less, "<=": np.less_equal, ">": np.greater, ">=": np.greater_equal}
+
+
+def sample(rng: np.random.Generator, distribution, size: int) -> np.ndarray:
+    """
+    sample  Draws samples from one input distribution.
+
+    :param rng:  Random generator to draw from
+    :type rng: np.random.Generator
+    :param distribution:  A constant, or a tuple of the name of a np.random.Generator method and its parameters, e.g.
+        ("normal", mean, std), ("uniform", low, high), ("triangular", left, mode, right) or ("lognormal", mean, sigma)
+    :type distribution: float or tuple
+    :param size:  Number of samples
+    :type size: int
+    :return:  Samples
+    :rtype: np.ndarray
+    """
+    if np.isscalar(distribution):
+        return np.full(size, distribution, dtype=np.float64)
+    name, *parameters = distribution
+    method = getattr(rng, name, None)
+    if name.startswith("_") or not callable(method):
+        raise ValueError(f"Unknown distribution {name!r}, expected a np.random.Generator method")
+    return np.asarray(method(*parameters, size=size), dtype=np.float64)
+
+
+class StreamingStatistics:
+    """Summary statistics of one output, accumulated chunk by chunk.
+
+    The mean and variance are merged with the parallel form of Welford's algorithm, so
+    chunks may be accumulated in any grouping. Percentiles come from a fixed-edge
+    histogram, with under- and overflow counts bounded by the exact minimum and maximum,
+    and exceedance is counted exactly against an optional limit.
+    """
+
+    def __init__(self, edges: np.ndarray, limit: tuple = None):
+        """
+        __init__  Creates empty statistics.
+
+        :param edges:  Histogram bin edges, shared by every chunk of the run
+        :type edges: np.ndarray
+        :param limit:  (side, value) where side is one of "<", "<=", ">", ">=", counting samples value side limit as
+            exceeding it, defaults to None
+        :type limit: tuple, optional
+        """
+        if limit is not None and limit[0] not in _SIDES:
+            raise ValueError(f"Unknown limit side {limit[0]!r}, expected one of {list(_SIDES)}")
+        self.edges = edges
+        self.limit = limit
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.exceedances = 0
+        self.invalid = 0
+        # Underflow, one count per bin, overflow
+        self.histogram = np.zeros(len(edges) + 1, dtype=np.int64)
+
+    def update(self, values: np.ndarray):
+        """
+        update  Adds a chunk of samples. NaN samples are counted as invalid and otherwise ignored.
+
+        :param values:  Samples of the output
+        :type values: np.ndarray
+        """
+        values = np.ravel(values)
+        valid = np.isfinite(values)
+        self.invalid += int(values.size - np.count_nonzero(valid))
+        values = values[valid]
+        if values.size == 0:
+            return
+        chunk = StreamingStatistics(self.edges, self.limit)
+        chunk.count = values.size
+        chunk.mean = float(values.mean())
+        chunk.m2 = float(np.sum((values - chunk.mean) ** 2))
+        chunk.minimum = float(values.min())
+        chunk.maximum = float(values.max())
+        chunk.histogram = np.bincount(np.searchsorted(self.edges, values, side="right"),
+                                      minlength=len(self.edges) + 1)
+        if self.limit is not None:
+            side, value = self.limit
+            chunk.exceedances = int(np.count_nonzero(_SIDES[side](values, value)))
+        self.merge(chunk)
+
+    def merge(self, other: "StreamingStatistics"):
+        """
+        merge  Adds the samples accumulated by other statistics over the same edges and limit.
+
+        :param other:  Statistics to merge in
+        :type other: StreamingStatistics
+        """
+        count = self.count + other.count
+        if count:
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / count
+            self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.exceedances += other.exceedances
+        self.invalid += other.invalid
+        self.histogram += other.histogram
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+    def percentiles(self, q) -> np.ndarray:
+        """
+        percentiles  Estimates percentiles by linear interpolation within the histogram bins.
+
+        :param q:  Percentile(s) between 0 and 100
+        :type q: float or np.ndarray
+        :return:  Estimated percentile(s), exact to within one bin width
+        :rtype: np.ndarray
+        """
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan)
+        # Cumulative counts at the bin boundaries, the outer bins spanning out to the sample extremes
+        boundaries = np.concatenate(([min(self.minimum, self.edges[0])], self.edges,
+                                     [max(self.maximum, self.edges[-1])]))
+        cumulative = np.concatenate(([0], np.cumsum(self.histogram)))
+        boundaries = np.clip(boundaries, self.minimum, self.maximum)
+        return np.interp(np.asarray(q, dtype=np.float64) / 100 * self.count, cumulative, boundaries)
+
+    @property
+    def exceedance_probability(self) -> float:
+        if self.limit is None or self.count == 0:
+            return np.nan
+        return self.exceedances / self.count
+
+
+def _evaluate_chunk(evaluate, distributions: dict, size: int, seed: np.random.SeedSequence) -> dict:
+    rng = np.random.default_rng(seed)
+    samples = {name: sample(rng, distribution, size) for name, distribution in distributions.items()}
+    return evaluate(samples)
+
+
+def _run_chunk(evaluate, distributions: dict, size: int, seed: np.random.SeedSequence, edges: dict,
+               limits: dict) -> dict:
+    outputs = _evaluate_chunk(evaluate, distributions, size, seed)
+    statistics = {}
+    for name, values in outputs.items():
+        statistics[name] = StreamingStatistics(edges[name], limits.get(name))
+        statistics[name].update(values)
+    return statistics
+
+
+def _histogram_edges(values: np.ndarray, bins: int) -> np.ndarray:
+    """
+    _histogram_edges  Bin edges spanning the pilot chunk's range padded by half of it on each side.
+    """
+    values = values[np.isfinite(values)]
+    if values.size == 0:
+        return np.linspace(-1.0, 1.0, bins + 1)
+    low, high = values.min(), values.max()
+    pad = (high - low) / 2 if high > low else max(abs(low), 1.0) * 1e-6
+    return np.linspace(low - pad, high + pad, bins + 1)
+
+
+def monte_carlo(evaluate, distributions: dict, samples: int = 100_000, chunksize: int = 10_000, seed: int = 0,
+                workers: int = 1, limits: dict = None, percentiles: tuple = DEFAULT_PERCENTILES,
+                bins: int = DEFAULT_BINS) -> pd.DataFrame:
+    """
+    monte_carlo  Propagates input distributions through a vectorized model and summarises its outputs, without holding
+    all samples in memory.
+
+    The samples are drawn and evaluated in chunks. Each chunk has its own seed spawned from one SeedSequence, so the
+    result depends on the seed and chunksize only, not on the number of workers. The first chunk runs in this process
+    and fixes the histogram edges; the rest are spread over a process pool when workers > 1, and only their summary
+    statistics are sent back.
+
+    :param evaluate:  Picklable callable taking a dict of sample arrays and returning a dict of output arrays, e.g.
+        functools.partial(flutter_outputs, root_chord=0.2, ...)
+    :type evaluate: callable
+    :param distributions:  Input name -> distribution, see sample
+    :type distributions: dict
+    :param samples:  Total number of samples, defaults to 100_000
+    :type samples: int, optional
+    :param chunksize:  Samples evaluated at once, defaults to 10_000
+    :type chunksize: int, optional
+    :param seed:  Seed of the run, defaults to 0
+    :type seed: int, optional
+    :param workers:  Number of processes, defaults to 1 to run everything in this process
+    :type workers: int, optional
+    :param limits:  Output name -> (side, value), e.g. {"margin_howard": ("<", 0.0)}, to report the probability of an
+        output exceeding it, defaults to None
+    :type limits: dict, optional
+    :param percentiles:  Percentiles to report, defaults to DEFAULT_PERCENTILES
+    :type percentiles: tuple, optional
+    :param bins:  Histogram bins per output used for the percentiles, defaults to DEFAULT_BINS
+    :type bins: int, optional
+    :return:  One row per output with count, mean, std, min, max, the percentiles (p<q> columns), exceedance_probability
+        and invalid (NaN outputs)
+    :rtype: pd.DataFrame
+    """
+    if samples < 1:
+        raise ValueError(f"samples must be at least 1, got {samples}")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+    limits = {} if limits is None else limits
+    sizes = [chunksize] * (samples // chunksize) + ([samples % chunksize] if samples % chunksize else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    pilot = _evaluate_chunk(evaluate, distributions, sizes[0], seeds[0])
+    edges = {name: _histogram_edges(np.ravel(values), bins) for name, values in pilot.items()}
+    unknown = set(limits) - set(edges)
+    if unknown:
+        raise ValueError(f"Limits given for unknown outputs {sorted(unknown)}, expected some of {list(edges)}")
+    statistics = {}
+    for name, values in pilot.items():
+        statistics[name] = StreamingStatistics(edges[name], limits.get(name))
+        statistics[name].update(values)
+    del pilot
+
+    run = functools.partial(_run_chunk, evaluate, distributions, edges=edges, limits=limits)
+    if workers > 1 and len(sizes) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(run, sizes[1:], seeds[1:])
+            for chunk in results:
+                for name, chunk_statistics in chunk.items():
+                    statistics[name].merge(chunk_statistics)
+    else:
+        for size, chunk_seed in zip(sizes[1:], seeds[1:]):
+            for name, chunk_statistics in run(size, chunk_seed).items():
+                statistics[name].merge(chunk_statistics)
+
+    rows = {}
+    for name, stats in statistics.items():
+        row = {"count": stats.count, "mean": stats.mean, "std": stats.std, "min": stats.minimum, "max": stats.maximum}
+        row.update({f"p{q:g}": value for q, value in zip(percentiles, stats.percentiles(percentiles))})
+        row["exceedance_probability"] = stats.exceedance_probability
+        row["invalid"] = stats.invalid
+        rows[name] = row
+    return pd.DataFrame.from_dict(rows, orient="index").rename_axis("output")
+
+
+def flutter_outputs(samples: dict, models: tuple = ("howard", "sahr"), atmosphere=None, **constants) -> dict:
+    """
+    flutter_outputs  Evaluator for monte_carlo giving the flutter velocity and margin of each model.
+
+    Each input is taken from the samples if sampled and from the constants otherwise: shear_modulus (Pa), thickness,
+    root_chord, tip_chord, semispan and sweep_length (m, sweep_length for the Bennett model only), altitude (m) and
+    velocity (m/s, the flight velocity at that altitude). The air state comes from the altitude.
+
+    :param samples:  Sampled inputs
+    :type samples: dict
+    :param models:  Flutter models to evaluate, defaults to ("howard", "sahr")
+    :type models: tuple, optional
+    :param atmosphere:  Atmosphere for the air state, defaults to None for the standard atmosphere
+    :type atmosphere: Atmosphere, optional
+    :return:  flutter_velocity_<model> (m/s) and margin_<model> (flutter velocity / velocity - 1) arrays
+    :rtype: dict
+    """
+    unknown = [model for model in models if model not in FLUTTER_MODELS]
+    if unknown:
+        raise ValueError(f"Unknown flutter models {unknown}, expected some of {FLUTTER_MODELS}")
+    inputs = {**constants, **samples}
+    atmosphere = standard_atmosphere() if atmosphere is None else atmosphere
+    air = atmosphere.properties(inputs["altitude"])
+    size = len(next(iter(samples.values()))) if samples else 1
+    outputs = {}
+    for model in models:
+        flutter_velocity = model_flutter_velocity(
+            model, air["pressure"], air["speed_of_sound"], inputs["root_chord"], inputs["tip_chord"],
+            inputs["semispan"], inputs["thickness"], inputs["shear_modulus"],
+            sweep_length=inputs.get("sweep_length"), specific_heat_ratio=air["specific_heat_ratio"])
+        outputs[f"flutter_velocity_{model}"] = np.broadcast_to(flutter_velocity, (size,))
+        outputs[f"margin_{model}"] = np.broadcast_to(flutter_velocity / np.abs(inputs["velocity"]) - 1, (size,))
+    return outputs
+
+
+def landing_outputs(samples: dict, atmosphere=None, **constants) -> dict:
+    """
+    landing_outputs  Evaluator for monte_carlo giving the steady descent velocity under a parachute.
+
+    Each input is taken from the samples if sampled and from the constants otherwise: mass (kg), drag_coefficient,
+    and either area (m^2) or diameter (m) of the canopy, and either air_density (kg/m^3) or altitude (m).
+
+    :param samples:  Sampled inputs
+    :type samples: dict
+    :param atmosphere:  Atmosphere for the air density when it comes from the altitude, defaults to None for the
+        standard atmosphere
+    :type atmosphere: Atmosphere, optional
+    :return:  landing_velocity (m/s) and area_cd (m^2) arrays
+    :rtype: dict
+    """
+    inputs = {**constants, **samples}
+    if "air_density" in inputs:
+        air_density = inputs["air_density"]
+    else:
+        atmosphere = standard_atmosphere() if atmosphere is None else atmosphere
+        air_density = atmosphere.density(inputs["altitude"])
+    area = inputs["area"] if "area" in inputs else np.pi * np.asarray(inputs["diameter"]) ** 2 / 4
+    area_cd = area * np.asarray(inputs["drag_coefficient"])
+    # calc_area_cd with no safety factor at 1 m/s scales as 1 / velocity^2
+    required = RocketParachuteCalculator().calc_area_cd(1.0, inputs["mass"], air_density, 1.0)
+    size = len(next(iter(samples.values()))) if samples else 1
+    return {
+        "landing_velocity": np.broadcast_to(np.sqrt(required / area_cd), (size,)),
+        "area_cd": np.broadcast_to(area_cd, (size,)),
+    }
@@ -0,0 +1,306 @@
+import glob
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+# Motor file patterns found in a catalogue directory
+MOTOR_PATTERNS = ("*.eng", "*.csv")
+
+# NAR/TRA impulse classes: letter -> upper bound of total impulse in N s
+IMPULSE_CLASSES = {letter: 2.5 * 2 ** i for i, letter in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZ")}
+
+# Parsed motors by content hash of their file
+_MOTOR_CACHE = {}
+
+
+def _read_thrustcurve_csv(lines: list) -> tuple:
+    """
+    _read_thrustcurve_csv  Parses a ThrustCurve.org CSV: quoted "key:","value" metadata, a header row, then data.
+    """
+    metadata = {}
+    rows = []
+    header = False
+    for line in lines:
+        fields = [field.strip().strip('"') for field in line.split(",")]
+        if not fields[0]:
+            continue
+        if fields[0].endswith(":"):
+            metadata[fields[0][:-1]] = fields[1] if len(fields) > 1 else ""
+            continue
+        if not header:
+            # The data starts after the "Time (s)","Thrust (N)" header
+            header = len(fields) > 1 and fields[1].lower().startswith("thrust")
+            continue
+        rows.append((float(fields[0]), float(fields[1])))
+    if not header:
+        raise ValueError("No \"Time (s)\",\"Thrust (N)\" header; not a ThrustCurve.org CSV")
+    motor = {"name": metadata.get("motor", ""), "manufacturer": metadata.get("manufacturer", "")}
+    return np.array(rows, dtype=np.float64).reshape(-1, 2), motor
+
+
+def _read_rasp_eng(lines: list) -> tuple:
+    """
+    _read_rasp_eng  Parses a RASP .eng file: ";" comments, a header line, then "time thrust" pairs.
+    """
+    lines = [line.split(";")[0].strip() for line in lines]
+    lines = [line for line in lines if line]
+    name, diameter, length, delays, propellant_mass, total_mass, manufacturer = lines[0].split()[:7]
+    rows = [tuple(float(value) for value in line.split()[:2]) for line in lines[1:]]
+    motor = {
+        "name": name,
+        "manufacturer": manufacturer,
+        "diameter": float(diameter) / 1000,
+        "length": float(length) / 1000,
+        "delays": delays,
+        "propellant_mass": float(propellant_mass),
+        "total_mass": float(total_mass),
+    }
+    return np.array(rows, dtype=np.float64).reshape(-1, 2), motor
+
+
+def _parse_motor_file(filepath: str, text: str) -> tuple:
+    """
+    _parse_motor_file  Parses the text of a motor file by its extension, returning the thrust points and motor data.
+    """
+    lines = text.splitlines()
+    if filepath.lower().endswith(".eng"):
+        points, motor = _read_rasp_eng(lines)
+    else:
+        points, motor = _read_thrustcurve_csv(lines)
+    if points.size == 0:
+        raise ValueError(f"No thrust curve points found in {filepath}")
+    if points[0, 0] > 0:
+        points = np.vstack(([0.0, 0.0], points))
+    return points, motor
+
+
+def read_thrust_curve(filepath: str) -> tuple:
+    """
+    read_thrust_curve  Reads a motor thrust curve from a ThrustCurve.org CSV (e.g. data/AeroTech_M2100G.csv) or a RASP
+    .eng file (e.g. RocketPy/data/motors/Cesaroni_M1670.eng).
+
+    :param filepath:  Path to the motor file
+    :type filepath: str
+    :return:  Thrust curve DataFrame ("Time (s)", "Thrust (N)", starting at t = 0) and a dict of motor data: name and
+        manufacturer, plus diameter and length (m), delays, propellant_mass and total_mass (kg) for .eng files
+    :rtype: tuple
+    """
+    with open(filepath, encoding="utf-8", errors="replace") as file:
+        points, motor = _parse_motor_file(filepath, file.read())
+    return pd.DataFrame(points, columns=["Time (s)", "Thrust (N)"]), motor
+
+
+class Motor:
+    """Thrust curve of a motor with its impulse and mass tables.
+
+    The cumulative impulse is tabulated once at the curve points, exactly for the
+    piecewise-linear thrust, so thrust(t), impulse(t) and mass(t) are one binary search
+    per time plus a polynomial within the segment, over whole arrays of times. The
+    propellant burns in proportion to the impulse delivered, so the mass flow is
+    proportional to the thrust. Motors read with from_file are cached by file contents.
+    """
+
+    def __init__(self, time, thrust, name: str = "", manufacturer: str = "", diameter: float = np.nan,
+                 length: float = np.nan, delays: str = "", propellant_mass: float = np.nan,
+                 total_mass: float = np.nan):
+        """
+        __init__  Builds the motor tables from its thrust curve.
+
+        :param time:  Increasing times of the curve points in s, starting at 0
+        :type time: np.ndarray
+        :param thrust:  Thrust at each point in N
+        :type thrust: np.ndarray
+        :param name:  Motor designation, defaults to ""
+        :type name: str, optional
+        :param manufacturer:  Manufacturer, defaults to ""
+        :type manufacturer: str, optional
+        :param diameter:  Diameter in m, defaults to NaN
+        :type diameter: float, optional
+        :param length:  Length in m, defaults to NaN
+        :type length: float, optional
+        :param delays:  Available ejection delays, defaults to ""
+        :type delays: str, optional
+        :param propellant_mass:  Propellant mass in kg, defaults to NaN
+        :type propellant_mass: float, optional
+        :param total_mass:  Loaded motor mass in kg, defaults to NaN
+        :type total_mass: float, optional
+        """
+        self.time = np.ascontiguousarray(time, dtype=np.float64)
+        self.thrust_table = np.ascontiguousarray(thrust, dtype=np.float64)
+        if self.time.ndim != 1 or self.time.shape != self.thrust_table.shape or self.time.size < 2:
+            raise ValueError("The thrust curve needs at least two (time, thrust) points")
+        if np.any(np.diff(self.time) < 0):
+            raise ValueError("The thrust curve times must be increasing")
+        self.name = name
+        self.manufacturer = manufacturer
+        self.diameter = diameter
+        self.length = length
+        self.delays = delays
+        self.propellant_mass = propellant_mass
+        self.total_mass = total_mass
+
+        self._slope = np.divide(np.diff(self.thrust_table), np.diff(self.time),
+                                out=np.zeros(self.time.size - 1), where=np.diff(self.time) > 0)
+        segment_impulse = np.diff(self.time) * (self.thrust_table[1:] + self.thrust_table[:-1]) / 2
+        self.impulse_table = np.concatenate(([0.0], np.cumsum(segment_impulse)))
+        self.total_impulse = float(self.impulse_table[-1])
+        self.burn_time = float(self.time[-1])
+        self.max_thrust = float(self.thrust_table.max())
+        self.average_thrust = self.total_impulse / self.burn_time if self.burn_time > 0 else np.nan
+        for table in (self.time, self.thrust_table, self.impulse_table, self._slope):
+            table.flags.writeable = False
+
+    @classmethod
+    def from_file(cls, filepath: str) -> "Motor":
+        """
+        from_file  Reads a ThrustCurve.org CSV or RASP .eng motor file, reusing the parsed motor when a file with the same
+        contents was read before.
+
+        :param filepath:  Path to the motor file
+        :type filepath: str
+        :return:  Motor
+        :rtype: Motor
+        """
+        with open(filepath, "rb") as file:
+            content = file.read()
+        # The extension picks the parser, so it is part of the key
+        key = (hashlib.blake2b(content, digest_size=16).hexdigest(), os.path.splitext(filepath)[1].lower())
+        if key not in _MOTOR_CACHE:
+            points, data = _parse_motor_file(filepath, content.decode("utf-8", errors="replace"))
+            _MOTOR_CACHE[key] = cls(points[:, 0], points[:, 1], **data)
+        return _MOTOR_CACHE[key]
+
+    def with_masses(self, total_mass: float = None, propellant_mass: float = None) -> "Motor":
+        """
+        with_masses  Returns a copy of the motor with its loaded and propellant masses replaced, e.g. for a ThrustCurve
+        CSV, which carries no mass data.
+
+        :param total_mass:  Loaded motor mass in kg, defaults to None to keep the current one
+        :type total_mass: float, optional
+        :param propellant_mass:  Propellant mass in kg, defaults to None to keep the current one
+        :type propellant_mass: float, optional
+        :return:  Motor with the new masses
+        :rtype: Motor
+        """
+        return Motor(self.time, self.thrust_table, name=self.name, manufacturer=self.manufacturer,
+                     diameter=self.diameter, length=self.length, delays=self.delays,
+                     propellant_mass=self.propellant_mass if propellant_mass is None else propellant_mass,
+                     total_mass=self.total_mass if total_mass is None else total_mass)
+
+    @property
+    def impulse_class(self) -> str:
+        """Impulse class letter of the total impulse, e.g. "M"."""
+        for letter, upper in IMPULSE_CLASSES.items():
+            if self.total_impulse <= upper:
+                return letter
+        return ""
+
+    def _segments(self, t) -> tuple:
+        t = np.asarray(t, dtype=np.float64)
+        segment = np.clip(np.searchsorted(self.time, t, side="right") - 1, 0, self.time.size - 2)
+        return t, segment, np.clip(t, self.time[0], self.time[-1]) - self.time[segment]
+
+    def thrust(self, t) -> np.ndarray:
+        """
+        thrust  Thrust in N at time(s) t in s, zero outside the curve.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        return np.interp(t, self.time, self.thrust_table, left=0.0, right=0.0)
+
+    def impulse(self, t) -> np.ndarray:
+        """
+        impulse  Impulse in N s delivered by time(s) t in s.
+        """
+        t, segment, elapsed = self._segments(t)
+        return (self.impulse_table[segment] + self.thrust_table[segment] * elapsed
+                + self._slope[segment] * elapsed ** 2 / 2)
+
+    def mass(self, t) -> np.ndarray:
+        """
+        mass  Motor mass in kg at time(s) t in s.
+        """
+        return self.total_mass - self.propellant_mass * self.impulse(t) / self.total_impulse
+
+    def mass_flow(self, t) -> np.ndarray:
+        """
+        mass_flow  Propellant mass flow in kg/s at time(s) t in s.
+        """
+        return self.propellant_mass * self.thrust(t) / self.total_impulse
+
+    def resample(self, step: float) -> "Motor":
+        """
+        resample  Returns the motor with its thrust curve sampled on a uniform time grid, e.g. to align motors in a table.
+
+        :param step:  Time step in s
+        :type step: float
+        :return:  Resampled motor, ending at the same burn time
+        :rtype: Motor
+        """
+        time = np.append(np.arange(0.0, self.burn_time, step), self.burn_time)
+        return Motor(time, self.thrust(time), name=self.name, manufacturer=self.manufacturer,
+                     diameter=self.diameter, length=self.length, delays=self.delays,
+                     propellant_mass=self.propellant_mass, total_mass=self.total_mass)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        to_dataframe  Returns the tables at the curve points.
+
+        :return:  "Time (s)", "Thrust (N)", "Impulse (N s)" and "Mass (kg)" columns
+        :rtype: pd.DataFrame
+        """
+        return pd.DataFrame({"Time (s)": self.time, "Thrust (N)": self.thrust_table,
+                             "Impulse (N s)": self.impulse_table, "Mass (kg)": self.mass(self.time)})
+
+    def summary(self) -> dict:
+        """
+        summary  Returns the headline figures of the motor.
+
+        :return:  name, manufacturer, impulse_class, total_impulse (N s), burn_time (s), average_thrust and max_thrust
+            (N), propellant_mass and total_mass (kg), diameter and length (m)
+        :rtype: dict
+        """
+        return {
+            "name": self.name, "manufacturer": self.manufacturer, "impulse_class": self.impulse_class,
+            "total_impulse": self.total_impulse, "burn_time": self.burn_time, "average_thrust": self.average_thrust,
+            "max_thrust": self.max_thrust, "propellant_mass": self.propellant_mass, "total_mass": self.total_mass,
+            "diameter": self.diameter, "length": self.length,
+        }
+
+
+def load_motors(directory: str, patterns: tuple = MOTOR_PATTERNS) -> dict:
+    """
+    load_motors  Loads every motor file of a catalogue directory (and its subdirectories). Files that are not motor
+    files are reported and skipped.
+
+    :param directory:  Catalogue directory
+    :type directory: str
+    :param patterns:  File name patterns, defaults to MOTOR_PATTERNS
+    :type patterns: tuple, optional
+    :return:  File path -> Motor, in sorted path order
+    :rtype: dict
+    """
+    filepaths = sorted({filepath for pattern in patterns
+                        for filepath in glob.glob(os.path.join(directory, "**", pattern), recursive=True)})
+    motors = {}
+    for filepath in filepaths:
+        try:
+            motors[filepath] = Motor.from_file(filepath)
+        except Exception as e:
+            print(f"Error reading motor file {filepath}: {e}")
+    return motors
+
+
+def motor_table(motors) -> pd.DataFrame:
+    """
+    motor_table  Tabulates the headline figures of many motors, e.g. to select motors by impulse or burn time.
+
+    :param motors:  Motors, or a dict of them as returned by load_motors
+    :type motors: dict or list
+    :return:  One row per motor with the columns of Motor.summary, indexed by file path for a dict
+    :rtype: pd.DataFrame
+    """
+    if isinstance(motors, dict):
+        return pd.DataFrame([motor.summary() for motor in motors.values()], index=pd.Index(list(motors), name="file"))
+    return pd.DataFrame([motor.summary() for motor in motors])
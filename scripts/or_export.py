@@ -0,0 +1,85 @@
+import io
+import re
+
+import pandas as pd
+
+
+EVENT_PATTERN = re.compile(
+    r"#\s*Event\s+(?P<Event>.*?)\s+occurred at t=(?P<time>[-+\d.eE]+)\s*seconds")
+
+HEADER_PATTERN = re.compile(r"#\s*Time \(s\)\s*,")
+
+
+def split_or_export(filepath: str) -> tuple:
+    """
+    split_or_export  Splits a raw OpenRocket export into its column header, data lines and comment lines in one pass.
+
+    :param filepath:  Path to the OpenRocket exported CSV file
+    :type filepath: str
+    :return:  Column names, data bytes ready for the CSV parser, and the decoded comment lines
+    :rtype: tuple
+    """
+    with open(filepath, "rb") as file:
+        lines = file.read().splitlines()
+
+    data_lines = []
+    comment_lines = []
+    # Number of comment lines ahead of the first data row
+    leading_comments = None
+    for line in lines:
+        if line[:1] == b"#":
+            comment_lines.append(line)
+        elif line:
+            if leading_comments is None:
+                leading_comments = len(comment_lines)
+            data_lines.append(line)
+
+    # Zero-width spaces (U+200B) in OpenRocket's unit labels are cleaned here, once, rather than per column later
+    comments = [line.decode("utf-8", errors="replace").replace("\u200b", "") for line in comment_lines]
+    # The column header is "# Time (s),Altitude (ft),...". The simulation name above it may hold commas too, so other
+    # headers fall back to the last comment line with delimited names before the data
+    header = next((comment for comment in comments if HEADER_PATTERN.match(comment)), None)
+    if header is None:
+        header = next((comment for comment in reversed(comments[:leading_comments]) if "," in comment), None)
+    if header is None:
+        raise ValueError(f"No column header found in {filepath}")
+    columns = [name.strip() for name in header.lstrip("#").split(",")]
+    return columns, b"\n".join(data_lines), comments
+
+
+def parse_or_events(comments: list) -> pd.DataFrame:
+    """
+    parse_or_events  Extracts the events from OpenRocket comment lines of the form "# Event APOGEE occurred at t=23.881 seconds".
+
+    :param comments:  Comment lines from the export
+    :type comments: list
+    :return:  Events DataFrame with "Time (s)" and "Event" columns, in file order
+    :rtype: pd.DataFrame
+    """
+    events = pd.Series(comments, dtype="str").str.extract(EVENT_PATTERN).dropna()
+    events = events.reset_index(drop=True)
+    return pd.DataFrame({
+        "Time (s)": pd.to_numeric(events["time"], errors="coerce").astype("float64"),
+        "Event": events["Event"],
+    })
+
+
+def read_or_export(filepath: str, usecols: tuple = None) -> tuple:
+    """
+    read_or_export  Reads an OpenRocket export into a numeric data DataFrame and an events DataFrame.
+
+    :param filepath:  Path to the OpenRocket exported CSV file
+    :type filepath: str
+    :param usecols:  Header names of the columns to parse, defaults to None for every column
+    :type usecols: tuple, optional
+    :return:  Data DataFrame (comment rows removed, first column "Time (s)") and events DataFrame
+    :rtype: tuple
+    """
+    columns, data, comments = split_or_export(filepath)
+    if usecols is not None:
+        missing = [name for name in usecols if name not in columns]
+        if missing:
+            raise KeyError(f"Columns {missing} are not in {filepath}")
+    # OpenRocket writes every variable as a float (NaN where undefined)
+    data_df = pd.read_csv(io.BytesIO(data), header=None, names=columns, usecols=usecols, dtype="float64")
+    return data_df, parse_or_events(comments)
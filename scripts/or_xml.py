@@ -1,8 +1,55 @@
+import gzip
+import io
+import zipfile
 import xml.etree.ElementTree as ET
+import numpy as np
 import pandas as pd
 
+# Component tags written by OpenRocket. Any element directly inside <subcomponents> is treated as a component, so tags
+# missing from this list are still extracted; the list only documents the usual kinds.
+COMPONENT_TAGS = (
+    "rocket", "stage", "podset", "parallelstage",
+    "nosecone", "bodytube", "transition",
+    "trapezoidfinset", "ellipticalfinset", "freeformfinset", "tubefinset", "launchlug", "railbutton",
+    "innertube", "tubecoupler", "centeringring", "bulkhead", "engineblock",
+    "masscomponent", "shockcord", "parachute", "streamer",
+)
+
+# Columns describing where a component sits in the design, ahead of its own properties
+LOCATION_COLUMNS = ("name", "parent", "stage", "stage_number", "depth")
+
+# Tags of components that start a new stage; parallel stages are boosters
+STAGE_TAGS = ("stage", "parallelstage")
+
+_BOOLEAN_VALUES = {"true": True, "false": False}
+
+
+def _open_design(filepath):
+    """
+    _open_design  Opens an OpenRocket design for reading as XML, whether it is plain XML, a gzipped XML (older
+    OpenRocket versions) or a zipped .ork archive (current versions).
+
+    :param filepath:  Path to the .ork or .xml file
+    :type filepath: str
+    :return:  Binary stream of the design XML
+    :rtype: io.BufferedIOBase
+    """
+    if zipfile.is_zipfile(filepath):
+        with zipfile.ZipFile(filepath) as archive:
+            members = [info.filename for info in archive.infolist() if not info.is_dir()]
+            # The design is rocket.ork; attached decals and other files sit beside it
+            member = next((name for name in members if name.endswith((".ork", ".xml"))), members[0])
+            return io.BytesIO(archive.read(member))
+    with open(filepath, "rb") as file:
+        magic = file.read(2)
+    if magic == b"\x1f\x8b":
+        return gzip.open(filepath, "rb")
+    return open(filepath, "rb")
+
+
 def get_root(filepath:str):
-    tree = ET.parse(filepath)
+    with _open_design(filepath) as file:
+        tree = ET.parse(file)
     root = tree.getroot()
     return root
 
@@ -10,7 +57,7 @@ def get_root(filepath:str):
 def find_and_extract_elements(element, tag_name) -> list:
     """
     Recursively search for and extract details from elements with the given tag name.
-    
+
     :param element: The current XML element to search.
     :param tag_name: The name of the tag to search for (e.g., 'bodytube').
     :return: A list of dictionaries containing the details of each found element.
@@ -41,3 +88,213 @@ def create_dataframe_and_drop_duplicates(data):
     df = pd.DataFrame(data)
     df.drop_duplicates(inplace=True)
     return df
+
+
+def iter_components(filepath):
+    """
+    iter_components  Streams the components of an OpenRocket design in one pass over the XML.
+
+    Every element directly inside a <subcomponents> element (and the <rocket> element itself) is a component. Its
+    leaf children are its properties, keyed by tag, with their attributes as "<tag>_<attribute>" (e.g. material and
+    material_density). Nested properties such as <finpoints> or <motormount> are skipped. Elements are released as
+    soon as they are read and parsing stops at the end of the rocket, before the stored simulations.
+
+    :param filepath:  Path to the .ork or .xml file
+    :type filepath: str
+    :return:  Generator of (tag, index, record) triples, where index is the position of the component in document
+        order and record holds the properties plus name, parent (path of the enclosing component names joined by
+        "/"), stage, stage_number and depth. A component is yielded once its element closes, so children come before
+        their parent.
+    :rtype: generator
+    """
+    # One entry per open element: [element, component frame or None, has element children]
+    stack = []
+    stages = 0
+    components = 0
+    with _open_design(filepath) as file:
+        for event, element in ET.iterparse(file, events=("start", "end")):
+            if event == "start":
+                parent = stack[-1] if stack else None
+                frame = None
+                if parent is not None:
+                    parent[2] = True
+                    if element.tag == "rocket" or parent[0].tag == "subcomponents":
+                        # The enclosing component is two levels up, beyond <subcomponents>
+                        owner = stack[-2][1] if len(stack) > 1 else None
+                        frame = {"record": {}, "owner": owner, "tag": element.tag, "index": components,
+                                 "depth": 0 if owner is None else owner["depth"] + 1,
+                                 "stage": owner["stage"] if owner is not None else None}
+                        components += 1
+                        if element.tag in STAGE_TAGS:
+                            frame["stage"] = frame
+                            frame["stage_number"] = stages
+                            stages += 1
+                stack.append([element, frame, False])
+                continue
+
+            element, frame, has_children = stack.pop()
+            if frame is not None:
+                yield frame["tag"], frame["index"], _located_record(frame)
+                if frame["owner"] is None:
+                    # The design ends with </rocket>; the simulations after it hold no components
+                    return
+            elif stack and stack[-1][1] is not None and not has_children and element.tag != "subcomponents":
+                record = stack[-1][1]["record"]
+                text = element.text.strip() if element.text is not None else None
+                record[element.tag] = text
+                for attribute, value in element.attrib.items():
+                    record[f"{element.tag}_{attribute}"] = value
+            # Drop the finished element from its parent so the tree never holds more than the open path
+            if stack:
+                stack[-1][0].remove(element)
+
+
+def _located_record(frame: dict) -> dict:
+    """
+    _located_record  Prepends the location columns to the properties of a closed component.
+
+    :param frame:  Component frame built by iter_components
+    :type frame: dict
+    :return:  Record with name, parent, stage, stage_number and depth first
+    :rtype: dict
+    """
+    names = []
+    owner = frame["owner"]
+    while owner is not None:
+        names.append(owner["record"].get("name") or owner["tag"])
+        owner = owner["owner"]
+    stage = frame["stage"]
+    record = {
+        "name": frame["record"].get("name"),
+        "parent": "/".join(reversed(names)),
+        "stage": stage["record"].get("name") if stage is not None else None,
+        "stage_number": stage["stage_number"] if stage is not None else None,
+        "depth": frame["depth"],
+    }
+    record.update((key, value) for key, value in frame["record"].items() if key != "name")
+    return record
+
+
+def _typed_column(name: str, values: list) -> dict:
+    """
+    _typed_column  Converts a column of property text to its natural type.
+
+    "true"/"false" columns become booleans and numeric columns become floats. OpenRocket writes automatic
+    dimensions as "auto" or "auto <value>"; those columns become floats with an extra boolean "<name>_auto" column.
+    Anything else stays text.
+
+    :param name:  Column name
+    :type name: str
+    :param values:  Property text, None where a component lacks the property
+    :type values: list
+    :return:  Column name -> converted values, plus the "_auto" column when there is one
+    :rtype: dict
+    """
+    present = [value for value in values if value is not None]
+    if not present:
+        return {name: values}
+    if all(value in _BOOLEAN_VALUES for value in present):
+        if len(present) == len(values):
+            return {name: np.array([_BOOLEAN_VALUES[value] for value in values])}
+        return {name: pd.array([_BOOLEAN_VALUES.get(value) for value in values], dtype="boolean")}
+
+    numbers = np.full(len(values), np.nan)
+    auto = np.zeros(len(values), dtype=bool)
+    for row, value in enumerate(values):
+        if value is None:
+            continue
+        if value.startswith("auto"):
+            auto[row] = True
+            value = value[4:]
+        value = value.strip()
+        if value:
+            try:
+                numbers[row] = float(value)
+            except ValueError:
+                return {name: values}
+        elif not auto[row]:
+            return {name: values}
+    columns = {name: numbers}
+    if auto.any():
+        columns[f"{name}_auto"] = auto
+    return columns
+
+
+def typed_columns(records: list) -> dict:
+    """
+    typed_columns  Converts component records of one kind into typed columns.
+
+    :param records:  Records from iter_components
+    :type records: list
+    :return:  Column name -> values, location columns first, then properties converted by type; text columns are
+        lists, the others arrays
+    :rtype: dict
+    """
+    names = dict.fromkeys(LOCATION_COLUMNS)
+    for record in records:
+        names.update(dict.fromkeys(record))
+    columns = {}
+    for name in names:
+        values = [record.get(name) for record in records]
+        if name in LOCATION_COLUMNS:
+            columns[name] = values
+        else:
+            columns.update(_typed_column(name, values))
+    columns["depth"] = np.array(columns["depth"], dtype=np.int64)
+    # The rocket itself belongs to no stage
+    stage_numbers = columns["stage_number"]
+    columns["stage_number"] = pd.array(stage_numbers, dtype="Int64" if None in stage_numbers else "int64")
+    return columns
+
+
+def components_to_dataframe(records: list) -> pd.DataFrame:
+    """
+    components_to_dataframe  Builds a typed DataFrame from component records of one kind.
+
+    :param records:  Records from iter_components
+    :type records: list
+    :return:  One row per component, location columns first, then properties converted by type
+    :rtype: pd.DataFrame
+    """
+    return pd.DataFrame(typed_columns(records))
+
+
+def extract_records(filepath, tags=None) -> dict:
+    """
+    extract_records  Groups the component records of an OpenRocket design by kind, in document order.
+
+    :param filepath:  Path to the .ork (zipped or plain) or .xml file
+    :type filepath: str
+    :param tags:  Component tags to keep, defaults to None for every kind
+    :type tags: iterable, optional
+    :return:  Component tag -> list of records; kinds in the order given, or of first appearance
+    :rtype: dict
+    """
+    tags = None if tags is None else list(tags)
+    records = {}
+    for tag, index, record in iter_components(filepath):
+        if tags is None or tag in tags:
+            records.setdefault(tag, []).append((index, record))
+    # Components close children first, so nested components of one kind are put back in opening order
+    for tag in records:
+        records[tag].sort(key=lambda pair: pair[0])
+    if tags is None:
+        tags = sorted(records, key=lambda tag: records[tag][0][0])
+    return {tag: [record for _, record in records[tag]] for tag in tags if tag in records}
+
+
+def extract_components(filepath, tags=None) -> dict:
+    """
+    extract_components  Extracts the components of an OpenRocket design, in one pass, as one typed DataFrame per kind.
+
+    This replaces get_root plus one find_and_extract_elements call per tag: the file is read once, each component
+    appears exactly once, so no deduplication is needed, and each row carries its parent path and stage.
+
+    :param filepath:  Path to the .ork (zipped or plain) or .xml file
+    :type filepath: str
+    :param tags:  Component tags to keep (e.g. ("bodytube", "trapezoidfinset")), defaults to None for every kind
+    :type tags: iterable, optional
+    :return:  Component tag -> DataFrame, rows in document order; kinds in the order given, or of first appearance
+    :rtype: dict
+    """
+    return {tag: components_to_dataframe(records) for tag, records in extract_records(filepath, tags).items()}
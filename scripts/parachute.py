@@ -1,27 +1,25 @@
-from sympy import symbols, lambdify, sqrt, exp, pi
 import numpy as np
+import pandas as pd
 
-# Define symbols
-Fd, rho, Cd, A, v, Fg, m, g, D = symbols('F_d rho C_d A v F_g m g D')
+from .atmosphere import standard_atmosphere
 
-# Expression for parachute diameter
-chute_diameter_expr = sqrt((8*m*g)/(pi*rho*Cd*v**2))
-velocity_expr = sqrt((8 * m * g) / (pi * rho * Cd * D**2))
-drag_coefficient_expr = (8 * m * g) / (pi * rho * D**2 * v**2)
+# NumPy kernels of the expressions in derivations/parachute.py, where they are derived with SymPy
 
-# Lambdify expressions for numerical calculations
-velocity_function = lambdify(
-    (m, g, rho, Cd, D), velocity_expr, modules='numpy')
-drag_coefficient_function = lambdify(
-    (m, g, rho, D, v), drag_coefficient_expr, modules='numpy')
 
-# Lambdify the expression for numerical calculations
-chute_diameter_function = lambdify(
-    (m, g, rho, Cd, v), chute_diameter_expr, modules='numpy')
+def chute_diameter_function(m, g, rho, C_d, v):
+    return np.sqrt(8*m*g/(np.pi*rho*C_d*v**2))
+
+
+def velocity_function(m, g, rho, C_d, D):
+    return np.sqrt(8*m*g/(np.pi*rho*C_d*D**2))
+
+
+def drag_coefficient_function(m, g, rho, D, v):
+    return 8*m*g/(np.pi*rho*D**2*v**2)
 
 
 def calc_chute_diameter(mass: float, gravity: float, air_density: float, drag_coefficient: float, velocity: float) -> float:
-    # Call the lambdified function with the parameters
+    # Call the kernel with the parameters
     return chute_diameter_function(mass, gravity, air_density, drag_coefficient, velocity)
 
 
@@ -53,9 +51,9 @@ def list_of_chute_diameters(minimum_velocity: float, maximum_velocity: float, in
     velocities = np.arange(
         minimum_velocity, maximum_velocity + increments, increments)
 
-    # Calculate chute diameter for each velocity
-    chute_diameters = np.array([chute_diameter_function(
-        mass, gravity, air_density, drag_coefficient, velocity) for velocity in velocities])
+    # Calculate chute diameter for every velocity in one array call
+    chute_diameters = chute_diameter_function(
+        mass, gravity, air_density, drag_coefficient, velocities)
 
     return chute_diameters
 
@@ -80,8 +78,65 @@ def list_of_velocities(minimum_diameter: float, maximum_diameter: float, increme
     diameters = np.arange(
         minimum_diameter, maximum_diameter + increments, increments)
 
-    # Calculate velocity for each diameter
-    velocities = np.array([calc_velocity(
-        mass, gravity, air_density, drag_coefficient, diameter) for diameter in diameters])
+    # Calculate velocity for every diameter in one array call
+    velocities = calc_velocity(
+        mass, gravity, air_density, drag_coefficient, diameters)
+
+    return velocities
+
+
+# Sweep outputs: name -> (function, its inputs in call order)
+SWEEP_OUTPUTS = {
+    "diameter": (chute_diameter_function, ("mass", "gravity", "air_density", "drag_coefficient", "velocity")),
+    "velocity": (velocity_function, ("mass", "gravity", "air_density", "drag_coefficient", "diameter")),
+    "drag_coefficient": (drag_coefficient_function, ("mass", "gravity", "air_density", "diameter", "velocity")),
+}
+
 
-    return velocities
\ No newline at end of file
+def sweep(output: str, as_array: bool = False, gravity=9.81, **inputs):
+    """
+    sweep  Evaluate a parachute sizing quantity over the full grid of its inputs in one broadcast call
+
+    Each input given as an array becomes one axis of the grid (in argument order); scalars are held constant.
+    An altitude (m) may be given instead of air_density, which is then taken from the standard atmosphere.
+    For example, sweep("diameter", mass=masses, air_density=densities, drag_coefficient=cds, velocity=velocities)
+    evaluates every combination of the four arrays.
+
+    Args:
+        output (str): Quantity to evaluate: "diameter" (m), "velocity" (m/s) or "drag_coefficient"
+        as_array (bool): Return the N-dimensional grid and its axes instead of a Series. Defaults to False.
+        gravity (float or np.ndarray): Acceleration due to gravity in m/s^2. Defaults to 9.81.
+        **inputs: The other inputs of the output, as scalars or 1-D arrays: mass (kg), air_density (kg/m^3) or
+            altitude (m), drag_coefficient, velocity (m/s) and diameter (m)
+
+    Returns:
+        pd.Series: Values indexed by a MultiIndex over the swept inputs, or a tuple (np.ndarray, dict of axes)
+            when as_array is True
+    """
+    if output not in SWEEP_OUTPUTS:
+        raise ValueError(f"Unknown output {output!r}, expected one of {list(SWEEP_OUTPUTS)}")
+    function, parameters = SWEEP_OUTPUTS[output]
+    inputs["gravity"] = gravity
+    if "altitude" in inputs and "air_density" not in inputs:
+        parameters = tuple("altitude" if name == "air_density" else name for name in parameters)
+    missing = [name for name in parameters if name not in inputs]
+    unexpected = [name for name in inputs if name not in parameters]
+    if missing or unexpected:
+        raise TypeError(f"sweep({output!r}) takes {list(parameters)}; missing {missing}, unexpected {unexpected}")
+
+    # Swept inputs keep the order they were given in; each is reshaped onto its own axis, as np.ix_ does
+    axes = {name: np.asarray(value, dtype=np.float64).ravel()
+            for name, value in inputs.items() if np.ndim(value) > 0}
+    grids = dict(zip(axes, np.ix_(*axes.values()))) if axes else {}
+    arguments = [grids.get(name, inputs[name]) for name in parameters]
+    if "altitude" in parameters:
+        arguments[parameters.index("altitude")] = standard_atmosphere().density(arguments[parameters.index("altitude")])
+    values = function(*arguments)
+    values = np.broadcast_to(values, tuple(axis.size for axis in axes.values()))
+
+    if as_array:
+        return values, axes
+    if not axes:
+        return pd.Series([float(values)], name=output)
+    index = pd.MultiIndex.from_product(list(axes.values()), names=list(axes))
+    return pd.Series(values.ravel(), index=index, name=output)
\ No newline at end of file
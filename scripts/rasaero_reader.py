@@ -0,0 +1,250 @@
+import csv
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CHUNKSIZE = 50_000
+
+# Column dtypes of the RASAero II aero-plot export (Aero Plots -> Export to CSV)
+RAS_AERO_DTYPES = {
+    "Mach": "float64",
+    "Alpha": "float64",
+    "CD": "float64",
+    "CD Power-Off": "float64",
+    "CD Power-On": "float64",
+    "CA Power-Off": "float64",
+    "CA Power-On": "float64",
+    "CL": "float64",
+    "CN": "float64",
+    "CN Potential": "float64",
+    "CN Viscous": "float64",
+    "CNalpha (0 to 4 deg) (per rad)": "float64",
+    "CP": "float64",
+    "CP (0 to 4 deg)": "float64",
+    "Reynolds Number": "float64",
+}
+
+# Column dtypes of the RASAero II flight simulation export
+RAS_FLIGHT_DTYPES = {
+    "Time (sec)": "float64",
+    "Stage": "str",
+    "Stage Time (sec)": "float64",
+    "Mach Number": "float64",
+    "Angle of Attack (deg)": "float64",
+    "CD": "float64",
+    "CL": "float64",
+    "Thrust (lb)": "float64",
+    "Weight (lb)": "float64",
+    "Drag (lb)": "float64",
+    "Lift (lb)": "float64",
+    "CG (in)": "float64",
+    "CP (in)": "float64",
+    "Stability Margin (cal)": "float64",
+    "Accel (ft/sec^2)": "float64",
+    "Accel-V (ft/sec^2)": "float64",
+    "Accel-H (ft/sec^2)": "float64",
+    "Velocity (ft/sec)": "float64",
+    "Vel-V (ft/sec)": "float64",
+    "Vel-H (ft/sec)": "float64",
+    "Pitch Attitude (deg)": "float64",
+    "Flight Path Angle (deg)": "float64",
+    "Altitude (ft)": "float64",
+    "Distance (ft)": "float64",
+}
+
+ENGINES = ("auto", "c", "pyarrow")
+
+
+def _pyarrow_csv():
+    """
+    _pyarrow_csv  Returns the pyarrow.csv module, or None when pyarrow is not installed.
+    """
+    try:
+        import pyarrow.csv
+    except ImportError:
+        return None
+    return pyarrow.csv
+
+
+def _read_pyarrow(pa_csv, filepath: str, dtype: dict = None, usecols: list = None) -> pd.DataFrame:
+    """
+    _read_pyarrow  Reads a CSV file with pyarrow's own multi-threaded reader, converting to the given dtypes while parsing.
+
+    pyarrow's float parser is correctly rounded, so the values match the C engine's "round_trip" converter.
+    """
+    import pyarrow as pa
+
+    column_types = {column: pa.string() if column_dtype == "str" else pa.from_numpy_dtype(np.dtype(column_dtype))
+                    for column, column_dtype in (dtype or {}).items()}
+    if usecols is not None:
+        # pyarrow returns the columns in the order asked for; pd.read_csv keeps the file order
+        with open(filepath, newline="") as file:
+            header = next(csv.reader(file))
+        missing = [column for column in usecols if column not in header]
+        if missing:
+            raise ValueError(f"Usecols do not match columns, columns expected but not found: {missing}")
+        usecols = [column for column in header if column in usecols]
+    # Empty text fields are missing values, as pd.read_csv reads them
+    convert_options = pa_csv.ConvertOptions(column_types=column_types, include_columns=usecols, strings_can_be_null=True)
+    table = pa_csv.read_csv(filepath, convert_options=convert_options)
+    # One block per column and the Arrow buffers released as they convert, rather than consolidated copies
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def read_ras_csv(filepath: str, dtype: dict = None, float_precision: str = None, engine: str = "auto",
+                 usecols: list = None) -> pd.DataFrame:
+    """
+    read_ras_csv  Reads a RASAero CSV export into the given column dtypes.
+
+    RASAero writes coefficients with up to 28 significant digits (e.g. 0.3688250212673321389211240200), and parsing
+    these long decimals is most of the cost of a read. The "pyarrow" engine uses pyarrow's own CSV reader, which parses
+    them exactly, converts to dtype while parsing and spreads the work over every core; it is the default ("auto")
+    whenever pyarrow is installed and no float_precision is asked for. The "c" engine is the fallback: it parses as
+    plain pd.read_csv would and casts only the columns whose inferred dtype differs from dtype (e.g. a coefficient
+    column holding only whole numbers, inferred as int64). Its default float converter rounds to within 1 ulp;
+    "round_trip" is exact but about twice as slow. Columns missing from dtype are inferred as usual.
+
+    :param filepath:  Path to the RASAero CSV file
+    :type filepath: str
+    :param dtype:  Column name -> dtype, defaults to None to infer every column
+    :type dtype: dict, optional
+    :param float_precision:  Float converter of the C engine: None, "high", "legacy" or "round_trip", defaults to None
+    :type float_precision: str, optional
+    :param engine:  "auto", "c" or "pyarrow" (optional dependency), defaults to "auto" for pyarrow when it is installed
+        and float_precision is None, else "c"
+    :type engine: str, optional
+    :param usecols:  Columns to parse, defaults to None for every column
+    :type usecols: list, optional
+    :return:  Parsed DataFrame
+    :rtype: pd.DataFrame
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+    if engine != "c":
+        pa_csv = _pyarrow_csv()
+        if engine == "pyarrow":
+            if pa_csv is None:
+                raise ImportError("The pyarrow engine requires pyarrow: pip install pyarrow")
+            if float_precision is not None:
+                raise ValueError("float_precision is only supported by the c engine")
+        if pa_csv is not None and float_precision is None:
+            return _read_pyarrow(pa_csv, filepath, dtype=dtype, usecols=usecols)
+
+    df = pd.read_csv(filepath, usecols=usecols, float_precision=float_precision)
+    if dtype is None:
+        return df
+    casts = [column for column, column_dtype in zip(df.columns, df.dtypes)
+             if column in dtype and column_dtype != dtype[column]]
+    # Column by column: DataFrame.astype with a dict rebuilds the whole frame
+    for column in casts:
+        df[column] = df[column].astype(dtype[column])
+    return df
+
+
+def read_ras_aero_plot(filepath: str, float_precision: str = None, engine: str = "auto", usecols: list = None) -> pd.DataFrame:
+    """
+    read_ras_aero_plot  Reads a RASAero aero-plot export (Mach x Alpha coefficient table) with the RAS_AERO_DTYPES dtypes.
+
+    :param filepath:  Path to the RASAero aero-plot CSV file
+    :type filepath: str
+    :param float_precision:  Float converter of the C engine, defaults to None
+    :type float_precision: str, optional
+    :param engine:  "auto", "c" or "pyarrow", defaults to "auto"
+    :type engine: str, optional
+    :param usecols:  Columns to parse, defaults to None for every column
+    :type usecols: list, optional
+    :return:  Parsed DataFrame
+    :rtype: pd.DataFrame
+    """
+    return read_ras_csv(filepath, dtype=RAS_AERO_DTYPES, float_precision=float_precision, engine=engine, usecols=usecols)
+
+
+def read_ras_flight(filepath: str, float_precision: str = None, engine: str = "auto", usecols: list = None) -> pd.DataFrame:
+    """
+    read_ras_flight  Reads a RASAero flight simulation export with the RAS_FLIGHT_DTYPES dtypes.
+
+    :param filepath:  Path to the RASAero flight CSV file
+    :type filepath: str
+    :param float_precision:  Float converter of the C engine, defaults to None
+    :type float_precision: str, optional
+    :param engine:  "auto", "c" or "pyarrow", defaults to "auto"
+    :type engine: str, optional
+    :param usecols:  Columns to parse, defaults to None for every column
+    :type usecols: list, optional
+    :return:  Parsed DataFrame
+    :rtype: pd.DataFrame
+    """
+    return read_ras_csv(filepath, dtype=RAS_FLIGHT_DTYPES, float_precision=float_precision, engine=engine, usecols=usecols)
+
+
+def iter_ras_aero_plot_chunks(filepath: str, max_mach: float, alpha=None, chunksize: int = DEFAULT_CHUNKSIZE,
+                              float_precision: str = None, every_alpha: bool = False):
+    """
+    iter_ras_aero_plot_chunks  Streams a RASAero aero-plot export in chunks, applying the Mach ceiling, the alpha selection
+    and the de-duplication of each chunk while parsing. Only the rows that survive are yielded.
+
+    Without an alpha selection the first row for each Mach number is kept, as filter_mach_from_ras_csv does, unless
+    every_alpha is set. With one, the first row for each (Mach, Alpha) pair is kept.
+
+    :param filepath:  Path to the RASAero aero-plot CSV file
+    :type filepath: str
+    :param max_mach:  Highest Mach number to keep
+    :type max_mach: float
+    :param alpha:  Angle of attack, or list of angles, to keep, defaults to None for every angle
+    :type alpha: float or list, optional
+    :param chunksize:  Number of rows parsed per chunk, defaults to DEFAULT_CHUNKSIZE
+    :type chunksize: int, optional
+    :param float_precision:  Float converter of the C engine, defaults to None
+    :type float_precision: str, optional
+    :param every_alpha:  Keeps the first row for each (Mach, Alpha) pair without an alpha selection too, e.g. to build
+        a Mach x alpha table, defaults to False
+    :type every_alpha: bool, optional
+    :yield:  Filtered chunks
+    :rtype: pd.DataFrame
+    """
+    alphas = None if alpha is None else np.atleast_1d(alpha)
+    keys = ["Mach"] if alphas is None and not every_alpha else ["Mach", "Alpha"]
+    seen = pd.MultiIndex.from_arrays([[] for _ in keys], names=keys)
+
+    # Explicit dtypes keep every chunk consistent: a chunk holding only whole numbers (e.g. CL at zero alpha) is not inferred as int64
+    for chunk in pd.read_csv(filepath, chunksize=chunksize, dtype=RAS_AERO_DTYPES, float_precision=float_precision):
+        chunk = chunk[chunk["Mach"] <= max_mach]
+        if alphas is not None:
+            chunk = chunk[chunk["Alpha"].isin(alphas)]
+        chunk = chunk.drop_duplicates(subset=keys)
+        chunk_keys = pd.MultiIndex.from_frame(chunk[keys])
+        chunk = chunk[~chunk_keys.isin(seen)]
+        if chunk.empty:
+            continue
+        seen = seen.append(pd.MultiIndex.from_frame(chunk[keys]))
+        yield chunk
+
+
+def read_ras_aero_plot_filtered(filepath: str, max_mach: float, alpha=None, chunksize: int = DEFAULT_CHUNKSIZE,
+                                float_precision: str = None, every_alpha: bool = False) -> pd.DataFrame:
+    """
+    read_ras_aero_plot_filtered  Reads a RASAero aero-plot export with bounded memory, keeping only the rows under the Mach
+    ceiling, at the selected angles of attack, and without duplicate Mach numbers.
+
+    :param filepath:  Path to the RASAero aero-plot CSV file
+    :type filepath: str
+    :param max_mach:  Highest Mach number to keep
+    :type max_mach: float
+    :param alpha:  Angle of attack, or list of angles, to keep, defaults to None for every angle
+    :type alpha: float or list, optional
+    :param chunksize:  Number of rows parsed per chunk, defaults to DEFAULT_CHUNKSIZE
+    :type chunksize: int, optional
+    :param float_precision:  Float converter of the C engine, defaults to None
+    :type float_precision: str, optional
+    :param every_alpha:  Keeps every angle of attack without an alpha selection, de-duplicating (Mach, Alpha) pairs
+        instead of Mach numbers, defaults to False
+    :type every_alpha: bool, optional
+    :return:  Filtered DataFrame
+    :rtype: pd.DataFrame
+    """
+    chunks = list(iter_ras_aero_plot_chunks(filepath, max_mach, alpha=alpha, chunksize=chunksize,
+                                            float_precision=float_precision, every_alpha=every_alpha))
+    if not chunks:
+        return pd.read_csv(filepath, nrows=0, dtype=RAS_AERO_DTYPES)
+    return pd.concat(chunks)
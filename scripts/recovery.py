@@ -1,8 +1,18 @@
-import math
 import numpy as np
+import pandas as pd
+
+# Inputs of RocketParachuteCalculator.design_table that may be swept, in the order of its arguments
+DESIGN_INPUTS = ("rocket_mass", "descent_velocity", "number_of_gores_panels", "hole_to_canopy_area_ratio",
+                 "ratio_of_height_to_radius", "drag_coefficient", "air_density", "safety_factor",
+                 "length_to_half_circumference_ratio")
 
 
 class RocketParachuteCalculator:
+    """Sizing of round gored parachutes.
+
+    Every method broadcasts over NumPy arrays (or lists) of its inputs, so a set of candidate
+    designs is evaluated in one call per quantity; design_table evaluates them all over a grid.
+    """
     GRAVITY = 9.81
 
     def calc_area_cd(self, safety_factor: float, rocket_mass: float, air_density: float, descent_velocity: float) -> float:
@@ -21,14 +31,15 @@ class RocketParachuteCalculator:
         Returns:
         - The calculated area coefficient of drag.
         """
-        return safety_factor * (2 * rocket_mass * self.GRAVITY) / (air_density * descent_velocity ** 2)
+        return np.asarray(safety_factor) * (2 * np.asarray(rocket_mass) * self.GRAVITY) / \
+            (np.asarray(air_density) * np.asarray(descent_velocity) ** 2)
 
     def calc_gore_panel_side_length(self, area_cd: float, hole_to_canopy_area_ratio: float, drag_coefficient: float, number_of_gores_panels: int) -> float:
         """
         Calculate the side length of a gore panel in a parachute.
 
         The formula used is:
-        side_length = 2 * ((math.pi * area_cd / (1 - hole_to_canopy_area_ratio) / drag_coefficient) ** 0.5) / number_of_gores_panels
+        side_length = 2 * ((np.pi * area_cd / (1 - hole_to_canopy_area_ratio) / drag_coefficient) ** 0.5) / number_of_gores_panels
 
         Parameters:
         - area_cd: The area coefficient of drag, output from calc_area_cd.
@@ -39,7 +50,8 @@ class RocketParachuteCalculator:
         Returns:
         - The side length of each gore panel.
         """
-        return 2 * ((math.pi * area_cd / (1 - hole_to_canopy_area_ratio) / drag_coefficient) ** 0.5) / number_of_gores_panels
+        return self.calc_circumference(area_cd, hole_to_canopy_area_ratio, drag_coefficient) / \
+            np.asarray(number_of_gores_panels)
 
     def calc_circumference(self, area_cd: float, hole_to_canopy_area_ratio: float, drag_coefficient: float) -> float:
         """
@@ -47,7 +59,7 @@ class RocketParachuteCalculator:
         the hole to canopy area ratio, and the drag coefficient.
 
         The simplified formula used is:
-        circumference = 2 * ((math.pi * area_cd / (1 - hole_to_canopy_area_ratio) / drag_coefficient) ** 0.5)
+        circumference = 2 * ((np.pi * area_cd / (1 - hole_to_canopy_area_ratio) / drag_coefficient) ** 0.5)
 
         Parameters:
         - area_cd: The area coefficient of drag, output from calc_area_cd.
@@ -57,14 +69,15 @@ class RocketParachuteCalculator:
         Returns:
         - The circumference of the parachute.
         """
-        return 2 * ((math.pi * area_cd / (1 - hole_to_canopy_area_ratio) / drag_coefficient) ** 0.5)
+        return 2 * np.sqrt(np.pi * np.asarray(area_cd) / (1 - np.asarray(hole_to_canopy_area_ratio)) /
+                           np.asarray(drag_coefficient))
 
     def calc_radius(self, circumference: float) -> float:
         """
         Calculate the radius of the parachute based on its circumference.
 
         The formula used is:
-        radius = circumference / (2 * math.pi)
+        radius = circumference / (2 * np.pi)
 
         Parameters:
         - circumference: The circumference of the parachute.
@@ -72,7 +85,7 @@ class RocketParachuteCalculator:
         Returns:
         - The radius of the parachute.
         """
-        return circumference / (2 * math.pi)
+        return np.asarray(circumference) / (2 * np.pi)
 
     def calc_circular_area(self, area_cd: float, drag_coefficient: float, hole_to_canopy_area_ratio: float) -> float:
         """
@@ -89,10 +102,10 @@ class RocketParachuteCalculator:
         Returns:
         - The circular area of the selected parachute section in square meters.
         """
-        return area_cd / drag_coefficient / (1 - hole_to_canopy_area_ratio)
+        return np.asarray(area_cd) / np.asarray(drag_coefficient) / (1 - np.asarray(hole_to_canopy_area_ratio))
 
     def calc_circular_diameter(self, circular_area_of_selected: float):
-        return math.sqrt(4*circular_area_of_selected/math.pi)
+        return np.sqrt(4*np.asarray(circular_area_of_selected)/np.pi)
 
     def calc_ellipse_perimeter(self, a: float, b: float, terms: int = 10) -> float:
         """
@@ -111,16 +124,15 @@ class RocketParachuteCalculator:
         Returns:
         - The approximate perimeter of the ellipse.
         """
+        a, b = np.asarray(a), np.asarray(b)
         h = ((a - b)**2) / ((a + b)**2)
-        sum_series = sum(((0.5 / n)**2 * (h**n) for n in range(1, terms + 1)))
-        perimeter = math.pi * (a + b) * (1 + sum_series)
+        n = np.arange(1, terms + 1)
+        sum_series = np.sum((0.5 / n)**2 * (h[..., None]**n), axis=-1)
+        perimeter = np.pi * (a + b) * (1 + sum_series)
         return perimeter
 
     def calc_semi_ellipsoid_depth(self, radius, ratio_of_height_to_radius):
-        np_radius = np.array(radius)
-        np_ratio_of_height_to_radius = np.array(ratio_of_height_to_radius)
-        depth = np.outer(np_radius, np_ratio_of_height_to_radius)
-        return depth[0]
+        return np.asarray(radius) * np.asarray(ratio_of_height_to_radius)
 
     def calc_length_of_curve(self, radius, semi_ellipsoid_depth, length_to_half_circumference_ratio):
         """
@@ -146,25 +158,111 @@ class RocketParachuteCalculator:
         - The length of the curve, which is a quarter of the ellipse's circumference adjusted by the
         length to half circumference ratio.
         """
-        length_of_curve = 0.25 * length_to_half_circumference_ratio * \
+        radius, semi_ellipsoid_depth = np.asarray(radius), np.asarray(semi_ellipsoid_depth)
+        length_of_curve = 0.25 * np.asarray(length_to_half_circumference_ratio) * \
             np.pi * (3 * (radius + semi_ellipsoid_depth) -
                      np.sqrt((3 * radius + semi_ellipsoid_depth) * (radius + 3 * semi_ellipsoid_depth)))
         return length_of_curve
 
     def calc_length_of_curve_without_hole(self, length_of_curve, hole_to_canopy_area_ratio):
-        return length_of_curve*(1-hole_to_canopy_area_ratio)
+        return np.asarray(length_of_curve)*(1-np.asarray(hole_to_canopy_area_ratio))
 
     def calc_material_area_per_gore(self, side_length: float, length_of_curve_without_hole: float):
-        return 2*side_length*length_of_curve_without_hole/math.pi
+        return 2*np.asarray(side_length)*np.asarray(length_of_curve_without_hole)/np.pi
     
     def calc_material_area_per_chute(self,number_of_gores_panels:float,material_area_per_gore:float):
-        return number_of_gores_panels*material_area_per_gore
+        return np.asarray(number_of_gores_panels)*np.asarray(material_area_per_gore)
     
     def calc_material_area_for_net(self,number_of_gores_panels:float,length_of_curve_without_hole,side_length):
-        return number_of_gores_panels*length_of_curve_without_hole*side_length
+        return np.asarray(number_of_gores_panels)*np.asarray(length_of_curve_without_hole)*np.asarray(side_length)
     
     def calc_mass_per_chute(self,material_area_per_chute,mass_per_unit_area):
-        return material_area_per_chute*mass_per_unit_area
+        return np.asarray(material_area_per_chute)*np.asarray(mass_per_unit_area)
     
     def calc_cost_per_chute(self,material_area_for_net,cost_per_unit_area):
-        return material_area_for_net*cost_per_unit_area
+        return np.asarray(material_area_for_net)*np.asarray(cost_per_unit_area)
+
+    def design_table(self, rocket_mass, descent_velocity, number_of_gores_panels, hole_to_canopy_area_ratio,
+                     ratio_of_height_to_radius, drag_coefficient, air_density=1.225, safety_factor=1.0,
+                     length_to_half_circumference_ratio=1.0, mass_per_unit_area=None, cost_per_unit_area=None,
+                     grid: bool = True) -> pd.DataFrame:
+        """
+        Calculate every derived quantity of a set of parachute designs in one call.
+
+        With grid=True, each input given as an array becomes one axis of a grid (in argument order) and every
+        combination is evaluated; scalars are held constant. With grid=False, the inputs are broadcast together
+        element-wise, so equal-length arrays describe one design per element.
+
+        Parameters:
+        - rocket_mass: Mass of the rocket.
+        - descent_velocity: The desired velocity of the rocket during descent.
+        - number_of_gores_panels: The number of gore panels in the parachute.
+        - hole_to_canopy_area_ratio: Ratio defining the size of the hole in the parachute to its overall area.
+        - ratio_of_height_to_radius: Height of the canopy's semi-ellipsoid relative to its radius.
+        - drag_coefficient: The drag coefficient of the parachute.
+        - air_density: Density of the air where the parachute will be deployed, 1.225 by default.
+        - safety_factor: A multiplier to ensure the parachute is overdesigned for safety, 1 by default.
+        - length_to_half_circumference_ratio: Ratio for calculating the length to the half circumference, 1 by default.
+        - mass_per_unit_area: Mass per unit area of the canopy material, to add mass_per_chute.
+        - cost_per_unit_area: Cost per unit area of the canopy material, to add cost_per_chute.
+        - grid: Evaluate every combination of the array inputs rather than element-wise designs.
+
+        Returns:
+        - One row per design with area_cd, side_length, circumference, radius, circular_area, circular_diameter,
+        semi_ellipsoid_depth, length_of_curve, length_of_curve_without_hole, material_area_per_gore,
+        material_area_per_chute, material_area_for_net and, when their inputs are given, mass_per_chute and
+        cost_per_chute. Indexed by a MultiIndex over the swept inputs when grid is True.
+        """
+        values = (rocket_mass, descent_velocity, number_of_gores_panels, hole_to_canopy_area_ratio,
+                  ratio_of_height_to_radius, drag_coefficient, air_density, safety_factor,
+                  length_to_half_circumference_ratio)
+        inputs = {name: np.asarray(value, dtype=np.float64) for name, value in zip(DESIGN_INPUTS, values)}
+        axes = {name: value.ravel() for name, value in inputs.items() if value.ndim > 0}
+        if grid:
+            inputs.update(zip(axes, np.ix_(*axes.values())))
+        shape = np.broadcast_shapes(*(value.shape for value in inputs.values()))
+
+        area_cd = self.calc_area_cd(inputs["safety_factor"], inputs["rocket_mass"], inputs["air_density"],
+                                    inputs["descent_velocity"])
+        circumference = self.calc_circumference(area_cd, inputs["hole_to_canopy_area_ratio"],
+                                                inputs["drag_coefficient"])
+        side_length = circumference / inputs["number_of_gores_panels"]
+        radius = self.calc_radius(circumference)
+        circular_area = self.calc_circular_area(area_cd, inputs["drag_coefficient"],
+                                                inputs["hole_to_canopy_area_ratio"])
+        semi_ellipsoid_depth = self.calc_semi_ellipsoid_depth(radius, inputs["ratio_of_height_to_radius"])
+        length_of_curve = self.calc_length_of_curve(radius, semi_ellipsoid_depth,
+                                                    inputs["length_to_half_circumference_ratio"])
+        length_of_curve_without_hole = self.calc_length_of_curve_without_hole(
+            length_of_curve, inputs["hole_to_canopy_area_ratio"])
+        material_area_per_gore = self.calc_material_area_per_gore(side_length, length_of_curve_without_hole)
+        material_area_per_chute = self.calc_material_area_per_chute(inputs["number_of_gores_panels"],
+                                                                    material_area_per_gore)
+        material_area_for_net = self.calc_material_area_for_net(inputs["number_of_gores_panels"],
+                                                                length_of_curve_without_hole, side_length)
+        columns = {
+            "area_cd": area_cd,
+            "side_length": side_length,
+            "circumference": circumference,
+            "radius": radius,
+            "circular_area": circular_area,
+            "circular_diameter": self.calc_circular_diameter(circular_area),
+            "semi_ellipsoid_depth": semi_ellipsoid_depth,
+            "length_of_curve": length_of_curve,
+            "length_of_curve_without_hole": length_of_curve_without_hole,
+            "material_area_per_gore": material_area_per_gore,
+            "material_area_per_chute": material_area_per_chute,
+            "material_area_for_net": material_area_for_net,
+        }
+        if mass_per_unit_area is not None:
+            columns["mass_per_chute"] = self.calc_mass_per_chute(material_area_per_chute, mass_per_unit_area)
+        if cost_per_unit_area is not None:
+            columns["cost_per_chute"] = self.calc_cost_per_chute(material_area_for_net, cost_per_unit_area)
+        columns = {name: np.broadcast_to(value, shape).ravel() for name, value in columns.items()}
+
+        if grid and axes:
+            index = pd.MultiIndex.from_product(list(axes.values()), names=list(axes))
+            return pd.DataFrame(columns, index=index)
+        # Element-wise designs keep their inputs as columns
+        inputs = {name: np.broadcast_to(inputs[name], shape).ravel() for name in axes}
+        return pd.DataFrame({**inputs, **columns})
@@ -1,31 +1,28 @@
-from sympy import symbols, lambdify, sqrt, exp
 import numpy as np
 
-# Define symbols in one central place
-cr, ct, b, h, H, T, G, t, P0, Cs0, B, lambda_ratio, Vf = symbols(
-    'c_r c_t b h H T G t P_0 C_s0 B lambda_ratio Vf')
+# NumPy kernels of the expressions in derivations/sahr_fin_flutter.py, where they are derived with SymPy
 
-# Expressions for wing area, aspect ratio, and taper ratio
-S_expr = 1/2 * (cr + ct) * b
-B_expr = b**2 / S_expr
-lambda_expr = ct / cr
-T_expr = t/cr
 
-# Fin flutter velocity expression
-Vf_expr = 1.223 * Cs0 * exp(0.4*h/H)*sqrt(G/P0) * \
-    sqrt((2+B)/(1+lambda_ratio))*(T/B)**(3/2)
+def normalised_thickness_function(t, c_r):
+    return t/c_r
 
-t_expr = (cr*B)*(Vf/(1.223 * Cs0 * exp(0.4*h/H)*sqrt(G/P0) *
-                sqrt((2+B)/(1+lambda_ratio))))**(2/3)
 
-# Lambdify expressions for numerical calculations
-normalised_thickness_function = lambdify((t, cr), T_expr, modules='numpy')
-aspect_ratio_function = lambdify((cr, ct, b), B_expr, modules='numpy')
-taper_ratio_function = lambdify((cr, ct), lambda_expr, modules='numpy')
-flutter_velocity_lambdified = lambdify(
-    (Cs0, h, H, G, P0, B, lambda_ratio, T), Vf_expr, modules='numpy')
-thickness_function = lambdify(
-    (cr, Vf, Cs0, h, H, G, P0, B, lambda_ratio), t_expr, modules='numpy')
+def aspect_ratio_function(c_r, c_t, b):
+    return b**2 / (1/2 * (c_r + c_t) * b)
+
+
+def taper_ratio_function(c_r, c_t):
+    return c_t / c_r
+
+
+def flutter_velocity_lambdified(C_s0, h, H, G, P_0, B, lambda_ratio, T):
+    return 1.223 * C_s0 * np.exp(0.4*h/H)*np.sqrt(G/P_0) * \
+        np.sqrt((2+B)/(1+lambda_ratio))*(T/B)**(3/2)
+
+
+def thickness_function(c_r, Vf, C_s0, h, H, G, P_0, B, lambda_ratio):
+    return (c_r*B)*(Vf/(1.223 * C_s0 * np.exp(0.4*h/H)*np.sqrt(G/P_0) *
+                       np.sqrt((2+B)/(1+lambda_ratio))))**(2/3)
 
 # Now, you can call these lambdified functions in your main calculation functions
 def calculate_normalised_thickness(thickness:float, root_chord:float)->float:
@@ -72,6 +69,31 @@ def calculate_flutter_velocity(sea_level_speed_of_sound:float, altitude:float, a
     return flutter_velocity
 
 
+def calculate_thickness(flutter_velocity, sea_level_speed_of_sound, altitude, atmospheric_scale_height, shear_modulus, sea_level_pressure, root_chord, tip_chord, semispan) -> np.ndarray:
+    """
+    calculate_thickness  Calculate the fin thickness at which the fin flutters at a given velocity, the inverse of
+    calculate_flutter_velocity. Every argument may be an array.
+
+    Args:
+        flutter_velocity (float or np.ndarray):  The target flutter velocity in m/s
+        sea_level_speed_of_sound (float or np.ndarray):  The speed of sound at sea level in m/s
+        altitude (float or np.ndarray):  The altitude in m
+        atmospheric_scale_height (float or np.ndarray):  The atmospheric scale height in m
+        shear_modulus (float or np.ndarray):  The shear modulus of the fin material in Pa
+        sea_level_pressure (float or np.ndarray):  The sea level pressure in Pa
+        root_chord (float or np.ndarray):  The root chord of the fin in m
+        tip_chord (float or np.ndarray):  The tip chord of the fin in m
+        semispan (float or np.ndarray):  The semispan of the fin in m
+
+    Returns:
+        np.ndarray:  The minimum thickness of the fin in m
+    """
+    aspect_ratio = aspect_ratio_function(root_chord, tip_chord, semispan)
+    taper_ratio = taper_ratio_function(root_chord, tip_chord)
+    return thickness_function(root_chord, flutter_velocity, sea_level_speed_of_sound, altitude,
+                              atmospheric_scale_height, shear_modulus, sea_level_pressure, aspect_ratio, taper_ratio)
+
+
 def list_of_flutter_velocities(minimum_thickness: float, maximum_thickness: float, increments: float, sea_level_speed_of_sound: float, altitude: float, atmospheric_scale_height: float, shear_modulus: float, sea_level_pressure: float, root_chord: float, tip_chord: float, semispan: float) -> np.ndarray:
     """
     list_of_flutter_velocities  Generate a list of flutter velocities for a range of fin thicknesses
@@ -96,8 +118,6 @@ def list_of_flutter_velocities(minimum_thickness: float, maximum_thickness: floa
     thicknesses = np.arange(
         minimum_thickness, maximum_thickness + increments, increments)
 
-    # Calculate flutter velocity for each thickness
-    flutter_velocities = np.array([calculate_flutter_velocity(sea_level_speed_of_sound, altitude, atmospheric_scale_height,
-                                  shear_modulus, sea_level_pressure, thickness, root_chord, tip_chord, semispan) for thickness in thicknesses])
-
-    return flutter_velocities
+    # Calculate flutter velocity for every thickness in one array call
+    return calculate_flutter_velocity(sea_level_speed_of_sound, altitude, atmospheric_scale_height, shear_modulus,
+                                      sea_level_pressure, thicknesses, root_chord, tip_chord, semispan)
@@ -0,0 +1,441 @@
+import numpy as np
+import pandas as pd
+
+from .aero_table import AeroTable, read_drag_curve
+from .atmosphere import EARTH_RADIUS, GRAVITY, standard_atmosphere
+from .data_handler import OR_COLUMN_NAMES, DataHandler
+from .motor import Motor
+from .units import convert
+
+# Flight modes of each design
+ON_RAIL, ASCENT, DROGUE, MAIN, LANDED = range(5)
+
+# Column added after the OpenRocket export columns
+FLIGHT_PATH_ANGLE = "Flight path angle (°)"
+
+# Dormand-Prince 5(4) tableau
+_DP_C = np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0])
+_DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_DP_B = np.array([35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0])
+_DP_E = _DP_B - np.array([5179 / 57600, 0.0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40])
+
+# Shortest step in s an event crossing is cut back to; a shorter one puts the event at the start of the step
+MIN_EVENT_STEP = 1e-9
+
+# Consecutive loop passes without the time advancing after which a design is ended
+MAX_STALLED_PASSES = 100
+
+# Per-design inputs of simulate, broadcast to one value per design
+_DESIGN_INPUTS = ("mass", "diameter", "launch_angle", "rail_length", "cd_scale", "drogue_area_cd", "main_area_cd",
+                  "main_altitude")
+
+
+def _load_motor(motor, motor_mass, propellant_mass) -> Motor:
+    """
+    _load_motor  Returns the Motor for a Motor, a motor file or the output of read_thrust_curve, with mass overrides.
+    """
+    if isinstance(motor, str):
+        motor = Motor.from_file(motor)
+    elif not isinstance(motor, Motor):
+        curve, data = motor
+        motor = Motor(curve["Time (s)"], curve["Thrust (N)"], **data)
+    if motor_mass is not None or propellant_mass is not None:
+        motor = motor.with_masses(total_mass=motor_mass, propellant_mass=propellant_mass)
+    if not (np.isfinite(motor.total_mass) and np.isfinite(motor.propellant_mass)):
+        raise ValueError(f"Motor {motor.name!r} has no mass data; give motor_mass and propellant_mass")
+    return motor
+
+
+def _load_drag(drag) -> tuple:
+    """
+    _load_drag  Returns an AeroTable and the name of its drag coefficient from a path, an AeroTable or a (mach, cd) pair.
+    """
+    if drag is None:
+        return None, None
+    if isinstance(drag, str):
+        drag = read_drag_curve(drag)
+    elif not isinstance(drag, AeroTable):
+        drag = AeroTable.from_curve(*drag)
+    for name in ("CD", "drag_coefficient", "CD Power-On", "drag_coefficient_power_on"):
+        if name in drag.coefficients:
+            return drag, name
+    return drag, drag.names[0]
+
+
+class _Forces:
+    """Point-mass dynamics of many designs in the vertical plane of their launch rails."""
+
+    def __init__(self, motor: Motor, drag: tuple, drag_power_off: tuple, designs: dict, atmosphere,
+                 launch_altitude: float):
+        self.motor = motor
+        self.drag, self.drag_name = drag
+        self.drag_power_off, self.drag_power_off_name = drag_power_off
+        self.designs = designs
+        self.atmosphere = atmosphere
+        self.launch_altitude = launch_altitude
+        angle = np.radians(designs["launch_angle"])
+        self.rail_x, self.rail_z = np.sin(angle), np.cos(angle)
+        self.area = np.pi * designs["diameter"] ** 2 / 4
+
+    def __call__(self, t, y, mode, rows, details: bool = False):
+        """
+        __call__  Derivatives of the states y (x, z, vx, vz) of the designs in rows, at times t in modes mode.
+        """
+        x, z, vx, vz = y.T
+        speed = np.hypot(vx, vz)
+        moving = speed > 0
+        rail_x, rail_z = self.rail_x[rows], self.rail_z[rows]
+        ux = np.where(moving, vx / np.where(moving, speed, 1.0), rail_x)
+        uz = np.where(moving, vz / np.where(moving, speed, 1.0), rail_z)
+
+        air = self.atmosphere.properties(self.launch_altitude + z)
+        mach = speed / air["speed_of_sound"]
+        thrust = np.where(mode <= ASCENT, self.motor.thrust(t), 0.0)
+        mass = self.designs["mass"][rows] + self.motor.mass(t)
+
+        drag_coefficient = self.drag.interpolate(self.drag_name, mach)
+        if self.drag_power_off is not None:
+            drag_coefficient = np.where(t < self.motor.burn_time, drag_coefficient,
+                                        self.drag_power_off.interpolate(self.drag_power_off_name, mach))
+        drag_coefficient = drag_coefficient * self.designs["cd_scale"][rows]
+        area_cd = drag_coefficient * self.area[rows]
+        area_cd = np.where(mode == DROGUE, self.designs["drogue_area_cd"][rows], area_cd)
+        area_cd = np.where(mode == MAIN, self.designs["main_area_cd"][rows], area_cd)
+        drag = 0.5 * air["density"] * speed ** 2 * area_cd
+
+        gravity = GRAVITY * (EARTH_RADIUS / (EARTH_RADIUS + self.launch_altitude + z)) ** 2
+        # Thrust acts along the rail until it is cleared, then along the flight path
+        on_rail = mode == ON_RAIL
+        thrust_x = np.where(on_rail, rail_x, ux)
+        thrust_z = np.where(on_rail, rail_z, uz)
+        ax = (thrust * thrust_x - drag * ux) / mass
+        az = (thrust * thrust_z - drag * uz) / mass - gravity
+
+        # On the rail only the component along it acts, and the rocket rests on the pad until thrust exceeds weight
+        along = ax * rail_x + az * rail_z
+        along = np.where(on_rail & ~moving & (along < 0), 0.0, along)
+        ax = np.where(on_rail, along * rail_x, ax)
+        az = np.where(on_rail, along * rail_z, az)
+        landed = mode == LANDED
+        derivative = np.stack([np.where(landed, 0.0, vx), np.where(landed, 0.0, vz),
+                               np.where(landed, 0.0, ax), np.where(landed, 0.0, az)], axis=1)
+        if not details:
+            return derivative
+        return derivative, {
+            "mach": mach, "thrust": thrust, "mass": mass, "drag": drag, "drag_coefficient": drag_coefficient,
+            "gravity": gravity, "temperature": air["temperature"], "pressure": air["pressure"],
+            "speed_of_sound": air["speed_of_sound"],
+        }
+
+
+def _step(forces: _Forces, t, y, h, mode, rows) -> tuple:
+    """
+    _step  One Dormand-Prince step of every row, returning the 5th order state and the error estimate.
+    """
+    stages = []
+    for c, a in zip(_DP_C, _DP_A):
+        state = y + h[:, None] * sum(weight * stage for weight, stage in zip(a, stages)) if stages else y
+        stages.append(forces(t + c * h, state, mode, rows))
+    increment = sum(weight * stage for weight, stage in zip(_DP_B, stages) if weight)
+    error = sum(weight * stage for weight, stage in zip(_DP_E, stages) if weight)
+    return y + h[:, None] * increment, h[:, None] * error
+
+
+def _crossing(before, after) -> np.ndarray:
+    """
+    _crossing  Fraction of a step at which a quantity going from before to after crosses zero.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.clip(np.nan_to_num(before / (before - after)), 0.0, 1.0)
+
+
+def simulate(motor, drag, mass, diameter, motor_mass: float = None, propellant_mass: float = None,
+             drag_power_off=None, launch_angle=0.0, rail_length=5.0, cd_scale=1.0, drogue_area_cd=np.nan,
+             main_area_cd=np.nan, main_altitude=np.nan, launch_altitude: float = 0.0, atmosphere=None,
+             rtol: float = 1e-6, atol: float = 1e-4, max_step: float = 0.5, max_time: float = 600.0,
+             stop_at_apogee: bool = False, output: str = "handlers") -> list:
+    """
+    simulate  Integrates the point-mass trajectories of many rockets at once, in the vertical plane of the launch rail.
+
+    The designs share a motor and drag curve and differ in the per-design inputs, each a scalar or an array broadcast
+    against the others. Their states are integrated together as one array with the adaptive Dormand-Prince 5(4)
+    method, each design with its own time step. Thrust acts along the rail, then along the flight path (gravity turn).
+    At apogee the drogue deploys, and the main below main_altitude; without a drogue, the main deploys at apogee.
+
+    :param motor:  Motor, motor file (ThrustCurve CSV or RASP .eng), or the (curve, motor data) output of
+        read_thrust_curve
+    :type motor: Motor, str or tuple
+    :param drag:  Mach-CD curve file (see read_drag_curve), an AeroTable, or a (mach, cd) pair, used while powered
+        and, without drag_power_off, throughout
+    :type drag: str, AeroTable or tuple
+    :param mass:  Rocket mass without the motor in kg
+    :type mass: float or np.ndarray
+    :param diameter:  Reference diameter in m
+    :type diameter: float or np.ndarray
+    :param motor_mass:  Loaded motor mass in kg, defaults to None to take it from the motor
+    :type motor_mass: float, optional
+    :param propellant_mass:  Propellant mass in kg, defaults to None to take it from the motor
+    :type propellant_mass: float, optional
+    :param drag_power_off:  Mach-CD curve after burnout, as drag, defaults to None
+    :type drag_power_off: str, AeroTable or tuple, optional
+    :param launch_angle:  Rail angle from vertical in degrees, defaults to 0.0
+    :type launch_angle: float or np.ndarray, optional
+    :param rail_length:  Rail length in m, defaults to 5.0
+    :type rail_length: float or np.ndarray, optional
+    :param cd_scale:  Factor on the drag coefficient, defaults to 1.0
+    :type cd_scale: float or np.ndarray, optional
+    :param drogue_area_cd:  Drogue area times drag coefficient in m^2, defaults to NaN for no drogue
+    :type drogue_area_cd: float or np.ndarray, optional
+    :param main_area_cd:  Main parachute area times drag coefficient in m^2, defaults to NaN for no main
+    :type main_area_cd: float or np.ndarray, optional
+    :param main_altitude:  Main deployment altitude above the launch site in m, defaults to NaN
+    :type main_altitude: float or np.ndarray, optional
+    :param launch_altitude:  Altitude of the launch site in m, defaults to 0.0
+    :type launch_altitude: float, optional
+    :param atmosphere:  Atmosphere, defaults to None for the standard atmosphere
+    :type atmosphere: Atmosphere, optional
+    :param rtol:  Relative tolerance of the step control, defaults to 1e-6
+    :type rtol: float, optional
+    :param atol:  Absolute tolerance of the step control, in m and m/s, defaults to 1e-4
+    :type atol: float, optional
+    :param max_step:  Largest time step in s, which also bounds the spacing of the output samples, defaults to 0.5
+    :type max_step: float, optional
+    :param max_time:  Time at which to stop in s, defaults to 600.0
+    :type max_time: float, optional
+    :param stop_at_apogee:  Stops each design at apogee, defaults to False
+    :type stop_at_apogee: bool, optional
+    :param output:  "handlers" for one DataHandler per design, or "frames" for (data, events) DataFrame pairs as
+        returned by read_or_export, which skips building the handlers in large sweeps. Defaults to "handlers"
+    :type output: str, optional
+    :return:  One DataHandler per design, with merged_df in the OpenRocket export schema (every raw header, OR units,
+        NaN for the quantities a point mass has no model of, plus a FLIGHT_PATH_ANGLE column) and the LAUNCH, LIFTOFF,
+        LAUNCHROD, BURNOUT, APOGEE, RECOVERY_DEVICE_DEPLOYMENT and GROUND_HIT events, or one (data, events) pair per
+        design
+    :rtype: list
+    """
+    if output not in ("handlers", "frames"):
+        raise ValueError(f"Unknown output {output!r}, expected 'handlers' or 'frames'")
+    values = (mass, diameter, launch_angle, rail_length, cd_scale, drogue_area_cd, main_area_cd, main_altitude)
+    designs = {name: np.atleast_1d(value).astype(np.float64)
+               for name, value in zip(_DESIGN_INPUTS, np.broadcast_arrays(*values))}
+    count = designs["mass"].size
+    forces = _Forces(_load_motor(motor, motor_mass, propellant_mass), _load_drag(drag), _load_drag(drag_power_off),
+                     designs, standard_atmosphere() if atmosphere is None else atmosphere, launch_altitude)
+    burn_time = forces.motor.burn_time
+    has_drogue = np.isfinite(designs["drogue_area_cd"])
+    has_main = np.isfinite(designs["main_area_cd"])
+
+    t = np.zeros(count)
+    y = np.zeros((count, 4))
+    mode = np.full(count, ON_RAIL)
+    h = np.full(count, min(1e-3, max_step))
+    active = np.ones(count, dtype=bool)
+    lifted = np.zeros(count, dtype=bool)
+    past_apogee = np.zeros(count, dtype=bool)
+    stalled = np.zeros(count, dtype=np.int64)
+
+    records = [(np.arange(count), t.copy(), y.copy(), mode.copy())]
+    events = [(design, 0.0, name) for design in range(count) for name in ("LAUNCH", "IGNITION")]
+
+    def event(rows, times, name):
+        events.extend((int(row), float(time), name) for row, time in zip(rows, times))
+
+    while active.any():
+        rows = np.flatnonzero(active)
+        passed = rows
+        t0, y0, mode0 = t[rows], y[rows], mode[rows]
+        step = np.minimum(np.minimum(h[rows], max_step), max_time - t0)
+        # Never step across burnout, where the thrust and the drag curve change
+        before_burnout = burn_time - t0 > 1e-9
+        step = np.where(before_burnout, np.minimum(step, burn_time - t0), step)
+
+        y1, error = _step(forces, t0, y0, step, mode0, rows)
+        scale = atol + rtol * np.maximum(np.abs(y0), np.abs(y1))
+        norm = np.max(np.abs(error) / scale, axis=1)
+        with np.errstate(divide="ignore"):
+            h[rows] = step * np.clip(0.9 * norm ** -0.2, 0.2, 5.0)
+        accepted = norm <= 1.0
+        rows, t0, y0, mode0, step, y1 = (array[accepted] for array in (rows, t0, y0, mode0, step, y1))
+
+        # Fraction of the step at which each mode-changing event is crossed: rail exit, apogee, main deployment and
+        # ground hit. A step crossing one is cut back to the first, so every event has a sample of its own.
+        on_rail = mode0 == ON_RAIL
+        rail = designs["rail_length"][rows]
+        altitude = designs["main_altitude"][rows]
+        crossings = (
+            (on_rail, np.hypot(y0[:, 0], y0[:, 1]) - rail, lambda y: np.hypot(y[:, 0], y[:, 1]) - rail),
+            ((mode0 == ASCENT) & ~past_apogee[rows] & (y0[:, 3] > 0), y0[:, 3], lambda y: y[:, 3]),
+            ((mode0 == DROGUE) & has_main[rows], y0[:, 1] - altitude, lambda y: y[:, 1] - altitude),
+            (~on_rail, y0[:, 1], lambda y: y[:, 1]),
+        )
+        fractions = np.full((rows.size, len(crossings)), np.inf)
+        for column, (armed, before, after) in enumerate(crossings):
+            crossed = armed & (np.sign(after(y1)) != np.sign(before)) & (before != 0)
+            fractions[crossed, column] = _crossing(before, after(y1))[crossed]
+        first = fractions.min(axis=1)
+        cut = first < 1
+        if cut.any():
+            step[cut] *= first[cut]
+            # A crossing within MIN_EVENT_STEP of the start (or a fraction that underflowed) is reached at t0
+            at_start = cut & (step < MIN_EVENT_STEP)
+            step[at_start] = 0.0
+            y1[at_start] = y0[at_start]
+            resume = cut & ~at_start
+            if resume.any():
+                y1[resume] = _step(forces, t0[resume], y0[resume], step[resume], mode0[resume], rows[resume])[0]
+        cleared, apogee, deploy, ground = ((fractions <= first[:, None]) & np.isfinite(fractions)).T
+        t1 = t0 + step
+        mode1 = mode0.copy()
+        done = np.zeros(rows.size, dtype=bool)
+
+        speed0, speed1 = np.hypot(y0[:, 2], y0[:, 3]), np.hypot(y1[:, 2], y1[:, 3])
+        new = (speed0 == 0) & (speed1 > 0) & ~lifted[rows]
+        event(rows[new], t0[new], "LIFTOFF")
+        lifted[rows[new]] = True
+
+        event(rows[cleared], t1[cleared], "LAUNCHROD")
+        mode1[cleared] = ASCENT
+
+        burnout = (t0 < burn_time) & (t1 >= burn_time)
+        event(rows[burnout], np.full(burnout.sum(), burn_time), "BURNOUT")
+
+        event(rows[apogee], t1[apogee], "APOGEE")
+        y1[apogee, 3] = 0.0
+        past_apogee[rows[apogee]] = True
+        drogue = apogee & has_drogue[rows]
+        main = apogee & ~has_drogue[rows] & has_main[rows]
+        event(rows[drogue | main], t1[drogue | main], "RECOVERY_DEVICE_DEPLOYMENT")
+        mode1[drogue] = DROGUE
+        mode1[main] = MAIN
+        if stop_at_apogee:
+            event(rows[apogee], t1[apogee], "SIMULATION_END")
+            done |= apogee
+
+        # The main also deploys at apogee when that is already below its deployment altitude
+        deploy |= drogue & has_main[rows] & (y1[:, 1] <= altitude)
+        event(rows[deploy], t1[deploy], "RECOVERY_DEVICE_DEPLOYMENT")
+        mode1[deploy] = MAIN
+
+        ground &= ~done
+        y1[ground, 1] = 0.0
+        for name in ("GROUND_HIT", "SIMULATION_END"):
+            event(rows[ground], t1[ground], name)
+        mode1[ground] = LANDED
+        done |= ground
+
+        # A rocket whose thrust never lifts it off the pad, or which runs out of time
+        stuck = on_rail & (t1 >= burn_time) & (speed1 == 0)
+        timeout = (t1 >= max_time) & ~done
+        event(rows[(stuck | timeout) & ~done], t1[(stuck | timeout) & ~done], "SIMULATION_END")
+        done |= stuck | timeout
+
+        advanced = t1 > t0
+        t[rows], y[rows], mode[rows] = t1, y1, mode1
+        active[rows[done]] = False
+        records.append((rows, t1, y1, mode1))
+
+        # A design whose time stops advancing (every step rejected or cut to nothing) is ended rather than looping
+        stalled[passed] += 1
+        stalled[rows[advanced]] = 0
+        stuck = passed[active[passed] & (stalled[passed] >= MAX_STALLED_PASSES)]
+        event(stuck, t[stuck], "SIMULATION_END")
+        active[stuck] = False
+
+    frames = _frames(forces, records, events, count)
+    if output == "frames":
+        return list(frames)
+    return [DataHandler.from_dataframe(data, events_df) for data, events_df in frames]
+
+
+def _frames(forces: _Forces, records: list, events: list, count: int):
+    """
+    _frames  Builds each design's data and events frames in the OpenRocket export schema from the accepted steps.
+    """
+    rows = np.concatenate([record[0] for record in records])
+    order = np.argsort(rows, kind="stable")
+    rows = rows[order]
+    t = np.concatenate([record[1] for record in records])[order]
+    y = np.concatenate([record[2] for record in records])[order]
+    mode = np.concatenate([record[3] for record in records])[order]
+
+    derivative, details = forces(t, y, mode, rows, details=True)
+    x, z, vx, vz = y.T
+    ax, az = derivative[:, 2], derivative[:, 3]
+    speed = np.hypot(vx, vz)
+    motor_mass = forces.motor.mass(t)
+    computed = {
+        "Time (s)": t,
+        "Altitude (ft)": convert(z, "m", "ft"),
+        "Vertical velocity (m/s)": vz,
+        "Vertical acceleration (m/s²)": az,
+        "Total velocity (m/s)": speed,
+        "Total acceleration (m/s²)": np.hypot(ax, az),
+        "Lateral distance (ft)": convert(x, "m", "ft"),
+        "Lateral velocity (m/s)": vx,
+        "Lateral acceleration (m/s²)": ax,
+        "Gravitational acceleration (m/s²)": details["gravity"],
+        "Mass (g)": convert(details["mass"], "kg", "g"),
+        "Motor mass (g)": convert(motor_mass, "kg", "g"),
+        "Mach number ()": details["mach"],
+        "Thrust (N)": details["thrust"],
+        "Drag force (N)": details["drag"],
+        "Drag coefficient ()": details["drag_coefficient"],
+        "Reference length (mm)": convert(forces.designs["diameter"][rows], "m", "mm"),
+        "Reference area (cm²)": convert(forces.area[rows], "m²", "cm²"),
+        # The atmosphere is still air
+        "Wind velocity (m/s)": np.zeros_like(t),
+        "Air temperature (°C)": convert(details["temperature"], "K", "°C"),
+        "Air pressure (mbar)": convert(details["pressure"], "Pa", "mbar"),
+        "Speed of sound (m/s)": details["speed_of_sound"],
+    }
+    # Every OR export column, NaN for what a point mass has no model of (attitude, rates, moments of inertia, CP/CG,
+    # aerodynamic breakdown, position on the globe). The time step is filled in per design below
+    missing = np.full_like(t, np.nan)
+    columns = {name: computed.get(name, missing) for name in OR_COLUMN_NAMES if name != "Event"}
+    # Not OpenRocket's zenith orientation, which is the attitude of the rocket's axis: the direction of the velocity,
+    # in degrees above the horizontal
+    columns[FLIGHT_PATH_ANGLE] = np.where(speed > 0, np.degrees(np.arctan2(vz, vx)),
+                                          90 - forces.designs["launch_angle"][rows])
+    starts = np.searchsorted(rows, np.arange(count + 1))
+    events = pd.DataFrame(events, columns=["design", "Time (s)", "Event"])
+    for design in range(count):
+        part = slice(starts[design], starts[design + 1])
+        data = pd.DataFrame({name: values[part] for name, values in columns.items()})
+        data["Simulation time step (s)"] = np.diff(data["Time (s)"].to_numpy(), prepend=0.0)
+        design_events = events[events["design"] == design].sort_values("Time (s)", kind="stable")
+        yield data, design_events[["Time (s)", "Event"]].reset_index(drop=True)
+
+
+def trajectory_summary(handlers: list) -> pd.DataFrame:
+    """
+    trajectory_summary  Tabulates the key results of simulated (or loaded) OR-format flights, one row per flight.
+
+    :param handlers:  DataHandlers, e.g. from simulate
+    :type handlers: list
+    :return:  apogee (m), apogee_time (s), max_velocity (m/s), max_mach, rail_exit_velocity (m/s), burnout_time (s),
+        flight_time (s) and landing_velocity (m/s)
+    :rtype: pd.DataFrame
+    """
+    rows = []
+    for dh in handlers:
+        apogee = dh.find_event_value("APOGEE", "Altitude (ft)")
+        landing = dh.find_event_value("GROUND_HIT", "Total velocity (m/s)")
+        rows.append({
+            "apogee": convert(apogee, "ft", "m") if apogee is not None else np.nan,
+            "apogee_time": dh.find_event_time("APOGEE"),
+            "max_velocity": dh.get_column("Total velocity (m/s)").max(),
+            "max_mach": dh.get_column("Mach number ()").max(),
+            "rail_exit_velocity": dh.find_event_value("LAUNCHROD", "Total velocity (m/s)"),
+            "burnout_time": dh.find_event_time("BURNOUT"),
+            "flight_time": dh.get_column("Time (s)").iloc[-1],
+            "landing_velocity": landing,
+        })
+    return pd.DataFrame(rows, dtype="float64")
@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+
+
+# Each unit maps to (factor, offset) taking a value to its SI base unit: si = value * factor + offset
+UNITS = {
+    # Length
+    "m": (1.0, 0.0),
+    "cm": (1e-2, 0.0),
+    "mm": (1e-3, 0.0),
+    "in": (0.0254, 0.0),
+    "ft": (0.3048, 0.0),
+    # Area
+    "m²": (1.0, 0.0),
+    "cm²": (1e-4, 0.0),
+    "mm²": (1e-6, 0.0),
+    "in²": (0.0254 ** 2, 0.0),
+    # Mass
+    "kg": (1.0, 0.0),
+    "g": (1e-3, 0.0),
+    "lb": (0.45359237, 0.0),
+    # Force
+    "N": (1.0, 0.0),
+    "lbf": (4.4482216152605, 0.0),
+    # Pressure
+    "Pa": (1.0, 0.0),
+    "kPa": (1e3, 0.0),
+    "mbar": (1e2, 0.0),
+    "psi": (6894.757293168361, 0.0),
+    # Time
+    "s": (1.0, 0.0),
+    "ms": (1e-3, 0.0),
+    # Velocity and acceleration
+    "m/s": (1.0, 0.0),
+    "ft/s": (0.3048, 0.0),
+    "m/s²": (1.0, 0.0),
+    "ft/s²": (0.3048, 0.0),
+    # Temperature
+    "K": (1.0, 0.0),
+    "°C": (1.0, 273.15),
+    "°F": (5 / 9, 459.67 * 5 / 9),
+    "°R": (5 / 9, 0.0),
+}
+
+# SI unit each non-SI unit converts to
+UNITS_SI = {
+    "cm": "m", "mm": "m", "in": "m", "ft": "m",
+    "cm²": "m²", "mm²": "m²", "in²": "m²",
+    "g": "kg", "lb": "kg",
+    "lbf": "N",
+    "ms": "s",
+    "kPa": "Pa", "mbar": "Pa", "psi": "Pa",
+    "ft/s": "m/s", "ft/s²": "m/s²",
+    "°C": "K", "°F": "K", "°R": "K",
+}
+
+# Units of the OpenRocket export columns that are not already SI, keyed by the snake_case names of OR_COLUMN_NAMES
+OR_UNITS = {
+    "altitude": "ft",
+    "position_east_of_launch": "ft",
+    "position_north_of_launch": "ft",
+    "lateral_distance": "ft",
+    "mass": "g",
+    "motor_mass": "g",
+    "cp_location": "mm",
+    "cg_location": "mm",
+    "reference_length": "mm",
+    "reference_area": "cm²",
+    "air_temperature": "°C",
+    "air_pressure": "mbar",
+}
+
+# RASAero flight export conversions: imperial column -> (unit, target column, target unit). Masses and
+# lengths target the units OpenRocket exports (g, mm) so the two tools can be compared directly.
+RAS_SI_CONVERSIONS = {
+    "weight_imperial": ("lb", "weight", "g"),
+    "thrust_imperial": ("lbf", "thrust", "N"),
+    "drag_force_imperial": ("lbf", "drag_force", "N"),
+    "lift_force_imperial": ("lbf", "lift_force", "N"),
+    "cg_location_imperial": ("in", "cg_location", "mm"),
+    "cp_location_imperial": ("in", "cp_location", "mm"),
+    "total_acceleration_imperial": ("ft/s²", "total_acceleration", "m/s²"),
+    "vertical_acceleration_imperial": ("ft/s²", "vertical_acceleration", "m/s²"),
+    "horizontal_acceleration_imperial": ("ft/s²", "horizontal_acceleration", "m/s²"),
+    "total_velocity_imperial": ("ft/s", "total_velocity", "m/s"),
+    "vertical_velocity_imperial": ("ft/s", "vertical_velocity", "m/s"),
+    "horizontal_velocity_imperial": ("ft/s", "horizontal_velocity", "m/s"),
+}
+
+
+def conversion(from_unit: str, to_unit: str) -> tuple:
+    """
+    conversion  Returns the factor and offset converting values from one unit to another: to = from * factor + offset.
+
+    :param from_unit:  Unit of the values
+    :type from_unit: str
+    :param to_unit:  Unit to convert to
+    :type to_unit: str
+    :return:  Factor and offset
+    :rtype: tuple
+    """
+    try:
+        from_factor, from_offset = UNITS[from_unit]
+        to_factor, to_offset = UNITS[to_unit]
+    except KeyError as e:
+        raise KeyError(f"Unknown unit {e.args[0]!r}") from None
+    return from_factor / to_factor, (from_offset - to_offset) / to_factor
+
+
+def convert(values, from_unit: str, to_unit: str):
+    """
+    convert  Converts a value or array of values from one unit to another.
+
+    :param values:  Value or array of values
+    :type values: float or np.ndarray
+    :param from_unit:  Unit of the values
+    :type from_unit: str
+    :param to_unit:  Unit to convert to
+    :type to_unit: str
+    :return:  Converted values
+    :rtype: float or np.ndarray
+    """
+    factor, offset = conversion(from_unit, to_unit)
+    return values * factor + offset if offset else values * factor
+
+
+def convert_columns(df: pd.DataFrame, conversions: dict, inplace: bool = False) -> pd.DataFrame:
+    """
+    convert_columns  Converts several DataFrame columns in one vectorized pass over a 2-D block of their values.
+
+    :param df:  DataFrame holding the columns
+    :type df: pd.DataFrame
+    :param conversions:  Column -> (from unit, to unit) to convert in place, or (from unit, target column, to unit)
+        to write the converted values to another column
+    :type conversions: dict
+    :param inplace:  Modifies df rather than a copy, defaults to False
+    :type inplace: bool, optional
+    :return:  DataFrame with the converted columns
+    :rtype: pd.DataFrame
+    """
+    out = df if inplace else df.copy()
+    if not conversions:
+        return out
+
+    sources = list(conversions)
+    targets = []
+    factors = np.empty(len(sources))
+    offsets = np.empty(len(sources))
+    for i, source in enumerate(sources):
+        spec = conversions[source]
+        from_unit, target, to_unit = spec if len(spec) == 3 else (spec[0], source, spec[1])
+        factors[i], offsets[i] = conversion(from_unit, to_unit)
+        targets.append(target)
+
+    values = df[sources].to_numpy(dtype=np.float64, copy=True)
+    values *= factors
+    if offsets.any():
+        values += offsets
+    out[targets] = values
+    return out